@@ -0,0 +1,304 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from artemisbot.utils.metrics import REGISTRY
+from config import (
+    ARTEMIS_API_KEY,
+    BROWSER_POOL_SIZE,
+    BROWSER_MAX_RENDERS,
+    BROWSER_ACQUIRE_TIMEOUT,
+    CHART_WINDOW_SIZE,
+    SELENIUM_TIMEOUT,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolTimeout(Exception):
+    """Raised when no browser session becomes available in time."""
+
+
+def build_chrome_options() -> Options:
+    """Build the headless Chrome options used for chart rendering."""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"--window-size={CHART_WINDOW_SIZE[0]},{CHART_WINDOW_SIZE[1]}")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_argument("--silent")
+    chrome_options.add_argument("--force-device-scale-factor=1")
+    # Add performance optimizations
+    chrome_options.add_argument("--disable-javascript-harmony")
+    chrome_options.add_argument("--disable-features=TranslateUI")
+    chrome_options.add_argument("--disable-features=BlinkGenPropertyTrees")
+    chrome_options.add_argument("--disable-features=IsolateOrigins")
+    chrome_options.add_argument("--disable-site-isolation-trials")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--disable-features=NetworkService")
+    for i in ["", *range(2, 21)]:
+        chrome_options.add_argument(f"--disable-features=NetworkServiceInProcess{i}")
+    return chrome_options
+
+
+def launch_driver() -> webdriver.Chrome:
+    """Launch a new headless Chrome session ready to render charts."""
+    service = Service()
+    driver = webdriver.Chrome(service=service, options=build_chrome_options())
+    driver.set_window_size(*CHART_WINDOW_SIZE)
+    driver.set_page_load_timeout(SELENIUM_TIMEOUT)
+
+    if ARTEMIS_API_KEY:
+        driver.execute_cdp_cmd('Network.setCookie', {
+            'name': 'artemis_api_key',
+            'value': ARTEMIS_API_KEY,
+            'domain': '.artemis.xyz',
+            'path': '/'
+        })
+    return driver
+
+
+class BrowserSession:
+    """A pooled browser session and its usage counters."""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.renders = 0
+        self.created_at = time.monotonic()
+        self.checked_out_at = 0.0
+
+    def is_healthy(self) -> bool:
+        """Check that the underlying browser still answers commands."""
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def quit(self) -> None:
+        """Shut down the underlying browser, ignoring errors."""
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting browser session: {str(e)}")
+
+
+class BrowserPool:
+    """
+    A fixed-size pool of pre-launched headless Chrome sessions.
+
+    Sessions are health-checked on checkout and recycled after a configurable
+    number of renders, so long-running processes do not accumulate leaked
+    browser memory.
+    """
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, max_renders: int = BROWSER_MAX_RENDERS,
+                 acquire_timeout: float = BROWSER_ACQUIRE_TIMEOUT,
+                 driver_factory: Callable[[], webdriver.Chrome] = launch_driver):
+        """
+        Initialize the BrowserPool.
+
+        Args:
+            size: Maximum number of live browser sessions
+            max_renders: Number of renders after which a session is recycled
+            acquire_timeout: Seconds to wait for a free session before giving up
+            driver_factory: Callable that launches a new driver
+        """
+        self.size = max(1, size)
+        self.max_renders = max_renders
+        self.acquire_timeout = acquire_timeout
+        self._driver_factory = driver_factory
+        self._idle: Deque[BrowserSession] = deque()
+        self._live = 0
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._started_at = time.monotonic()
+
+        # Usage counters
+        self._acquires = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._busy_total = 0.0
+        self._launched = 0
+        self._recycled = 0
+        self._discarded = 0
+        self._timeouts = 0
+
+    def _launch(self) -> BrowserSession:
+        """Launch a session for a slot that has already been reserved."""
+        try:
+            session = BrowserSession(self._driver_factory())
+        except Exception:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._launched += 1
+        return session
+
+    def start(self) -> None:
+        """Pre-launch browser sessions until the pool is full."""
+        while True:
+            with self._cond:
+                if self._closed or self._live >= self.size:
+                    return
+                self._live += 1
+            try:
+                session = self._launch()
+            except Exception as e:
+                logger.error(f"Error pre-launching browser session: {str(e)}")
+                return
+            with self._cond:
+                self._idle.append(session)
+                self._cond.notify()
+
+    def acquire(self, timeout: Optional[float] = None) -> BrowserSession:
+        """
+        Check out a healthy browser session, launching one if the pool has room.
+
+        Args:
+            timeout: Seconds to wait for a session (defaults to acquire_timeout)
+
+        Returns:
+            A BrowserSession that must be handed back with release()
+
+        Raises:
+            BrowserPoolTimeout: If no session became available in time
+            WebDriverException: If a new session had to be launched and Chrome failed to start
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            session = None
+            with self._cond:
+                while not self._idle and self._live >= self.size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise BrowserPoolTimeout(f"No browser session available after {timeout}s")
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise BrowserPoolTimeout("Browser pool is closed")
+                if self._idle:
+                    session = self._idle.popleft()
+                else:
+                    self._live += 1
+
+            if session is None:
+                session = self._launch()
+            elif not session.is_healthy():
+                logger.warning("Discarding unhealthy browser session")
+                self._discard(session)
+                continue
+
+            waited = time.monotonic() - started
+            with self._cond:
+                self._in_use += 1
+                self._acquires += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+                in_use = self._in_use
+            logger.info(f"Checked out browser session after {waited:.3f}s wait ({in_use}/{self.size} in use)")
+            session.checked_out_at = time.monotonic()
+            return session
+
+    def release(self, session: BrowserSession, healthy: bool = True) -> None:
+        """
+        Return a session to the pool.
+
+        Args:
+            session: The session obtained from acquire()
+            healthy: False if the session hit a browser-level error and must be replaced
+        """
+        session.renders += 1
+        busy = time.monotonic() - session.checked_out_at
+        with self._cond:
+            self._in_use -= 1
+            self._busy_total += busy
+
+        if not healthy:
+            self._discard(session)
+        elif self.max_renders and session.renders >= self.max_renders:
+            logger.info(f"Recycling browser session after {session.renders} renders")
+            with self._cond:
+                self._recycled += 1
+            self._discard(session, count=False)
+        else:
+            with self._cond:
+                if not self._closed:
+                    self._idle.append(session)
+                    self._cond.notify()
+                    return
+            self._discard(session, count=False)
+            return
+
+        # Keep the pool warm by replacing the session we just dropped
+        if not self._closed:
+            threading.Thread(target=self.start, daemon=True).start()
+
+    def _discard(self, session: BrowserSession, count: bool = True) -> None:
+        """Quit a session and free its slot."""
+        session.quit()
+        with self._cond:
+            self._live -= 1
+            if count:
+                self._discarded += 1
+            self._cond.notify()
+
+    def stats(self) -> Dict[str, float]:
+        """Return pool wait-time and utilization statistics."""
+        with self._cond:
+            uptime = max(time.monotonic() - self._started_at, 1e-9)
+            return {
+                "size": self.size,
+                "live": self._live,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "utilization": self._in_use / self.size,
+                "busy_ratio": self._busy_total / (uptime * self.size),
+                "acquires": self._acquires,
+                "wait_avg_seconds": self._wait_total / self._acquires if self._acquires else 0.0,
+                "wait_max_seconds": self._wait_max,
+                "timeouts": self._timeouts,
+                "launched": self._launched,
+                "recycled": self._recycled,
+                "discarded": self._discarded,
+            }
+
+    def close(self) -> None:
+        """Quit all idle sessions and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            sessions = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for session in sessions:
+            self._discard(session, count=False)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            REGISTRY.register_collector("browser_pool", _pool.stats)
+        return _pool
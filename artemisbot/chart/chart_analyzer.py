@@ -1,10 +1,12 @@
 import os
 import sys
+import asyncio
 import openai
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 from datetime import datetime
 import base64
+import hashlib
 
 # Add project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
@@ -12,6 +14,9 @@ sys.path.insert(0, project_root)
 
 from artemisbot.chart.url_builder import build_chart_url
 from artemisbot.chart.screenshot import take_screenshot
+from artemisbot.utils.cache import LRUCache
+from artemisbot.utils.metrics import REGISTRY, track_stage
+from config import CHART_ANALYSIS_TIMEOUT, ANALYSIS_CACHE_TTL, ANALYSIS_CACHE_MAX_ENTRIES
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -20,6 +25,70 @@ logger = logging.getLogger(__name__)
 # Initialize OpenAI client
 client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
 
+# Shared async client for chart analysis, created on first use
+_async_client: Optional[openai.AsyncOpenAI] = None
+
+CHART_ANALYSIS_MODEL = "gpt-4o"
+CHART_ANALYSIS_PROMPT = "Analyze this chart and provide a concise summary and macro impact analysis. Keep the response under 800 characters."
+# Bump whenever the prompt or model changes so cached analyses are not reused
+CHART_ANALYSIS_PROMPT_VERSION = "1"
+
+# Text-only prompt for summaries grounded in statistics computed from the chart data
+CHART_GROUNDED_PROMPT = (
+    "Below are statistics computed from the data behind a crypto analytics chart. "
+    "Using only these numbers, write a concise summary and macro impact analysis. "
+    "Keep the response under 800 characters.\n\n{stats}"
+)
+
+# Analyses keyed by image fingerprint and prompt version
+ANALYSIS_CACHE = LRUCache(
+    max_bytes=ANALYSIS_CACHE_MAX_ENTRIES * 4096,
+    ttl=ANALYSIS_CACHE_TTL,
+    max_entries=ANALYSIS_CACHE_MAX_ENTRIES,
+    name="analysis"
+)
+REGISTRY.register_collector("analysis_cache", ANALYSIS_CACHE.stats)
+
+def image_fingerprint(image_bytes: bytes) -> str:
+    """Return a content hash identifying pixel-identical chart images."""
+    return hashlib.sha256(image_bytes).hexdigest()
+
+def _analysis_cache_key(image_bytes: bytes) -> str:
+    return f"{CHART_ANALYSIS_MODEL}:{CHART_ANALYSIS_PROMPT_VERSION}:{image_fingerprint(image_bytes)}"
+
+def _build_messages(base64_image: str) -> List[Dict]:
+    """Build the vision request messages for a base64-encoded PNG chart."""
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": CHART_ANALYSIS_PROMPT},
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:image/png;base64,{base64_image}"
+                    }
+                }
+            ]
+        }
+    ]
+
+def _grounded_cache_key(stats_text: str) -> str:
+    digest = hashlib.sha256(stats_text.encode("utf-8")).hexdigest()
+    return f"{CHART_ANALYSIS_MODEL}:{CHART_ANALYSIS_PROMPT_VERSION}:grounded:{digest}"
+
+def get_async_client() -> openai.AsyncOpenAI:
+    """Return the shared async OpenAI client used for chart analysis."""
+    global _async_client
+    if _async_client is None:
+        # Deadlines are enforced per call, so let the caller decide instead of retrying
+        _async_client = openai.AsyncOpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            timeout=CHART_ANALYSIS_TIMEOUT,
+            max_retries=0
+        )
+    return _async_client
+
 def generate_chart_summary(image_path: str) -> Optional[str]:
     """
     Generate a summary of the chart using OpenAI's API.
@@ -38,26 +107,10 @@ def generate_chart_summary(image_path: str) -> Optional[str]:
         with open(image_path, "rb") as image_file:
             base64_image = base64.b64encode(image_file.read()).decode('utf-8')
         
-        # Create a prompt for the chart analysis
-        prompt = "Analyze this chart and provide a concise summary and macro impact analysis. Keep the response under 800 characters."
-        
         # Call OpenAI API with the image
         response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
-                            }
-                        }
-                    ]
-                }
-            ],
+            model=CHART_ANALYSIS_MODEL,
+            messages=_build_messages(base64_image),
             max_tokens=400
         )
         
@@ -78,34 +131,107 @@ def generate_chart_summary_from_bytes(image_bytes: bytes) -> Optional[str]:
     Returns:
         A summary of the chart or None if generation fails
     """
+    cache_key = _analysis_cache_key(image_bytes)
+    cached = ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached chart summary")
+        return cached
+    
     try:
         today = datetime.now().strftime("%B %d, %Y")
         base64_image = base64.b64encode(image_bytes).decode('utf-8')
-        prompt = "Analyze this chart and provide a concise summary and macro impact analysis. Keep the response under 800 characters."
         
         response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
-                            }
-                        }
-                    ]
-                }
-            ],
+            model=CHART_ANALYSIS_MODEL,
+            messages=_build_messages(base64_image),
             max_tokens=400
         )
         
         summary = response.choices[0].message.content
         logger.info("Successfully generated chart summary")
+        if summary:
+            ANALYSIS_CACHE.set(cache_key, summary)
         return summary
         
     except Exception as e:
         logger.error(f"Error generating chart summary from bytes: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
+
+async def generate_chart_summary_async(image_bytes: bytes, timeout: float = CHART_ANALYSIS_TIMEOUT) -> Optional[str]:
+    """
+    Generate a summary of the chart with the shared async OpenAI client.
+    Args:
+        image_bytes: PNG image bytes
+        timeout: Seconds to wait for the summary before giving up
+    Returns:
+        A summary of the chart or None if generation fails or misses the deadline
+    """
+    cache_key = _analysis_cache_key(image_bytes)
+    cached = ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached chart summary")
+        return cached
+    
+    try:
+        base64_image = base64.b64encode(image_bytes).decode('utf-8')
+        with track_stage("llm_analysis"):
+            response = await asyncio.wait_for(
+                get_async_client().chat.completions.create(
+                    model=CHART_ANALYSIS_MODEL,
+                    messages=_build_messages(base64_image),
+                    max_tokens=400
+                ),
+                timeout=timeout
+            )
+        
+        summary = response.choices[0].message.content
+        logger.info("Successfully generated chart summary")
+        if summary:
+            ANALYSIS_CACHE.set(cache_key, summary)
+        return summary
+        
+    except asyncio.TimeoutError:
+        logger.warning(f"Chart summary missed its {timeout}s deadline")
+        return None
+    except Exception as e:
+        logger.error(f"Error generating chart summary asynchronously: {str(e)}")
+        return None
+
+async def generate_grounded_summary_async(stats_text: str, timeout: float = CHART_ANALYSIS_TIMEOUT) -> Optional[str]:
+    """
+    Generate a chart summary from precomputed statistics instead of the chart image.
+    Args:
+        stats_text: Chart statistics, as formatted by chart_stats.format_stats_prompt
+        timeout: Seconds to wait for the summary before giving up
+    Returns:
+        A summary of the chart or None if generation fails or misses the deadline
+    """
+    cache_key = _grounded_cache_key(stats_text)
+    cached = ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached grounded chart summary")
+        return cached
+    
+    try:
+        with track_stage("llm_grounded_summary"):
+            response = await asyncio.wait_for(
+                get_async_client().chat.completions.create(
+                    model=CHART_ANALYSIS_MODEL,
+                    messages=[{"role": "user", "content": CHART_GROUNDED_PROMPT.format(stats=stats_text)}],
+                    max_tokens=400
+                ),
+                timeout=timeout
+            )
+        
+        summary = response.choices[0].message.content
+        logger.info("Successfully generated grounded chart summary")
+        if summary:
+            ANALYSIS_CACHE.set(cache_key, summary)
+        return summary
+        
+    except asyncio.TimeoutError:
+        logger.warning(f"Grounded chart summary missed its {timeout}s deadline")
+        return None
+    except Exception as e:
+        logger.error(f"Error generating grounded chart summary: {str(e)}")
+        return None
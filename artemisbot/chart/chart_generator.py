@@ -1,83 +1,88 @@
 import os
 import sys
+import asyncio
 import logging
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Add project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
-from artemisbot.chart.url_builder import build_chart_url
-from artemisbot.chart.screenshot import take_screenshot
-from artemisbot.chart.chart_analyzer import generate_chart_summary_from_bytes
-from artemisbot.utils.asset_mappings import get_asset_by_id, get_asset_by_symbol
+from artemisbot.chart import native_renderer
+from artemisbot.chart.chart_stats import (
+    ChartStats,
+    compute_chart_stats,
+    fetch_chart_series,
+    format_stats_prompt,
+    format_template_summary,
+)
+from artemisbot.chart.chart_spec import ChartSpec
+from artemisbot.chart.url_builder import METRIC_DISPLAY, TIME_PERIOD_DISPLAY, GRANULARITY_DISPLAY, series_label
+from artemisbot.chart.screenshot import take_screenshot, SCREENSHOT_CACHE, DISK_CACHE
+from artemisbot.data.client import get_series_source
+from artemisbot.chart.chart_analyzer import (
+    generate_chart_summary_from_bytes,
+    generate_chart_summary_async,
+    generate_grounded_summary_async,
+    image_fingerprint,
+)
+from artemisbot.utils.metrics import CHART_ERRORS, track_stage
+from artemisbot.utils.singleflight import SingleFlight
+from artemisbot.workers.client import get_render_queue_client
+from config import (
+    CHART_CONCURRENCY,
+    CHART_CACHE_TTL_BY_PERIOD,
+    CHART_ANALYSIS_TIMEOUT,
+    CHART_RENDERER,
+    CHART_NATIVE_FALLBACK,
+    CHART_SUMMARY_MODE,
+    RENDER_BACKEND,
+)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ChartRenderError(ValueError):
+    """Raised when the browser renderer fails for reasons unrelated to the chart request itself."""
+
+
 class ChartGenerator:
     """A class to handle chart generation and analysis."""
     
-    def __init__(self):
-        """Initialize the ChartGenerator."""
-        self.metric_display = {
-            "price": "Price",
-            "volume": "Volume",
-            "tvl": "TVL",
-            "fees": "Fees",
-            "revenue": "Revenue",
-            "mc": "Market Cap",
-            "txns": "Transactions",
-            "daa": "Daily Active Addresses",
-            "dau": "Daily Active Users",
-            "fdmc": "Fully Diluted Market Cap"
-        }
-        
-        self.time_period_display = {
-            "1w": "1 Week",
-            "mtd": "Month to Date",
-            "1m": "1 Month",
-            "3m": "3 Months",
-            "6m": "6 Months",
-            "ytd": "Year to Date",
-            "1y": "1 Year",
-            "all": "All Time"
-        }
-        
-        self.granularity_display = {
-            "1d": "Daily",
-            "1w": "Weekly",
-            "1m": "Monthly"
-        }
-    
-    def _get_asset_names(self, tickers: List[str]) -> List[str]:
-        """Get display names for assets."""
-        asset_names = []
-        for ticker in tickers:
-            asset_info = get_asset_by_id(ticker) or get_asset_by_symbol(ticker)
-            if not asset_info:
-                raise ValueError(f"Unknown asset: {ticker}")
-            asset_names.append(asset_info.get("name", ticker.capitalize()))
-        return asset_names
+    def __init__(self, max_workers: int = CHART_CONCURRENCY, render_backend: str = RENDER_BACKEND):
+        """
+        Initialize the ChartGenerator.
+        
+        Args:
+            max_workers: Maximum number of charts generated concurrently by generate_chart_async
+            render_backend: "local" to render in this process, "queue" to hand renders to
+                the render worker processes through the job queue
+        """
+        self.render_backend = render_backend
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="chart")
+        self._inflight = SingleFlight(name="chart render")
+        self._analysis_inflight = SingleFlight(name="chart analysis")
+        self.metric_display = METRIC_DISPLAY
+        self.time_period_display = TIME_PERIOD_DISPLAY
+        self.granularity_display = GRANULARITY_DISPLAY
     
-    def _create_title(self, metrics: List[str], asset_names: List[str], 
-                     time_period: str, granularity: str, is_percentage: bool) -> str:
-        """Create a readable title for the chart."""
-        metric_displays = [self.metric_display.get(metric, metric.capitalize()) for metric in metrics]
-        title = f"{' vs '.join(metric_displays)} - {'/'.join(asset_names)} "
-        title += f"({self.time_period_display.get(time_period, time_period)}, "
-        title += f"{self.granularity_display.get(granularity, granularity)})"
-        if is_percentage:
-            title += " (%)"
-        return title
+    def is_chart_cached(self, metrics: List[str], tickers: List[str], time_period: str, 
+                        granularity: str, is_percentage: bool = False) -> bool:
+        """Whether a fresh render of this chart is cached, so generating it needs no browser."""
+        key = ChartSpec.create(metrics, tickers, "", time_period, granularity, is_percentage).cache_key
+        if key in SCREENSHOT_CACHE or "native:" + key in SCREENSHOT_CACHE:
+            return True
+        return DISK_CACHE is not None and DISK_CACHE.contains(key, CHART_CACHE_TTL_BY_PERIOD.get(time_period))
     
-    def generate_chart(self, metrics: List[str], tickers: List[str], 
-                      asset_type: str, time_period: str, granularity: str, 
-                      is_percentage: bool = False) -> Tuple[bytes, str, str]:
+    def render_chart(self, metrics: List[str], tickers: List[str], 
+                     asset_type: str, time_period: str, granularity: str, 
+                     is_percentage: bool = False, refresh: bool = False) -> Tuple[bytes, str, str]:
         """
-        Generate a chart with the given parameters.
+        Render a chart image with the given parameters, without analysing it.
         
         Args:
             metrics: List of metrics to chart
@@ -86,6 +91,7 @@ class ChartGenerator:
             time_period: Time period for the chart
             granularity: Data granularity
             is_percentage: Whether to display as percentages
+            refresh: Render even if the chart is cached, replacing the cached copy
             
         Returns:
             Tuple containing:
@@ -94,38 +100,288 @@ class ChartGenerator:
             - title: The chart title
             
         Raises:
-            ValueError: If any parameters are invalid
+            ValueError: If any parameters are invalid or the chart could not be rendered
         """
         try:
-            # Get asset names and create title
-            asset_names = self._get_asset_names(tickers)
-            title = self._create_title(metrics, asset_names, time_period, granularity, is_percentage)
-            
-            # Build chart URL
-            chart_url = build_chart_url(metrics, tickers, asset_type, time_period, granularity, is_percentage)
+            # Canonical spec of the chart; its URL, title and cache key are memoized
+            spec = ChartSpec.create(metrics, tickers, asset_type, time_period, granularity, is_percentage)
+            asset_names = spec.asset_names
+            title = spec.title
+            chart_url = spec.url
             
-            # Take screenshot
-            screenshot_result = take_screenshot(chart_url)
+            # Take screenshot, reusing a cached render of the same chart if one is fresh
+            with track_stage("browser_render"):
+                screenshot_result = take_screenshot(
+                    chart_url,
+                    cache_key=spec.cache_key,
+                    disk_ttl=CHART_CACHE_TTL_BY_PERIOD.get(spec.time_period),
+                    refresh=refresh
+                )
             
             # Handle error responses
             if isinstance(screenshot_result, str) and screenshot_result.startswith("ERROR:"):
                 error_code = screenshot_result.split(":")[1]
+                CHART_ERRORS.labels(error_code.split(" - ")[0]).inc()
                 if error_code == "AUTH_REQUIRED":
-                    raise ValueError("Authentication required. Please contact your administrator for access.")
+                    raise ChartRenderError("Authentication required. Please contact your administrator for access.")
                 elif error_code == "NO_DATA":
                     raise ValueError(f"No data available for {', '.join(asset_names)}. Try different time periods or metrics.")
                 elif error_code == "INVALID_PARAMETERS":
                     raise ValueError("Invalid chart parameters. Please check your input.")
+                elif error_code.startswith("RENDER_TIMEOUT"):
+                    raise ChartRenderError("The chart took too long to render. Please try again.")
+                elif error_code == "BROWSER_BUSY":
+                    raise ChartRenderError("The chart renderer is busy right now. Please try again in a moment.")
                 else:
-                    raise ValueError(f"Chart generation failed: {error_code}")
+                    raise ChartRenderError(f"Chart generation failed: {error_code}")
             
-            # Generate analysis if screenshot is successful
-            analysis = None
-            if isinstance(screenshot_result, bytes):
-                analysis = generate_chart_summary_from_bytes(screenshot_result)
-            
-            return screenshot_result, chart_url, title, analysis
+            return screenshot_result, chart_url, title
             
         except Exception as e:
             logger.error(f"Error generating chart: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+    
+    def generate_chart(self, metrics: List[str], tickers: List[str], 
+                      asset_type: str, time_period: str, granularity: str, 
+                      is_percentage: bool = False) -> Tuple[bytes, str, str, Optional[str]]:
+        """
+        Generate a chart with the given parameters and analyse it.
+        
+        Args:
+            metrics: List of metrics to chart
+            tickers: List of asset tickers
+            asset_type: Type of asset (e.g., 'chain', 'application')
+            time_period: Time period for the chart
+            granularity: Data granularity
+            is_percentage: Whether to display as percentages
+            
+        Returns:
+            Tuple containing:
+            - chart_image: The chart image as bytes
+            - chart_url: The URL to the interactive chart
+            - title: The chart title
+            - analysis: The chart analysis, or None if it could not be generated
+            
+        Raises:
+            ValueError: If any parameters are invalid
+        """
+        chart_image, chart_url, title = self.render_chart(
+            metrics, tickers, asset_type, time_period, granularity, is_percentage
+        )
+        analysis = generate_chart_summary_from_bytes(chart_image)
+        return chart_image, chart_url, title, analysis
+    
+    async def render_chart_async(self, metrics: List[str], tickers: List[str], 
+                                 asset_type: str, time_period: str, granularity: str, 
+                                 is_percentage: bool = False, renderer: Optional[str] = None,
+                                 refresh: bool = False, priority: int = 1) -> Tuple[bytes, str, str]:
+        """
+        Render a chart on the bounded worker pool without blocking the event loop.
+        
+        Takes the same arguments and returns the same result as render_chart. At most
+        max_workers charts are rendered at once; further requests wait for a free worker.
+        Identical requests that arrive while a chart is being rendered share that render
+        instead of starting their own.
+        
+        Args:
+            renderer: "browser" to capture the Artemis chart builder, "native" to draw the
+                chart in-process from the underlying series (defaults to CHART_RENDERER).
+                When the browser renderer fails and CHART_NATIVE_FALLBACK is set, the
+                native renderer is tried instead.
+            refresh: Render even if the chart is cached, replacing the cached copy. A
+                render of the same chart already in progress is shared as usual.
+            priority: Render job priority with the "queue" backend; lower runs first
+        
+        With the "queue" render backend the chart is rendered by a worker process and
+        this process only waits for the result, which it also keeps in its own screenshot
+        cache so repeated requests (and is_chart_cached) do not depend on the workers.
+        """
+        spec = ChartSpec.create(metrics, tickers, asset_type, time_period, granularity, is_percentage)
+        metrics, tickers, asset_type, time_period, granularity, is_percentage = spec.as_args()
+        if self.render_backend == "queue":
+            return await self._render_queued(spec, renderer, refresh, priority)
+        
+        renderer = renderer or CHART_RENDERER
+        if renderer == "native":
+            return await self.render_chart_native_async(
+                metrics, tickers, asset_type, time_period, granularity, is_percentage, refresh
+            )
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await self._inflight.do(spec.cache_key, lambda: loop.run_in_executor(
+                self._executor,
+                partial(self.render_chart, metrics, tickers, asset_type, time_period, granularity, is_percentage, refresh)
+            ))
+        except ChartRenderError as e:
+            if not (CHART_NATIVE_FALLBACK and native_renderer.is_available()):
+                raise
+            logger.warning(f"Browser render failed, falling back to native renderer: {str(e)}")
+            return await self.render_chart_native_async(
+                metrics, tickers, asset_type, time_period, granularity, is_percentage, refresh
+            )
+    
+    async def _render_queued(self, spec: ChartSpec, renderer: Optional[str], refresh: bool,
+                             priority: int) -> Tuple[bytes, str, str]:
+        """Render a chart on a worker process, reusing this process's cached copy if fresh."""
+        # Same keys as local renders, so is_chart_cached sees charts rendered by the workers
+        cache_key = ("native:" if (renderer or CHART_RENDERER) == "native" else "") + spec.cache_key
+        cached = None if refresh else SCREENSHOT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached, spec.url, spec.title
+        
+        async def render() -> Tuple[bytes, str, str]:
+            result = await get_render_queue_client().render_chart(
+                *spec.as_args(), renderer, refresh, priority
+            )
+            SCREENSHOT_CACHE.set(cache_key, result[0])
+            return result
+        
+        return await self._inflight.do((renderer, spec.cache_key), render)
+    
+    async def render_chart_native_async(self, metrics: List[str], tickers: List[str], 
+                                        asset_type: str, time_period: str, granularity: str, 
+                                        is_percentage: bool = False, refresh: bool = False) -> Tuple[bytes, str, str]:
+        """
+        Draw a chart in-process from the underlying series, without a browser.
+        
+        Takes the same arguments and returns the same result as render_chart; the returned
+        URL still points at the interactive chart builder.
+        """
+        if not native_renderer.is_available():
+            raise ValueError("Native chart rendering is not available on this server.")
+        
+        spec = ChartSpec.create(metrics, tickers, asset_type, time_period, granularity, is_percentage)
+        asset_names = spec.asset_names
+        title = spec.title
+        chart_config = spec.config
+        chart_url = spec.url
+        cache_key = "native:" + spec.cache_key
+        time_period, granularity = spec.time_period, spec.granularity
+        
+        async def render() -> bytes:
+            cached = None if refresh else SCREENSHOT_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            with track_stage("native_fetch"):
+                series_points = await native_renderer.fetch_chart_data(
+                    chart_config, get_series_source(), time_period, granularity
+                )
+            if not any(series_points):
+                CHART_ERRORS.labels("NO_DATA").inc()
+                raise ValueError(f"No data available for {', '.join(asset_names)}. Try different time periods or metrics.")
+            loop = asyncio.get_running_loop()
+            with track_stage("native_draw"):
+                chart_image = await loop.run_in_executor(
+                    self._executor, native_renderer.draw_chart, chart_config, series_points, granularity
+                )
+            SCREENSHOT_CACHE.set(cache_key, chart_image)
+            return chart_image
+        
+        chart_image = await self._inflight.do(cache_key, render)
+        return chart_image, chart_url, title
+    
+    async def analyze_chart_async(self, chart_image: bytes, timeout: float = CHART_ANALYSIS_TIMEOUT) -> Optional[str]:
+        """
+        Analyse a chart image without blocking the event loop.
+        
+        Previously analysed images are answered from the analysis cache without calling
+        the LLM, and concurrent requests for the same image share one analysis call.
+        
+        Args:
+            chart_image: The chart image as bytes
+            timeout: Seconds to wait for the analysis before giving up
+            
+        Returns:
+            The chart analysis, or None if it failed or missed the deadline
+        """
+        key = image_fingerprint(chart_image)
+        return await self._analysis_inflight.do(
+            key, lambda: generate_chart_summary_async(chart_image, timeout=timeout)
+        )
+    
+    async def chart_stats_async(self, metrics: List[str], tickers: List[str], 
+                                asset_type: str, time_period: str, granularity: str, 
+                                is_percentage: bool = False) -> ChartStats:
+        """
+        Compute statistics over the series behind a chart.
+        
+        The series come from the shared series source, so a chart drawn by the native
+        renderer does not fetch its data twice.
+        
+        Returns:
+            Per-series statistics and, for charts with several series, their correlations
+        """
+        spec = ChartSpec.create(metrics, tickers, asset_type, time_period, granularity, is_percentage)
+        chart_config = spec.config
+        series_list = await fetch_chart_series(chart_config, get_series_source(), spec.time_period, spec.granularity)
+        labels = [series_label(item) for item in chart_config["series"]]
+        return compute_chart_stats(spec.title, series_list, labels)
+    
+    async def summarize_chart_async(self, chart_image: bytes, metrics: List[str], tickers: List[str], 
+                                    asset_type: str, time_period: str, granularity: str, 
+                                    is_percentage: bool = False, mode: Optional[str] = None,
+                                    timeout: float = CHART_ANALYSIS_TIMEOUT) -> Optional[str]:
+        """
+        Summarise a chart in the configured summary mode.
+        
+        Args:
+            chart_image: The chart image as bytes
+            mode: "llm" to have the model read the image, "grounded" to have it write from
+                statistics computed over the chart data, or "template" for a summary built
+                from those statistics without a model (defaults to CHART_SUMMARY_MODE).
+                If the statistics cannot be computed, the image is analysed instead.
+            timeout: Seconds to wait for the summary before giving up
+            
+        Returns:
+            The chart summary, or None if it failed or missed the deadline
+        """
+        mode = mode or CHART_SUMMARY_MODE
+        if mode == "llm":
+            return await self.analyze_chart_async(chart_image, timeout)
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            stats = await asyncio.wait_for(
+                self.chart_stats_async(metrics, tickers, asset_type, time_period, granularity, is_percentage),
+                timeout
+            )
+        except Exception as e:
+            logger.warning(f"Could not compute chart statistics, analysing the image instead: {str(e)}")
+            return await self.analyze_chart_async(chart_image, max(0.0, deadline - loop.time()))
+        
+        template_summary = format_template_summary(stats)
+        if mode == "template" or not stats.series:
+            return template_summary
+        
+        stats_text = format_stats_prompt(stats)
+        remaining = max(0.0, deadline - loop.time())
+        summary = await self._analysis_inflight.do(
+            "grounded:" + stats_text, lambda: generate_grounded_summary_async(stats_text, timeout=remaining)
+        )
+        return summary or template_summary
+    
+    async def generate_chart_async(self, metrics: List[str], tickers: List[str], 
+                                   asset_type: str, time_period: str, granularity: str, 
+                                   is_percentage: bool = False) -> Tuple[bytes, str, str, Optional[str]]:
+        """
+        Render and analyse a chart without blocking the event loop.
+        
+        Takes the same arguments and returns the same result as generate_chart.
+        """
+        chart_image, chart_url, title = await self.render_chart_async(
+            metrics, tickers, asset_type, time_period, granularity, is_percentage
+        )
+        analysis = await self.summarize_chart_async(
+            chart_image, metrics, tickers, asset_type, time_period, granularity, is_percentage
+        )
+        return chart_image, chart_url, title, analysis
+    
+    def inflight_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return counters for in-flight render and analysis coalescing."""
+        return {"render": self._inflight.stats(), "analysis": self._analysis_inflight.stats()}
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool, by default waiting for running charts to finish."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from artemisbot.chart.url_builder import build_chart_config, chart_config_url, chart_spec_key, chart_title
+from artemisbot.utils.asset_mappings import get_mappings
+from artemisbot.utils.metrics import REGISTRY, track_stage
+from config import CHART_SPEC_CACHE_SIZE
+
+# Metrics a chart can be requested for
+METRICS = ["price", "volume", "tvl", "fees", "revenue", "mc", "txns", "daa", "dau", "fdmc"]
+
+# Other names users type for those metrics
+METRIC_ALIASES = {
+    "marketcap": "mc",
+    "mcap": "mc",
+    "fdv": "fdmc",
+    "vol": "volume",
+    "fee": "fees",
+    "tx": "txns",
+    "txs": "txns",
+    "transactions": "txns",
+}
+
+
+def canonical_metric(metric: str) -> Optional[str]:
+    """Return the metric a user-typed name stands for, or None if it is not a metric."""
+    metric = metric.lower()
+    metric = METRIC_ALIASES.get(metric, metric)
+    return metric if metric in METRICS else None
+
+
+@dataclass(frozen=True, slots=True)
+class ChartSpec:
+    """
+    Canonical, hashable description of a chart.
+
+    Two requests for the same chart produce equal specs however they were
+    typed: metrics are de-aliased and deduplicated, and assets are resolved
+    to their Artemis IDs. Metrics keep the order they were given in, since
+    the first is drawn as the line and the rest as columns. The URL, title,
+    chart-builder config and cache key derived from a spec are memoized, so
+    repeat requests skip rebuilding them.
+    """
+    metrics: Tuple[str, ...]
+    tickers: Tuple[str, ...]
+    asset_type: str
+    time_period: str
+    granularity: str
+    is_percentage: bool = False
+
+    @classmethod
+    def create(cls, metrics: Iterable[str], tickers: Iterable[str], asset_type: str,
+               time_period: str, granularity: str, is_percentage: bool = False) -> "ChartSpec":
+        """
+        Build the canonical spec for a chart.
+
+        Args:
+            metrics: Metrics to chart, first as the line, possibly aliased ('mcap')
+            tickers: Assets to chart, by Artemis ID or symbol
+            asset_type: The type of asset (e.g., 'chain', 'application')
+            time_period: The time period for the chart
+            granularity: The granularity of the data
+            is_percentage: Whether to display as percentages
+
+        Raises:
+            ValueError: If a metric or asset is unknown
+        """
+        canonical_metrics: List[str] = []
+        for metric in metrics:
+            canonical = canonical_metric(metric)
+            if canonical is None:
+                raise ValueError(f"Invalid metric: {metric}")
+            if canonical not in canonical_metrics:
+                canonical_metrics.append(canonical)
+
+        asset_index = get_mappings().index
+        ids: List[str] = []
+        for ticker in tickers:
+            asset_info = asset_index.by_id(ticker) or asset_index.lookup(ticker)
+            if not asset_info:
+                raise ValueError(f"Unknown asset: {ticker}")
+            if asset_info["id"] not in ids:
+                ids.append(asset_info["id"])
+
+        return cls(
+            metrics=tuple(canonical_metrics),
+            tickers=tuple(ids),
+            asset_type=asset_type.lower(),
+            time_period=time_period.lower(),
+            granularity=granularity.lower(),
+            is_percentage=bool(is_percentage),
+        )
+
+    def as_args(self) -> Tuple[List[str], List[str], str, str, str, bool]:
+        """The spec as the positional arguments ChartGenerator's methods take."""
+        return list(self.metrics), list(self.tickers), self.asset_type, self.time_period, self.granularity, self.is_percentage
+
+    @property
+    def url(self) -> str:
+        """Link to the interactive chart in the Artemis chart builder."""
+        return _chart_url(self, get_mappings().loaded_at)
+
+    @property
+    def config(self) -> Dict:
+        """Chart-builder configuration; shared between callers, so it must not be modified."""
+        return _chart_config(self, get_mappings().loaded_at)
+
+    @property
+    def title(self) -> str:
+        """Readable title of the chart."""
+        return _chart_title(self, get_mappings().loaded_at)
+
+    @property
+    def asset_names(self) -> List[str]:
+        """Display names of the assets, in chart order."""
+        return [ticker.capitalize() for ticker in self.tickers]
+
+    @property
+    def cache_key(self) -> str:
+        """Content address of the rendered chart, equal for equal specs."""
+        return _cache_key(self)
+
+
+# Derived values are cached per mappings version, since a reload can change an asset's type
+
+@lru_cache(maxsize=CHART_SPEC_CACHE_SIZE)
+def _chart_config(spec: ChartSpec, mappings_version: float) -> Dict:
+    return build_chart_config(*spec.as_args())
+
+
+@lru_cache(maxsize=CHART_SPEC_CACHE_SIZE)
+def _chart_url(spec: ChartSpec, mappings_version: float) -> str:
+    with track_stage("url_build"):
+        return chart_config_url(_chart_config(spec, mappings_version))
+
+
+@lru_cache(maxsize=CHART_SPEC_CACHE_SIZE)
+def _chart_title(spec: ChartSpec, mappings_version: float) -> str:
+    return chart_title(list(spec.metrics), spec.asset_names, spec.time_period, spec.granularity, spec.is_percentage)
+
+
+@lru_cache(maxsize=CHART_SPEC_CACHE_SIZE)
+def _cache_key(spec: ChartSpec) -> str:
+    # Metrics stay in chart order: each one's line or column, color and axis follow its position
+    return chart_spec_key(list(spec.metrics), list(spec.tickers), spec.time_period, spec.granularity, spec.is_percentage)
+
+
+def chart_spec_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return hit and miss counters of the memoized URL, config, title and cache key."""
+    return {
+        name: {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+        for name, info in (
+            ("url", _chart_url.cache_info()),
+            ("config", _chart_config.cache_info()),
+            ("title", _chart_title.cache_info()),
+            ("cache_key", _cache_key.cache_info()),
+        )
+    }
+
+
+REGISTRY.register_collector("chart_spec", chart_spec_cache_stats)
@@ -0,0 +1,313 @@
+import asyncio
+import logging
+from datetime import date
+from itertools import combinations
+from typing import Dict, List, NamedTuple, Optional
+import numpy as np
+from artemisbot.data.series import Series
+from artemisbot.data.timeseries import period_window
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Metrics measured in US dollars; the rest are counts
+USD_METRICS = {"PRICE", "VOLUME", "TVL", "FEES", "REVENUE", "MC", "FDMC", "BORROWS", "DEPOSITS"}
+
+# Periods per year for each granularity, used to annualize volatility
+PERIODS_PER_YEAR = {"1d": 365, "1w": 52, "1m": 12}
+
+# Period names used in slopes ("+0.4%/day") and correlations ("daily changes")
+PERIOD_UNITS = {"1d": "day", "1w": "week", "1m": "month"}
+PERIOD_ADJECTIVES = {"1d": "daily", "1w": "weekly", "1m": "monthly"}
+
+# Minimum aligned points before a correlation is reported
+MIN_CORRELATION_POINTS = 5
+
+
+class SeriesStats(NamedTuple):
+    """Summary statistics of one chart series."""
+    label: str
+    metric: str
+    granularity: str
+    points: int
+    start_date: date
+    end_date: date
+    first: float
+    last: float
+    change_pct: Optional[float]  # first to last value
+    low: float
+    low_date: date
+    high: float
+    high_date: date
+    max_drawdown_pct: float  # largest peak-to-trough fall, <= 0
+    drawdown_peak_date: date
+    drawdown_trough_date: date
+    volatility_pct: Optional[float]  # annualized std of period-over-period changes
+    slope_pct: Optional[float]  # least-squares trend per period, as % of the mean value
+
+
+class Correlation(NamedTuple):
+    """Correlation of period-over-period changes between two series."""
+    first: str
+    second: str
+    coefficient: float
+    points: int
+
+
+class ChartStats(NamedTuple):
+    """Statistics for every series of a chart."""
+    title: str
+    series: List[SeriesStats]
+    correlations: List[Correlation]
+
+
+def format_number(value: float, usd: bool = False) -> str:
+    """Format a value compactly (1.2K, 3.4M, 5.6B), optionally as dollars."""
+    sign = "-" if value < 0 else ""
+    prefix = "$" if usd else ""
+    value = abs(value)
+    for threshold, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if value >= threshold:
+            return f"{sign}{prefix}{value / threshold:.1f}{suffix}"
+    return f"{sign}{prefix}{value:.2f}" if value < 10 else f"{sign}{prefix}{value:.0f}"
+
+
+def _as_date(value: np.datetime64) -> date:
+    return value.astype("datetime64[D]").item()
+
+
+def _changes(values: np.ndarray) -> np.ndarray:
+    """Period-over-period fractional changes, skipping periods that start at zero."""
+    previous = values[:-1]
+    valid = previous != 0
+    return values[1:][valid] / previous[valid] - 1
+
+
+def compute_series_stats(series: Series, label: str) -> Optional[SeriesStats]:
+    """
+    Compute summary statistics for a series with vectorized NumPy operations.
+
+    Args:
+        series: The series to describe (typically a period window view)
+        label: Display name, e.g. 'Ethereum Fees'
+
+    Returns:
+        The statistics, or None if the series has no finite values
+    """
+    finite = np.isfinite(series.values)
+    dates = series.dates[finite]
+    values = series.values[finite]
+    if not len(values):
+        return None
+
+    first, last = float(values[0]), float(values[-1])
+    low_index, high_index = int(np.argmin(values)), int(np.argmax(values))
+
+    running_peak = np.maximum.accumulate(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = np.where(running_peak > 0, values / running_peak - 1, 0.0)
+    trough_index = int(np.argmin(drawdowns))
+    peak_index = int(np.argmax(values[:trough_index + 1]))
+
+    changes = _changes(values)
+    volatility = None
+    if len(changes) >= 2:
+        volatility = float(np.std(changes, ddof=1) * np.sqrt(PERIODS_PER_YEAR.get(series.granularity, 365)) * 100)
+
+    slope = None
+    mean = float(np.mean(values))
+    if len(values) >= 3 and mean:
+        x = np.arange(len(values), dtype=np.float64)
+        x -= x.mean()
+        slope = float(np.dot(x, values - mean) / np.dot(x, x)) / abs(mean) * 100
+
+    return SeriesStats(
+        label=label,
+        metric=series.metric,
+        granularity=series.granularity,
+        points=len(values),
+        start_date=_as_date(dates[0]),
+        end_date=_as_date(dates[-1]),
+        first=first,
+        last=last,
+        change_pct=(last / first - 1) * 100 if first else None,
+        low=float(values[low_index]),
+        low_date=_as_date(dates[low_index]),
+        high=float(values[high_index]),
+        high_date=_as_date(dates[high_index]),
+        max_drawdown_pct=float(drawdowns[trough_index]) * 100,
+        drawdown_peak_date=_as_date(dates[peak_index]),
+        drawdown_trough_date=_as_date(dates[trough_index]),
+        volatility_pct=volatility,
+        slope_pct=slope,
+    )
+
+
+def change_correlation(first: Series, second: Series) -> Optional[Correlation]:
+    """
+    Correlate the period-over-period changes of two series on their shared dates.
+
+    Changes rather than levels are compared, since any two trending series have
+    highly correlated levels whether or not they move together.
+
+    Returns:
+        The correlation (without labels), or None if too few dates overlap
+    """
+    _, first_index, second_index = np.intersect1d(first.dates, second.dates, return_indices=True)
+    first_values = first.values[first_index]
+    second_values = second.values[second_index]
+    finite = np.isfinite(first_values) & np.isfinite(second_values)
+    first_values, second_values = first_values[finite], second_values[finite]
+
+    valid = (first_values[:-1] != 0) & (second_values[:-1] != 0)
+    first_changes = first_values[1:][valid] / first_values[:-1][valid] - 1
+    second_changes = second_values[1:][valid] / second_values[:-1][valid] - 1
+    if len(first_changes) < MIN_CORRELATION_POINTS or not first_changes.std() or not second_changes.std():
+        return None
+    coefficient = float(np.corrcoef(first_changes, second_changes)[0, 1])
+    return Correlation("", "", coefficient, len(first_changes))
+
+
+def compute_chart_stats(title: str, series_list: List[Series], labels: List[str]) -> ChartStats:
+    """
+    Compute statistics for every series of a chart and correlations between them.
+
+    Args:
+        title: The chart title
+        series_list: One series per chart series, already windowed to the chart period
+        labels: Display name for each series
+
+    Returns:
+        The chart statistics; series without data are left out
+    """
+    stats = []
+    for series, label in zip(series_list, labels):
+        series_stats = compute_series_stats(series, label)
+        if series_stats:
+            stats.append(series_stats)
+
+    correlations = []
+    for (first, first_label), (second, second_label) in combinations(zip(series_list, labels), 2):
+        correlation = change_correlation(first, second)
+        if correlation:
+            correlations.append(correlation._replace(first=first_label, second=second_label))
+    return ChartStats(title, stats, correlations)
+
+
+async def fetch_chart_series(chart_config: Dict, source, time_period: str, granularity: str) -> List[Series]:
+    """
+    Fetch the series behind a chart configuration concurrently.
+
+    Args:
+        chart_config: Chart configuration from url_builder.build_chart_config
+        source: Series source with an async get_series method
+        time_period: The time period for the chart
+        granularity: The granularity of the data
+
+    Returns:
+        One series per item in chart_config["series"], windowed to the period
+    """
+    start, end = period_window(time_period)
+    return await asyncio.gather(*[
+        source.get_series(item["asset"]["artemisId"], item["metric"]["artemisId"], granularity, start, end)
+        for item in chart_config["series"]
+    ])
+
+
+def _trend_word(slope_pct: Optional[float]) -> str:
+    if slope_pct is None or abs(slope_pct) < 0.05:
+        return "flat"
+    return "rising" if slope_pct > 0 else "falling"
+
+
+def _correlation_word(coefficient: float) -> str:
+    strength = abs(coefficient)
+    if strength >= 0.7:
+        word = "strong"
+    elif strength >= 0.4:
+        word = "moderate"
+    elif strength >= 0.2:
+        word = "weak"
+    else:
+        return "no clear"
+    return f"{word} {'positive' if coefficient > 0 else 'negative'}"
+
+
+def _day(value: date) -> str:
+    return value.strftime("%b %d, %Y")
+
+
+def format_stats_prompt(stats: ChartStats) -> str:
+    """
+    Render chart statistics as compact text for a language model prompt.
+
+    Args:
+        stats: Statistics from compute_chart_stats
+
+    Returns:
+        One line per series and per correlation
+    """
+    lines = [f"Chart: {stats.title}"]
+    for s in stats.series:
+        usd = s.metric in USD_METRICS
+        unit = PERIOD_UNITS.get(s.granularity, "period")
+        parts = [
+            f"{s.label} ({s.start_date} to {s.end_date}, {s.points} points)",
+            f"first {format_number(s.first, usd)}, last {format_number(s.last, usd)}",
+        ]
+        if s.change_pct is not None:
+            parts.append(f"change {s.change_pct:+.1f}%")
+        parts.append(f"high {format_number(s.high, usd)} on {s.high_date}, low {format_number(s.low, usd)} on {s.low_date}")
+        parts.append(f"max drawdown {s.max_drawdown_pct:.1f}% ({s.drawdown_peak_date} to {s.drawdown_trough_date})")
+        if s.volatility_pct is not None:
+            parts.append(f"annualized volatility {s.volatility_pct:.0f}%")
+        if s.slope_pct is not None:
+            parts.append(f"trend {s.slope_pct:+.2f}%/{unit}")
+        lines.append("; ".join(parts))
+    for c in stats.correlations:
+        lines.append(f"Correlation of {c.first} vs {c.second} changes: {c.coefficient:+.2f} over {c.points} periods")
+    return "\n".join(lines)
+
+
+def format_template_summary(stats: ChartStats) -> Optional[str]:
+    """
+    Write a plain-language chart summary from statistics, without a language model.
+
+    Args:
+        stats: Statistics from compute_chart_stats
+
+    Returns:
+        The summary, or None if no series had data
+    """
+    if not stats.series:
+        return None
+
+    paragraphs = []
+    for s in stats.series:
+        usd = s.metric in USD_METRICS
+        unit = PERIOD_UNITS.get(s.granularity, "period")
+        sentence = f"{s.label} went from {format_number(s.first, usd)} to {format_number(s.last, usd)}"
+        if s.change_pct is not None:
+            sentence += f" ({s.change_pct:+.1f}%)"
+        sentence += f" between {_day(s.start_date)} and {_day(s.end_date)}."
+        sentence += (f" It peaked at {format_number(s.high, usd)} on {_day(s.high_date)}"
+                     f" and bottomed at {format_number(s.low, usd)} on {_day(s.low_date)}.")
+        if s.max_drawdown_pct <= -1:
+            sentence += (f" The largest drawdown was {s.max_drawdown_pct:.1f}%"
+                         f" ({_day(s.drawdown_peak_date)} to {_day(s.drawdown_trough_date)}).")
+        trend = _trend_word(s.slope_pct)
+        if trend == "flat":
+            sentence += " The overall trend is flat"
+        else:
+            sentence += f" The overall trend is {trend} ({s.slope_pct:+.2f}% per {unit})"
+        if s.volatility_pct is not None:
+            sentence += f" with {s.volatility_pct:.0f}% annualized volatility"
+        paragraphs.append(sentence + ".")
+
+    for c in stats.correlations:
+        paragraphs.append(
+            f"{c.first} and {c.second} show {_correlation_word(c.coefficient)} correlation "
+            f"({c.coefficient:+.2f}) in their {PERIOD_ADJECTIVES.get(stats.series[0].granularity, 'periodic')} changes."
+        )
+    return "\n\n".join(paragraphs)
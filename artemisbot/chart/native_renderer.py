@@ -0,0 +1,153 @@
+import io
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Dict, List
+from artemisbot.chart.chart_stats import format_number
+from artemisbot.chart.url_builder import series_label
+from artemisbot.data.timeseries import Points, period_window
+
+try:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.ticker import FuncFormatter
+    import matplotlib.dates as mdates
+except ImportError:  # matplotlib is only needed for the native renderer
+    Figure = None
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Canvas matching the size of the chart-builder capture
+FIGURE_SIZE = (12, 6.5)
+FIGURE_DPI = 100
+BACKGROUND_COLOR = "#101018"
+TEXT_COLOR = "#E6E6F0"
+GRID_COLOR = "#2A2A3A"
+
+# Width of a column bar, in days, per granularity
+BAR_WIDTHS = {"1d": 0.8, "1w": 5.5, "1m": 24}
+
+
+def is_available() -> bool:
+    """Whether the plotting library needed for native rendering is installed."""
+    return Figure is not None
+
+
+async def fetch_chart_data(chart_config: Dict, source, time_period: str, granularity: str) -> List[Points]:
+    """
+    Fetch the points for every series in a chart configuration concurrently.
+
+    Args:
+        chart_config: Chart configuration from url_builder.build_chart_config
+        source: Series source with an async fetch_series method
+        time_period: The time period for the chart
+        granularity: The granularity of the data
+
+    Returns:
+        One list of points per series, in the order of chart_config["series"]
+    """
+    start, end = period_window(time_period)
+    return await asyncio.gather(*[
+        source.fetch_series(item["asset"]["artemisId"], item["metric"]["artemisId"], granularity, start, end)
+        for item in chart_config["series"]
+    ])
+
+
+def _to_percentage(points: Points) -> Points:
+    """Express a series as the percentage change from its first non-zero value."""
+    base = next((value for _, value in points if value), None)
+    if not base:
+        return points
+    return [(day, (value / base - 1) * 100) for day, value in points]
+
+
+def draw_chart(chart_config: Dict, series_points: List[Points], granularity: str) -> bytes:
+    """
+    Draw a chart configuration to PNG bytes.
+
+    Honours each series' LINE/COLUMN type, color, y-axis index and PERCENTAGE
+    units, so the result mirrors the chart-builder rendering of the same config.
+
+    Args:
+        chart_config: Chart configuration from url_builder.build_chart_config
+        series_points: Points for each series, as returned by fetch_chart_data
+        granularity: The granularity of the data
+
+    Returns:
+        The chart image as PNG bytes
+
+    Raises:
+        ValueError: If no series has any data
+    """
+    if Figure is None:
+        raise RuntimeError("matplotlib is required for native chart rendering")
+    if not any(series_points):
+        raise ValueError("No data available for this chart.")
+
+    # Use the object-oriented API so concurrent renders in worker threads do not share pyplot state
+    figure = Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI, facecolor=BACKGROUND_COLOR)
+    FigureCanvasAgg(figure)
+    base_axis = figure.add_subplot(1, 1, 1)
+    axes = {0: base_axis}
+    bar_width = BAR_WIDTHS.get(granularity, 0.8)
+
+    for item, points in zip(chart_config["series"], series_points):
+        if not points:
+            continue
+        setting = item["setting"]
+        axis_index = setting.get("yAxis", 0)
+        if axis_index not in axes:
+            axis = base_axis.twinx()
+            # Stack additional right-hand axes outward so their labels do not overlap
+            axis.spines["right"].set_position(("axes", 1 + 0.08 * (len(axes) - 1)))
+            axes[axis_index] = axis
+        axis = axes[axis_index]
+
+        if setting.get("units") == "PERCENTAGE":
+            points = _to_percentage(points)
+            axis.yaxis.set_major_formatter(FuncFormatter(lambda v, _pos: f"{v:.0f}%"))
+        else:
+            axis.yaxis.set_major_formatter(FuncFormatter(lambda v, _pos: format_number(v)))
+
+        days = [day for day, _ in points]
+        values = [value for _, value in points]
+        label = series_label(item)
+        if setting.get("type") == "COLUMN":
+            # Center bars on their bucket so they line up with line points
+            offsets = [day + timedelta(days=bar_width / 2) if granularity != "1d" else day for day in days]
+            axis.bar(offsets, values, width=bar_width, color=setting.get("color"), alpha=0.6, label=label)
+        else:
+            axis.plot(days, values, color=setting.get("color"), linewidth=2, label=label)
+
+    for axis in axes.values():
+        axis.set_facecolor(BACKGROUND_COLOR)
+        axis.tick_params(colors=TEXT_COLOR, labelsize=9)
+        for spine in axis.spines.values():
+            spine.set_color(GRID_COLOR)
+
+    # Keep the first metric's line above the other metrics' columns
+    if len(axes) > 1:
+        base_axis.set_zorder(max(axis.get_zorder() for axis in axes.values()) + 1)
+        base_axis.patch.set_visible(False)
+
+    base_axis.grid(True, color=GRID_COLOR, linewidth=0.6)
+    base_axis.xaxis.set_major_locator(mdates.AutoDateLocator())
+    base_axis.xaxis.set_major_formatter(mdates.ConciseDateFormatter(base_axis.xaxis.get_major_locator()))
+    base_axis.set_title(chart_config.get("title", ""), color=TEXT_COLOR, fontsize=13, loc="left")
+
+    handles, labels = [], []
+    for axis in axes.values():
+        axis_handles, axis_labels = axis.get_legend_handles_labels()
+        handles.extend(axis_handles)
+        labels.extend(axis_labels)
+    if handles:
+        legend = base_axis.legend(handles, labels, loc="upper left", frameon=False, fontsize=9)
+        for text in legend.get_texts():
+            text.set_color(TEXT_COLOR)
+
+    figure.tight_layout()
+    output = io.BytesIO()
+    figure.savefig(output, format="png", facecolor=BACKGROUND_COLOR)
+    return output.getvalue()
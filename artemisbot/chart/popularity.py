@@ -0,0 +1,133 @@
+import math
+import time
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+from artemisbot.chart.chart_spec import ChartSpec
+from artemisbot.utils.metrics import REGISTRY
+from config import POPULARITY_HALF_LIFE, POPULARITY_MAX_ENTRIES
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PopularChart(NamedTuple):
+    """A tracked chart and its decayed request count."""
+    spec: ChartSpec
+    score: float
+
+
+class PopularityTracker:
+    """
+    Exponentially decayed request counts per chart.
+
+    Every request adds one to its chart's score and scores halve every
+    half_life seconds, so a chart requested steadily r times per second
+    settles at about r * half_life / ln 2. Charts are keyed by
+    ChartSpec.cache_key, so requests typed differently for the same chart
+    count together. Once more than max_entries charts are tracked, the
+    lowest-scoring tenth is forgotten.
+    """
+
+    def __init__(self, half_life: float = POPULARITY_HALF_LIFE, max_entries: int = POPULARITY_MAX_ENTRIES):
+        """
+        Initialize the PopularityTracker.
+
+        Args:
+            half_life: Seconds for a chart's score to decay by half
+            max_entries: Maximum number of charts tracked at once
+        """
+        self.half_life = half_life
+        self.max_entries = max(1, max_entries)
+        self._entries: Dict[str, list] = {}  # cache_key -> [score, updated_at, spec]
+        self._lock = threading.Lock()
+
+        # Counters
+        self.recorded = 0
+        self.forgotten = 0
+
+    def _decayed(self, score: float, updated_at: float, now: float) -> float:
+        return score * math.pow(0.5, (now - updated_at) / self.half_life)
+
+    def record(self, spec: ChartSpec, weight: float = 1.0) -> float:
+        """
+        Count a request for a chart.
+
+        Args:
+            spec: The chart requested
+            weight: How much the request counts
+
+        Returns:
+            The chart's score including this request
+        """
+        now = time.monotonic()
+        key = spec.cache_key
+        with self._lock:
+            self.recorded += 1
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [0.0, now, spec]
+            entry[0] = self._decayed(entry[0], entry[1], now) + weight
+            entry[1] = now
+            entry[2] = spec
+            score = entry[0]
+            if len(self._entries) > self.max_entries:
+                self._forget(now)
+        return score
+
+    def score(self, spec: ChartSpec) -> float:
+        """Return a chart's current score (0 if it is not tracked)."""
+        with self._lock:
+            entry = self._entries.get(spec.cache_key)
+            return self._decayed(entry[0], entry[1], time.monotonic()) if entry else 0.0
+
+    def top(self, n: int, min_score: float = 0.0) -> List[PopularChart]:
+        """
+        Return the n highest-scoring charts, most popular first.
+
+        Args:
+            n: Maximum number of charts to return
+            min_score: Leave out charts scoring below this
+        """
+        now = time.monotonic()
+        with self._lock:
+            charts = [PopularChart(spec, self._decayed(score, updated_at, now))
+                      for score, updated_at, spec in self._entries.values()]
+        charts = [chart for chart in charts if chart.score >= min_score]
+        charts.sort(key=lambda chart: chart.score, reverse=True)
+        return charts[:n]
+
+    def _forget(self, now: float) -> None:
+        # Trim in batches so a full tracker does not sort on every request
+        keep = int(self.max_entries * 0.9)
+        ranked = sorted(self._entries, key=lambda key: self._decayed(*self._entries[key][:2], now), reverse=True)
+        for key in ranked[keep:]:
+            del self._entries[key]
+        self.forgotten += len(ranked) - keep
+
+    def stats(self) -> Dict[str, Any]:
+        """Return how many charts are tracked and the score of the most popular."""
+        top = self.top(1)
+        with self._lock:
+            return {
+                "tracked": len(self._entries),
+                "max_entries": self.max_entries,
+                "recorded": self.recorded,
+                "forgotten": self.forgotten,
+                "top_score": top[0].score if top else 0.0,
+            }
+
+
+_tracker: Optional[PopularityTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_popularity_tracker() -> PopularityTracker:
+    """Return the process-wide popularity tracker, creating it on first use."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = PopularityTracker()
+            REGISTRY.register_collector("popularity", _tracker.stats)
+        return _tracker
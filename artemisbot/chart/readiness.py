@@ -0,0 +1,164 @@
+import time
+import logging
+import threading
+from typing import Dict, NamedTuple
+from artemisbot.utils.metrics import REGISTRY
+from config import CHART_READY_TIMEOUT
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Polls the page until every Highcharts chart has drawn its points and finished
+# animating. Calls back with {status, reason, elapsedMs}; status is one of
+# "ready", "no_data" or "timeout".
+READINESS_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+var pollMs = arguments[1];
+var start = Date.now();
+var lastSignature = null;
+
+function inspect() {
+    var body = document.body ? document.body.innerText : '';
+    if (body.indexOf('No data available') !== -1) {
+        return {status: 'no_data', reason: 'page shows "No data available"'};
+    }
+    if (typeof Highcharts === 'undefined' || !Highcharts.charts) {
+        return {status: 'pending', reason: 'Highcharts library not loaded'};
+    }
+    var charts = Highcharts.charts.filter(function (c) { return !!c; });
+    if (!charts.length) {
+        return {status: 'pending', reason: 'no Highcharts chart instances'};
+    }
+    var signature = [];
+    var points = 0;
+    var animating = 0;
+    var legacy = 0;
+    var undrawn = 0;
+    for (var i = 0; i < charts.length; i++) {
+        var chart = charts[i];
+        if (chart.hasLoaded === false) {
+            return {status: 'pending', reason: 'chart ' + i + ' has not finished loading'};
+        }
+        for (var j = 0; j < chart.series.length; j++) {
+            var series = chart.series[j];
+            if (!series.visible) continue;
+            var seriesPoints = series.points || [];
+            points += seriesPoints.length;
+            if (seriesPoints.length && !series.graph && !seriesPoints.some(function (p) { return !!p.graphic; })) {
+                undrawn++;
+            }
+            if (typeof series.afterAnimate !== 'function') {
+                legacy++;
+            } else if (series.finishedAnimating !== true) {
+                animating++;
+            }
+            var last = seriesPoints[seriesPoints.length - 1];
+            signature.push(seriesPoints.length + ':' + (last ? last.plotX + ',' + last.plotY : ''));
+        }
+    }
+    if (!points) {
+        return {status: 'empty', reason: 'charts loaded but no series has points'};
+    }
+    if (undrawn) {
+        return {status: 'pending', reason: undrawn + ' series not drawn yet'};
+    }
+    if (animating) {
+        return {status: 'settling', reason: animating + ' series still animating'};
+    }
+    // Highcharts builds without afterAnimate never flag the end of an
+    // animation, so wait for the plotted geometry to stop changing instead.
+    signature = signature.join('|');
+    var stable = signature === lastSignature;
+    lastSignature = signature;
+    if (legacy && !stable) {
+        return {status: 'settling', reason: 'waiting for plotted points to settle'};
+    }
+    return {status: 'ready', reason: 'chart drawn'};
+}
+
+function poll() {
+    var result;
+    try {
+        result = inspect();
+    } catch (e) {
+        result = {status: 'pending', reason: 'inspection error: ' + e.message};
+    }
+    var elapsed = Date.now() - start;
+    if (result.status === 'ready' || result.status === 'no_data') {
+        result.elapsedMs = elapsed;
+        return done(result);
+    }
+    if (elapsed >= timeoutMs) {
+        if (result.status === 'empty') {
+            return done({status: 'no_data', reason: result.reason, elapsedMs: elapsed});
+        }
+        if (result.status === 'settling') {
+            // Points are drawn, so a capture is still usable
+            return done({status: 'ready', reason: 'drawn, gave up on ' + result.reason, elapsedMs: elapsed});
+        }
+        return done({status: 'timeout', reason: result.reason, elapsedMs: elapsed});
+    }
+    setTimeout(poll, pollMs);
+}
+
+poll();
+"""
+
+
+class ReadinessResult(NamedTuple):
+    """Outcome of waiting for a chart to render."""
+    status: str  # "ready", "no_data" or "timeout"
+    reason: str
+    elapsed: float  # seconds
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+
+# Aggregate readiness timings
+_stats_lock = threading.Lock()
+_stats = {"count": 0, "ready": 0, "no_data": 0, "timeout": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+
+
+def wait_for_chart_ready(driver, timeout: float = CHART_READY_TIMEOUT, poll_interval: float = 0.05) -> ReadinessResult:
+    """
+    Wait until the page's Highcharts charts are fully drawn, or until timeout.
+
+    Args:
+        driver: Selenium WebDriver with the chart page loaded
+        timeout: Maximum seconds to wait
+        poll_interval: Seconds between checks inside the page
+
+    Returns:
+        A ReadinessResult with the final status, the reason and how long it took
+    """
+    started = time.monotonic()
+    driver.set_script_timeout(timeout + 5)
+    try:
+        raw = driver.execute_async_script(READINESS_SCRIPT, int(timeout * 1000), int(poll_interval * 1000))
+        result = ReadinessResult(raw["status"], raw["reason"], raw["elapsedMs"] / 1000)
+    except Exception as e:
+        result = ReadinessResult("timeout", f"readiness script failed: {str(e)}", time.monotonic() - started)
+
+    with _stats_lock:
+        _stats["count"] += 1
+        _stats[result.status] += 1
+        _stats["total_seconds"] += result.elapsed
+        _stats["max_seconds"] = max(_stats["max_seconds"], result.elapsed)
+
+    logger.info(f"Chart readiness: {result.status} after {result.elapsed:.3f}s ({result.reason})")
+    return result
+
+
+def readiness_stats() -> Dict[str, float]:
+    """Return aggregate readiness counts and timings."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["avg_seconds"] = stats["total_seconds"] / stats["count"] if stats["count"] else 0.0
+    return stats
+
+
+REGISTRY.register_collector("readiness", readiness_stats)
@@ -0,0 +1,307 @@
+import time
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional
+from artemisbot.utils.cache import LRUCache
+from config import (
+    SCHEDULER_MAX_CONCURRENT,
+    SCHEDULER_MAX_QUEUE,
+    SCHEDULER_LOW_MAX_WAIT,
+    CHAT_RATE_PER_MINUTE,
+    CHAT_BURST,
+    USER_RATE_PER_MINUTE,
+    USER_BURST,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Priority lanes, served in this order
+HIGH = 0  # cache hits and private chats
+LOW = 1  # uncached renders requested from groups
+LANE_NAMES = {HIGH: "high", LOW: "low"}
+
+# Rate-limit buckets are forgotten after this many seconds, by which time they would be full again
+BUCKET_IDLE_TTL = 3600
+MAX_BUCKETS = 100000
+
+
+class RateLimitError(ValueError):
+    """Raised when a chat or user has used up its chart allowance, or the queue is full."""
+
+    def __init__(self, message: str, retry_after: float = 0.0, notify: bool = True):
+        """
+        Initialize the RateLimitError.
+
+        Args:
+            message: Message to show the user
+            retry_after: Seconds until another request would be accepted
+            notify: Whether to tell the user; False for repeated rejections, so a
+                noisy chat is not answered with a flood of error messages
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.notify = notify
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at rate tokens per second up to capacity."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated", "rejections")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.rejections = 0  # consecutive rejections since the last accepted request
+
+    def _refill(self, now: float) -> None:
+        # now may predate a bucket created after it was read
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = max(self.updated, now)
+
+    def available(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= 1
+
+    def take(self) -> None:
+        self.tokens -= 1
+        self.rejections = 0
+
+    def retry_after(self) -> float:
+        """Seconds until the next token is available."""
+        return max(0.0, (1 - self.tokens) / self.rate) if self.rate else float("inf")
+
+
+class _Job:
+    __slots__ = ("chat_id", "lane", "enqueued_at", "granted")
+
+    def __init__(self, chat_id: Hashable, lane: int):
+        self.chat_id = chat_id
+        self.lane = lane
+        self.enqueued_at = time.monotonic()
+        self.granted = asyncio.get_running_loop().create_future()
+
+
+class ChartScheduler:
+    """
+    Admission control and fair scheduling for chart jobs.
+
+    check() enforces per-chat and per-user token buckets. run() then queues the
+    job in a priority lane and starts it once one of max_concurrent slots is
+    free. The high lane (cache hits and private chats) is served before the low
+    lane (uncached group renders), unless the low-lane job next in turn has
+    waited low_max_wait seconds, so a steady stream of cache hits cannot starve
+    group renders. Within a lane, chats take turns round-robin, so one busy
+    group cannot starve everyone else.
+    """
+
+    def __init__(self, max_concurrent: int = SCHEDULER_MAX_CONCURRENT, max_queue: int = SCHEDULER_MAX_QUEUE,
+                 chat_rate: float = CHAT_RATE_PER_MINUTE, chat_burst: int = CHAT_BURST,
+                 user_rate: float = USER_RATE_PER_MINUTE, user_burst: int = USER_BURST,
+                 low_max_wait: float = SCHEDULER_LOW_MAX_WAIT):
+        """
+        Initialize the ChartScheduler.
+
+        Args:
+            max_concurrent: Maximum chart jobs running at once
+            max_queue: Maximum jobs waiting across all lanes
+            chat_rate: Charts per minute allowed per chat
+            chat_burst: Charts a chat may request at once before the rate applies
+            user_rate: Charts per minute allowed per user
+            user_burst: Charts a user may request at once before the rate applies
+            low_max_wait: Seconds a low-lane job waits before it is served ahead of the high lane
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max_queue
+        self._chat_limit = (chat_rate / 60.0, chat_burst)
+        self._user_limit = (user_rate / 60.0, user_burst)
+        self.low_max_wait = low_max_wait
+        self._buckets = LRUCache(
+            max_bytes=MAX_BUCKETS, ttl=BUCKET_IDLE_TTL, max_entries=MAX_BUCKETS, name="rate limit buckets"
+        )
+        # lane -> chat_id -> queued jobs; chats are served in insertion order
+        self._lanes: Dict[int, "OrderedDict[Hashable, Deque[_Job]]"] = {HIGH: OrderedDict(), LOW: OrderedDict()}
+        self._queued = 0
+        self._running = 0
+
+        # Metrics
+        self.admitted = 0
+        self.rate_limited = 0
+        self.queue_full = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_queue_depth = 0
+        self.aged_promotions = 0
+        self._waits = {lane: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0} for lane in LANE_NAMES}
+
+    def _bucket(self, key: Hashable, limit) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(*limit)
+        # Re-set on every request so an active chat's bucket is not forgotten (and refilled) after BUCKET_IDLE_TTL
+        self._buckets.set(key, bucket)
+        return bucket
+
+    def check(self, chat_id: Hashable, user_id: Optional[Hashable] = None) -> None:
+        """
+        Take one request from the chat's and the user's allowance.
+
+        Args:
+            chat_id: Telegram chat ID
+            user_id: Telegram user ID, if known
+
+        Raises:
+            RateLimitError: If either allowance is used up or the queue is full
+        """
+        if self._queued >= self.max_queue:
+            self.queue_full += 1
+            raise RateLimitError("The bot is very busy right now. Please try again in a minute.", retry_after=60)
+
+        now = time.monotonic()
+        buckets = [("chat", self._bucket(("chat", chat_id), self._chat_limit))]
+        if user_id is not None:
+            buckets.append(("user", self._bucket(("user", user_id), self._user_limit)))
+        for kind, bucket in buckets:
+            if not bucket.available(now):
+                self.rate_limited += 1
+                bucket.rejections += 1
+                retry_after = bucket.retry_after()
+                logger.info(f"Rate limited {kind} {chat_id if kind == 'chat' else user_id}, retry in {retry_after:.1f}s")
+                raise RateLimitError(
+                    f"Too many chart requests. Please try again in {max(1, round(retry_after))} seconds.",
+                    retry_after=retry_after,
+                    notify=bucket.rejections == 1
+                )
+        for _, bucket in buckets:
+            bucket.take()
+        self.admitted += 1
+
+    async def run(self, fn: Callable[[], Awaitable[Any]], chat_id: Hashable, lane: int = LOW) -> Any:
+        """
+        Run a chart job once a slot is free and it is the job's turn.
+
+        Args:
+            fn: Zero-argument callable returning an awaitable with the job's result
+            chat_id: Chat the job belongs to, for round-robin fairness
+            lane: HIGH or LOW priority lane
+
+        Returns:
+            The job's result
+        """
+        job = _Job(chat_id, lane)
+        self._lanes[lane].setdefault(chat_id, deque()).append(job)
+        self._queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queued)
+        self._dispatch()
+
+        try:
+            await job.granted
+        except asyncio.CancelledError:
+            if job.granted.done() and not job.granted.cancelled():
+                # The slot was granted just as we were cancelled
+                self._release()
+            else:
+                self._remove(job)
+            raise
+
+        waited = time.monotonic() - job.enqueued_at
+        waits = self._waits[lane]
+        waits["count"] += 1
+        waits["total_seconds"] += waited
+        waits["max_seconds"] = max(waits["max_seconds"], waited)
+        if waited >= 1:
+            logger.info(f"Chart job for chat {chat_id} waited {waited:.2f}s in the {LANE_NAMES[lane]} lane")
+
+        try:
+            result = await fn()
+            self.completed += 1
+            return result
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self._release()
+
+    def _remove(self, job: _Job) -> None:
+        """Drop a job that was cancelled while waiting."""
+        chats = self._lanes[job.lane]
+        jobs = chats.get(job.chat_id)
+        if jobs and job in jobs:
+            jobs.remove(job)
+            self._queued -= 1
+            if not jobs:
+                del chats[job.chat_id]
+
+    def _release(self) -> None:
+        self._running -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while slots are free, in lane order, round-robin across chats."""
+        while self._running < self.max_concurrent:
+            job = self._next_job()
+            if job is None:
+                return
+            self._running += 1
+            job.granted.set_result(None)
+
+    def _lane_order(self) -> tuple:
+        """HIGH before LOW, unless the LOW job next in turn has waited too long."""
+        low = self._lanes[LOW]
+        if low and self._lanes[HIGH]:
+            head = next(iter(low.values()))[0]
+            if time.monotonic() - head.enqueued_at >= self.low_max_wait:
+                self.aged_promotions += 1
+                return (LOW, HIGH)
+        return (HIGH, LOW)
+
+    def _next_job(self) -> Optional[_Job]:
+        for lane in self._lane_order():
+            chats = self._lanes[lane]
+            while chats:
+                chat_id, jobs = next(iter(chats.items()))
+                job = jobs.popleft()
+                self._queued -= 1
+                if jobs:
+                    # Send this chat to the back so other chats get a turn first
+                    chats.move_to_end(chat_id)
+                else:
+                    del chats[chat_id]
+                if not job.granted.done():
+                    return job
+        return None
+
+    def queue_depth(self) -> Dict[str, int]:
+        """Return the number of waiting jobs per lane."""
+        return {
+            LANE_NAMES[lane]: sum(len(jobs) for jobs in chats.values())
+            for lane, chats in self._lanes.items()
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, wait times and admission counters."""
+        waits = {}
+        for lane, data in self._waits.items():
+            waits[LANE_NAMES[lane]] = {
+                "count": data["count"],
+                "avg_seconds": data["total_seconds"] / data["count"] if data["count"] else 0.0,
+                "max_seconds": data["max_seconds"],
+            }
+        return {
+            "running": self._running,
+            "max_concurrent": self.max_concurrent,
+            "queued": self._queued,
+            "queue_depth": self.queue_depth(),
+            "max_queue_depth": self.max_queue_depth,
+            "aged_promotions": self.aged_promotions,
+            "waits": waits,
+            "admitted": self.admitted,
+            "rate_limited": self.rate_limited,
+            "queue_full": self.queue_full,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
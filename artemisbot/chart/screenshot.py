@@ -1,180 +1,113 @@
-import os
-import time
+import base64
 import hashlib
-from functools import lru_cache
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, StaleElementReferenceException
-from config import ARTEMIS_API_KEY
+import logging
+from selenium.common.exceptions import WebDriverException
 from PIL import Image
 import io
+from typing import Dict, Optional, Tuple
+from artemisbot.chart.browser_pool import get_browser_pool, BrowserPoolTimeout
+from artemisbot.chart.readiness import wait_for_chart_ready
+from artemisbot.utils.cache import LRUCache
+from artemisbot.utils.disk_cache import DiskCache
+from artemisbot.utils.metrics import REGISTRY, track_stage
+from config import (
+    SCREENSHOT_CACHE_TTL,
+    SCREENSHOT_CACHE_MAX_BYTES,
+    CHART_DISK_CACHE_DIR,
+    CHART_DISK_CACHE_MAX_BYTES,
+    CHART_CAPTURE_MODE,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Pixels of margin kept around the chart container
+CAPTURE_PADDING = 10
 
 # Cache for storing screenshots
-SCREENSHOT_CACHE = {}
-CACHE_DURATION = 300  # 5 minutes in seconds
+CACHE_DURATION = SCREENSHOT_CACHE_TTL
+SCREENSHOT_CACHE = LRUCache(max_bytes=SCREENSHOT_CACHE_MAX_BYTES, ttl=CACHE_DURATION, name="screenshot")
+
+# Optional persistent tier underneath the memory cache
+DISK_CACHE = None
+if CHART_DISK_CACHE_DIR:
+    try:
+        DISK_CACHE = DiskCache(CHART_DISK_CACHE_DIR, CHART_DISK_CACHE_MAX_BYTES)
+    except OSError as e:
+        logger.error(f"Disk chart cache disabled, could not open {CHART_DISK_CACHE_DIR}: {str(e)}")
+
+REGISTRY.register_collector("screenshot_cache", SCREENSHOT_CACHE.stats)
+if DISK_CACHE is not None:
+    REGISTRY.register_collector("disk_cache", DISK_CACHE.stats)
+
+# Scrolls the largest Highcharts container into view and, after the next paint,
+# calls back with its viewport-relative bounding box.
+LOCATE_CHART_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var containers = Array.prototype.slice.call(document.getElementsByClassName('highcharts-container'));
+if (!containers.length) return done({x: 0, y: 0, width: 0, height: 0, scrollX: 0, scrollY: 0});
+var largest = containers.reduce(function (a, b) {
+    return a.offsetWidth * a.offsetHeight >= b.offsetWidth * b.offsetHeight ? a : b;
+});
+largest.scrollIntoView(true);
+requestAnimationFrame(function () {
+    requestAnimationFrame(function () {
+        var r = largest.getBoundingClientRect();
+        done({x: r.left, y: r.top, width: r.width, height: r.height,
+              scrollX: window.scrollX, scrollY: window.scrollY});
+    });
+});
+"""
 
 def get_cache_key(url: str) -> str:
     """Generate a cache key for the URL."""
     return hashlib.md5(url.encode()).hexdigest()
 
-def take_screenshot(url: str) -> bytes:
+def _locate_chart(driver) -> Tuple[Dict[str, float], Dict[str, float]]:
     """
-    Capture the chart area by finding the largest Highcharts container and taking a screenshot of it.
-    Uses caching to improve performance for frequently requested charts.
+    Scroll the largest Highcharts container into view and return its position and size.
+    
+    The location holds viewport coordinates ('x', 'y') plus the page scroll offsets
+    ('scrollX', 'scrollY') needed to turn them into document coordinates.
     """
-    # Check cache first
-    cache_key = get_cache_key(url)
-    if cache_key in SCREENSHOT_CACHE:
-        timestamp, screenshot = SCREENSHOT_CACHE[cache_key]
-        if time.time() - timestamp < CACHE_DURATION:
-            return screenshot
+    rect = driver.execute_async_script(LOCATE_CHART_SCRIPT)
+    location = {'x': rect['x'], 'y': rect['y'], 'scrollX': rect['scrollX'], 'scrollY': rect['scrollY']}
+    return location, {'width': rect['width'], 'height': rect['height']}
 
-    chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-infobars")
-    chrome_options.add_argument("--disable-logging")
-    chrome_options.add_argument("--log-level=3")
-    chrome_options.add_argument("--silent")
-    chrome_options.add_argument("--force-device-scale-factor=1")
-    # Add performance optimizations
-    chrome_options.add_argument("--disable-javascript-harmony")
-    chrome_options.add_argument("--disable-features=TranslateUI")
-    chrome_options.add_argument("--disable-features=BlinkGenPropertyTrees")
-    chrome_options.add_argument("--disable-features=IsolateOrigins")
-    chrome_options.add_argument("--disable-site-isolation-trials")
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--disable-features=NetworkService")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess2")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess3")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess4")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess5")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess6")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess7")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess8")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess9")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess10")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess11")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess12")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess13")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess14")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess15")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess16")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess17")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess18")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess19")
-    chrome_options.add_argument("--disable-features=NetworkServiceInProcess20")
+def capture_chart_cdp(driver, location: Dict[str, float], size: Dict[str, float], padding: int = CAPTURE_PADDING) -> bytes:
+    """
+    Have the browser encode only the chart region via DevTools Page.captureScreenshot.
     
-    driver = None
-    try:
-        service = Service()
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.set_window_size(1920, 1080)
-        
-        if ARTEMIS_API_KEY:
-            driver.execute_cdp_cmd('Network.setCookie', {
-                'name': 'artemis_api_key',
-                'value': ARTEMIS_API_KEY,
-                'domain': '.artemis.xyz',
-                'path': '/'
-            })
-            
-        driver.get(url)
-        
-        # Wait for page load with reduced timeout
-        WebDriverWait(driver, 5).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
-        )
-        
-        # Reduced initial wait time
-        time.sleep(1)
-        
-        # Check for no data message or empty chart
-        try:
-            # Check for explicit no data message
-            no_data_element = driver.find_element(By.XPATH, "//*[contains(text(), 'No data available')]")
-            if no_data_element.is_displayed():
-                return "ERROR:NO_DATA"
-                
-            # Check for empty chart container
-            empty_chart = driver.find_element(By.CLASS_NAME, "highcharts-container")
-            if empty_chart.is_displayed():
-                # Check if the chart is actually empty (no data points)
-                chart_data = driver.execute_script("""
-                    var chart = Highcharts.charts[0];
-                    if (!chart) return false;
-                    var series = chart.series;
-                    if (!series || !series.length) return true;
-                    for (var i = 0; i < series.length; i++) {
-                        if (series[i].points && series[i].points.length > 0) {
-                            return false;
-                        }
-                    }
-                    return true;
-                """)
-                if chart_data:
-                    return "ERROR:NO_DATA"
-        except:
-            pass
-            
-        # Check for the presence of any highcharts-series element to confirm a chart is rendered
-        try:
-            series_elements = driver.find_elements(By.CSS_SELECTOR, ".highcharts-series")
-            if not series_elements or not any(elem.is_displayed() for elem in series_elements):
-                return "ERROR:NO_DATA"
-        except:
-            return "ERROR:NO_DATA"
-            
-        # Reduced retries and wait times
-        max_retries = 2
-        for attempt in range(max_retries):
-            try:
-                wait = WebDriverWait(driver, 5)
-                wait.until(EC.presence_of_element_located((By.CLASS_NAME, "highcharts-container")))
-                time.sleep(1)
-                break
-            except TimeoutException:
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(1)
-                
-        highcharts_containers = []
-        for attempt in range(max_retries):
-            try:
-                highcharts_containers = driver.find_elements(By.CLASS_NAME, "highcharts-container")
-                if highcharts_containers:
-                    break
-                time.sleep(0.5)
-            except StaleElementReferenceException:
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(0.5)
-                
-        if not highcharts_containers:
-            raise Exception("No Highcharts containers found")
-            
-        largest_container = max(highcharts_containers, key=lambda x: x.size['width'] * x.size['height'])
-        location = largest_container.location
-        size = largest_container.size
-        
-        # Scroll into view and take screenshot
-        driver.execute_script("arguments[0].scrollIntoView(true);", largest_container)
-        time.sleep(0.2)  # Reduced wait time
-        
+    Returns PNG bytes that need no further decoding or cropping.
+    """
+    left = max(0, location['x'] - padding)
+    top = max(0, location['y'] - padding)
+    with track_stage("screenshot"):
+        result = driver.execute_cdp_cmd('Page.captureScreenshot', {
+            'format': 'png',
+            'fromSurface': True,
+            'clip': {
+                # Clip coordinates are relative to the document, not the viewport
+                'x': left + location['scrollX'],
+                'y': top + location['scrollY'],
+                'width': location['x'] + size['width'] + padding - left,
+                'height': location['y'] + size['height'] + padding - top,
+                'scale': 1
+            }
+        })
+    return base64.b64decode(result['data'])
+
+def capture_chart_pil(driver, location: Dict[str, float], size: Dict[str, float], padding: int = CAPTURE_PADDING) -> bytes:
+    """
+    Take a full viewport screenshot and crop it to the chart region with PIL.
+    """
+    with track_stage("screenshot"):
         screenshot_png = driver.get_screenshot_as_png()
+    
+    with track_stage("crop_encode"):
         image = Image.open(io.BytesIO(screenshot_png))
         
-        # Reduced padding
-        padding = 10
         left = max(0, location['x'] - padding)
         top = max(0, location['y'] - padding)
         right = location['x'] + size['width'] + padding
@@ -183,14 +116,91 @@ def take_screenshot(url: str) -> bytes:
         cropped_image = image.crop((left, top, right, bottom))
         output = io.BytesIO()
         cropped_image.save(output, format="PNG", optimize=True)
-        screenshot_data = output.getvalue()
+        return output.getvalue()
+
+def capture_chart(driver, location: Dict[str, float], size: Dict[str, float], mode: str = CHART_CAPTURE_MODE) -> bytes:
+    """
+    Capture the chart region using the configured mode, falling back to the PIL crop.
+    
+    Args:
+        driver: Selenium WebDriver with the chart page loaded
+        location: Chart position as returned by _locate_chart
+        size: Chart size as returned by _locate_chart
+        mode: "cdp" for a browser-clipped capture, "pil" for full screenshot plus crop
+    """
+    if mode == "cdp":
+        try:
+            return capture_chart_cdp(driver, location, size)
+        except WebDriverException as e:
+            logger.warning(f"Clipped CDP capture failed, falling back to PIL crop: {str(e)}")
+    return capture_chart_pil(driver, location, size)
+
+def take_screenshot(url: str, cache_key: Optional[str] = None, disk_ttl: Optional[float] = None,
+                    refresh: bool = False) -> bytes:
+    """
+    Capture the chart area by finding the largest Highcharts container and taking a screenshot of it.
+    Uses caching to improve performance for frequently requested charts, and renders in a
+    warm browser session checked out from the shared pool instead of launching Chrome per request.
+    
+    Args:
+        url: The chart URL to render
+        cache_key: Cache key for the chart (defaults to a hash of the URL)
+        disk_ttl: Maximum age in seconds of a chart served from the disk cache
+        refresh: Render even if the chart is cached, replacing the cached copy
+    """
+    # Check the memory cache, then the disk cache
+    cache_key = cache_key or get_cache_key(url)
+    screenshot = None if refresh else SCREENSHOT_CACHE.get(cache_key)
+    if screenshot is not None:
+        return screenshot
+    if DISK_CACHE is not None and not refresh:
+        screenshot = DISK_CACHE.get(cache_key, ttl=disk_ttl)
+        if screenshot is not None:
+            SCREENSHOT_CACHE.set(cache_key, screenshot)
+            return screenshot
+
+    pool = get_browser_pool()
+    try:
+        with track_stage("browser_acquire"):
+            session = pool.acquire()
+    except BrowserPoolTimeout as e:
+        logger.warning(f"Browser pool exhausted: {str(e)}")
+        return "ERROR:BROWSER_BUSY"
+    except Exception as e:
+        # Chrome or chromedriver failed to launch; report it like any other failed render
+        logger.error(f"Error launching browser session: {str(e)}")
+        return f"ERROR:SCREENSHOT_FAILED - {str(e)}"
+
+    healthy = True
+    try:
+        driver = session.driver
+        with track_stage("driver_get"):
+            driver.get(url)
+        
+        # Wait for the chart itself to be drawn rather than sleeping a fixed time
+        with track_stage("readiness_wait"):
+            readiness = wait_for_chart_ready(driver)
+        if readiness.status == "no_data":
+            return "ERROR:NO_DATA"
+        if not readiness.ready:
+            return f"ERROR:RENDER_TIMEOUT - {readiness.reason}"
+        
+        with track_stage("locate"):
+            location, size = _locate_chart(driver)
+        if not size['width'] or not size['height']:
+            raise Exception("No Highcharts containers found")
+        
+        screenshot_data = capture_chart(driver, location, size)
         
         # Cache the screenshot
-        SCREENSHOT_CACHE[cache_key] = (time.time(), screenshot_data)
+        SCREENSHOT_CACHE.set(cache_key, screenshot_data)
+        if DISK_CACHE is not None:
+            DISK_CACHE.set(cache_key, screenshot_data)
         
         return screenshot_data
         
     except WebDriverException as e:
+        healthy = False
         if "net::ERR_CONNECTION_REFUSED" in str(e):
             return "ERROR:AUTH_REQUIRED"
         elif "net::ERR_NAME_NOT_RESOLVED" in str(e):
@@ -199,5 +209,4 @@ def take_screenshot(url: str) -> bytes:
     except Exception as e:
         return f"ERROR:SCREENSHOT_FAILED - {str(e)}"
     finally:
-        if driver:
-            driver.quit()
+        pool.release(session, healthy=healthy)
@@ -1,16 +1,103 @@
 import json
+import hashlib
 import urllib.parse
 import logging
-from typing import List
-from artemisbot.utils.asset_mappings import get_asset_by_id, get_asset_by_symbol
+from typing import Dict, List
+from artemisbot.utils.asset_index import get_asset_index
+from config import CHART_BUILDER_URL
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def build_chart_url(metrics: List[str], tickers: List[str], asset_type: str, time_period: str, granularity: str, is_percentage: bool = False) -> str:
+# Map time period to Artemis time period ID
+PERIOD_MAP = {
+    "1w": "WEEKLY",
+    "mtd": "MONTH_TO_DATE",
+    "1m": "MONTHLY",
+    "3m": "THREE_MONTHS",
+    "6m": "SIX_MONTHS",
+    "ytd": "YEAR_TO_DATE",
+    "1y": "ONE_YEAR",
+    "all": "MAX"
+}
+
+# Map granularity to Artemis granularity ID
+GRANULARITY_MAP = {
+    "1d": "DAY",
+    "1w": "WEEK",
+    "1m": "MONTH"
+}
+
+# Map metric to Artemis metric ID
+METRIC_MAP = {
+    "price": "PRICE",
+    "volume": "VOLUME",
+    "tvl": "TVL",
+    "fees": "FEES",
+    "revenue": "REVENUE",
+    "mc": "MC",
+    "txns": "TXNS",
+    "daa": "DAA",
+    "dau": "DAU",
+    "fdmc": "FDMC",
+    "borrows": "BORROWS",
+    "deposits": "DEPOSITS"
+}
+
+# Display names used in chart titles
+METRIC_DISPLAY = {
+    "price": "Price",
+    "volume": "Volume",
+    "tvl": "TVL",
+    "fees": "Fees",
+    "revenue": "Revenue",
+    "mc": "Market Cap",
+    "txns": "Transactions",
+    "daa": "Daily Active Addresses",
+    "dau": "Daily Active Users",
+    "fdmc": "Fully Diluted Market Cap"
+}
+
+TIME_PERIOD_DISPLAY = {
+    "1w": "1 Week",
+    "mtd": "Month to Date",
+    "1m": "1 Month",
+    "3m": "3 Months",
+    "6m": "6 Months",
+    "ytd": "Year to Date",
+    "1y": "1 Year",
+    "all": "All Time"
+}
+
+GRANULARITY_DISPLAY = {
+    "1d": "Daily",
+    "1w": "Weekly",
+    "1m": "Monthly"
+}
+
+# Different colors for each metric
+SERIES_COLORS = ["#8A88FF", "#EFCE6C", "#FF6B6B", "#4ECDC4", "#45B7D1"]
+
+def chart_title(metrics: List[str], asset_names: List[str], time_period: str, granularity: str, is_percentage: bool = False) -> str:
+    """Create a readable title for a chart, e.g. 'Price vs TVL - Solana (1 Week, Daily)'."""
+    metric_displays = [METRIC_DISPLAY.get(metric, metric.capitalize()) for metric in metrics]
+    title = f"{' vs '.join(metric_displays)} - {'/'.join(asset_names)} "
+    title += f"({TIME_PERIOD_DISPLAY.get(time_period, time_period)}, "
+    title += f"{GRANULARITY_DISPLAY.get(granularity, granularity)})"
+    if is_percentage:
+        title += " (%)"
+    return title
+
+def series_label(series_item: Dict) -> str:
+    """Legend label of a chart-builder series, e.g. 'Ethereum TVL'."""
+    metric = series_item["metric"]["artemisId"]
+    return f"{series_item['asset']['name']} {METRIC_DISPLAY.get(metric.lower(), metric.title())}"
+
+
+def build_chart_config(metrics: List[str], tickers: List[str], asset_type: str, time_period: str, granularity: str, is_percentage: bool = False) -> Dict:
     """
-    Build a chart URL for the Artemis Analytics platform.
+    Build the Artemis chart-builder configuration for a chart.
     
     Args:
         metrics: List of metrics to chart (e.g., ['price', 'volume', 'tvl'])
@@ -21,101 +108,33 @@ def build_chart_url(metrics: List[str], tickers: List[str], asset_type: str, tim
         is_percentage: Whether to display as percentages
         
     Returns:
-        The complete chart URL
+        The chart configuration (title, period, granularity and one series per metric and asset)
     """
-    logger.info(f"Building chart URL for metrics: {metrics}, tickers: {tickers}, asset_type: {asset_type}")
-    
-    # Map time period to Artemis time period ID
-    period_map = {
-        "1w": "WEEKLY",
-        "mtd": "MONTH_TO_DATE",
-        "1m": "MONTHLY",
-        "3m": "THREE_MONTHS",
-        "6m": "SIX_MONTHS",
-        "ytd": "YEAR_TO_DATE",
-        "1y": "ONE_YEAR",
-        "all": "MAX"
-    }
-    
-    # Map granularity to Artemis granularity ID
-    granularity_map = {
-        "1d": "DAY",
-        "1w": "WEEK",
-        "1m": "MONTH"
-    }
-    
-    # Map metric to Artemis metric ID
-    metric_map = {
-        "price": "PRICE",
-        "volume": "VOLUME",
-        "tvl": "TVL",
-        "fees": "FEES",
-        "revenue": "REVENUE",
-        "mc": "MC",
-        "txns": "TXNS",
-        "daa": "DAA",
-        "dau": "DAU",
-        "fdmc": "FDMC",
-        "borrows": "BORROWS",
-        "deposits": "DEPOSITS"
-    }
+    logger.info(f"Building chart config for metrics: {metrics}, tickers: {tickers}, asset_type: {asset_type}")
     
     # Get the Artemis time period ID
-    artemis_period = period_map.get(time_period.lower())
+    artemis_period = PERIOD_MAP.get(time_period.lower())
     if not artemis_period:
         raise ValueError(f"Invalid time period: {time_period}")
     
     # Get the Artemis granularity ID
-    artemis_granularity = granularity_map.get(granularity.lower())
+    artemis_granularity = GRANULARITY_MAP.get(granularity.lower())
     if not artemis_granularity:
         raise ValueError(f"Invalid granularity: {granularity}")
     
-    # Get asset names for display
-    asset_names = []
+    # Resolve each asset once; the series below reuse these for every metric
+    asset_index = get_asset_index()
+    asset_infos = []
     for ticker in tickers:
-        logger.info(f"Looking up asset info for ticker: {ticker}")
-        asset_info = get_asset_by_id(ticker) or get_asset_by_symbol(ticker)
-        logger.info(f"Asset info result: {asset_info}")
+        asset_info = asset_index.by_id(ticker) or asset_index.by_symbol(ticker)
         if not asset_info:
             raise ValueError(f"Unknown asset: {ticker}")
-        asset_names.append(asset_info.get("name", ticker.capitalize()))
+        asset_infos.append(asset_info)
     
-    # Create a readable title
-    metric_display = {
-        "price": "Price",
-        "volume": "Volume",
-        "tvl": "TVL",
-        "fees": "Fees",
-        "revenue": "Revenue",
-        "mc": "Market Cap",
-        "txns": "Transactions",
-        "daa": "Daily Active Addresses",
-        "dau": "Daily Active Users",
-        "fdmc": "Fully Diluted Market Cap"
-    }
-    
-    time_period_display = {
-        "1w": "1 Week",
-        "mtd": "Month to Date",
-        "1m": "1 Month",
-        "3m": "3 Months",
-        "6m": "6 Months",
-        "ytd": "Year to Date",
-        "1y": "1 Year",
-        "all": "All Time"
-    }.get(time_period, time_period)
+    # Get asset names for display
+    asset_names = [asset_info.get("name", ticker.capitalize()) for ticker, asset_info in zip(tickers, asset_infos)]
     
-    granularity_display = {
-        "1d": "Daily",
-        "1w": "Weekly",
-        "1m": "Monthly"
-    }.get(granularity, granularity)
-    
-    # Create title with multiple metrics
-    metric_displays = [metric_display.get(metric, metric.capitalize()) for metric in metrics]
-    title = f"{' vs '.join(metric_displays)} - {'/'.join(asset_names)} ({time_period_display}, {granularity_display})"
-    if is_percentage:
-        title += " (%)"
+    title = chart_title(metrics, asset_names, time_period, granularity, is_percentage)
     
     # Build the chart configuration
     chart_config = {
@@ -129,20 +148,12 @@ def build_chart_url(metrics: List[str], tickers: List[str], asset_type: str, tim
     }
     
     # Add assets to series for each metric
-    colors = ["#8A88FF", "#EFCE6C", "#FF6B6B", "#4ECDC4", "#45B7D1"]  # Different colors for each metric
-    
     for i, metric in enumerate(metrics):
-        artemis_metric = metric_map.get(metric.lower())
+        artemis_metric = METRIC_MAP.get(metric.lower())
         if not artemis_metric:
             raise ValueError(f"Invalid metric: {metric}")
             
-        for ticker in tickers:
-            logger.info(f"Looking up asset info for series: {ticker}")
-            asset_info = get_asset_by_id(ticker) or get_asset_by_symbol(ticker)
-            logger.info(f"Asset info result for series: {asset_info}")
-            if not asset_info:
-                raise ValueError(f"Unknown asset: {ticker}")
-                
+        for ticker, asset_info in zip(tickers, asset_infos):
             # Use the asset type from the asset info if available, otherwise use the provided type
             asset_type_to_use = asset_info.get("type", asset_type).upper()
             
@@ -164,15 +175,63 @@ def build_chart_url(metrics: List[str], tickers: List[str], asset_type: str, tim
                     "units": "PERCENTAGE" if is_percentage else "RAW",
                     "visible": True,
                     "showInLegend": True,
-                    "color": colors[i % len(colors)],
+                    "color": SERIES_COLORS[i % len(SERIES_COLORS)],
                     "yAxis": i  # Different y-axis for each metric
                 }
             }
             chart_config["series"].append(series_item)
     
+    return chart_config
+
+def build_chart_url(metrics: List[str], tickers: List[str], asset_type: str, time_period: str, granularity: str, is_percentage: bool = False) -> str:
+    """
+    Build a chart URL for the Artemis Analytics platform.
+    
+    Args:
+        metrics: List of metrics to chart (e.g., ['price', 'volume', 'tvl'])
+        tickers: List of asset tickers to include
+        asset_type: The type of asset (e.g., 'chain', 'application')
+        time_period: The time period for the chart (e.g., '1w', '1m', '1y')
+        granularity: The granularity of the data (e.g., '1d', '1w', '1m')
+        is_percentage: Whether to display as percentages
+        
+    Returns:
+        The complete chart URL
+    """
+    chart_config = build_chart_config(metrics, tickers, asset_type, time_period, granularity, is_percentage)
+    return chart_config_url(chart_config)
+
+
+def chart_config_url(chart_config: Dict) -> str:
+    """Encode a chart configuration into a chart-builder URL."""
     # Encode the configuration as a URL-safe JSON string
     encoded_config = urllib.parse.quote(json.dumps(chart_config))
-    url = f"https://app.artemisanalytics.com/chart-builder/{encoded_config}"
+    url = f"{CHART_BUILDER_URL.rstrip('/')}/{encoded_config}"
     
     logger.info(f"Generated URL: {url}")
     return url
+
+
+def chart_spec_key(metrics: List[str], tickers: List[str], time_period: str, granularity: str, is_percentage: bool = False) -> str:
+    """
+    Build a content address for a chart from its canonical specification.
+    
+    Args:
+        metrics: List of metrics to chart
+        tickers: List of asset tickers
+        time_period: The time period for the chart
+        granularity: The granularity of the data
+        is_percentage: Whether to display as percentages
+        
+    Returns:
+        A hex SHA-256 digest that is identical for identical chart specifications
+    """
+    spec = {
+        "metrics": [metric.lower() for metric in metrics],
+        "tickers": [ticker.lower() for ticker in tickers],
+        "period": time_period.lower(),
+        "granularity": granularity.lower(),
+        "percentage": bool(is_percentage)
+    }
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,185 @@
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from artemisbot.chart.chart_generator import ChartGenerator
+from artemisbot.chart.chart_spec import ChartSpec
+from artemisbot.chart.popularity import PopularChart, PopularityTracker
+from artemisbot.chart.scheduler import LOW, ChartScheduler
+from artemisbot.chart.screenshot import SCREENSHOT_CACHE
+from artemisbot.utils.metrics import track_stage
+from config import (
+    CHART_WARMER_INTERVAL,
+    CHART_WARMER_TOP_N,
+    CHART_WARMER_MIN_SCORE,
+    CHART_WARMER_LEAD_TIME,
+    CHART_WARMER_MAX_RENDERS,
+    CHART_WARMER_CONCURRENCY,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Scheduler chat ID of warming renders, which take turns with user chats in the low lane
+WARMER_CHAT_ID = "chart-warmer"
+
+# Render queue priority of warming renders; user renders use 1 and lower runs first
+WARM_PRIORITY = 2
+
+
+class ChartWarmer:
+    """
+    Re-renders the most requested charts before their cached copies expire.
+
+    Each pass takes the top charts from the popularity tracker and renders
+    those that are not cached, or whose cached copy expires within lead_time
+    seconds, so the next request for them is a cache hit. Renders share the
+    chart generator's workers with user requests, so a pass is bounded: at
+    most max_renders charts, concurrency at a time, and none while user
+    charts are waiting in the scheduler. Renders go through the scheduler's
+    low lane, so they count towards its concurrency cap. With the queue
+    backend they go to the render workers behind user jobs, and the workers
+    replace their cached copies too.
+    """
+
+    def __init__(self, generator: ChartGenerator, tracker: PopularityTracker,
+                 scheduler: Optional[ChartScheduler] = None,
+                 top_n: int = CHART_WARMER_TOP_N, min_score: float = CHART_WARMER_MIN_SCORE,
+                 lead_time: float = CHART_WARMER_LEAD_TIME, max_renders: int = CHART_WARMER_MAX_RENDERS,
+                 concurrency: int = CHART_WARMER_CONCURRENCY):
+        """
+        Initialize the ChartWarmer.
+
+        Args:
+            generator: Chart generator whose cache is kept warm
+            tracker: Source of the most requested charts
+            scheduler: User chart scheduler; renders take its slots and are deferred while it has a queue
+            top_n: Number of most requested charts kept warm
+            min_score: Decayed request count a chart needs to be kept warm
+            lead_time: Re-render charts whose cached copy expires within this many seconds
+            max_renders: Maximum charts rendered per pass
+            concurrency: Maximum charts rendered at once
+        """
+        self.generator = generator
+        self.tracker = tracker
+        self.scheduler = scheduler
+        self.top_n = top_n
+        self.min_score = min_score
+        self.lead_time = lead_time
+        self.max_renders = max_renders
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._queued = 0  # warming renders waiting in the scheduler
+
+        # Counters
+        self.passes = 0
+        self.renders = 0
+        self.refreshes = 0
+        self.failures = 0
+        self.deferred = 0
+        self.last_pass_seconds = 0.0
+
+    def _cached_ttl(self, spec: ChartSpec) -> Optional[float]:
+        """Seconds until the cached render of spec expires, or None if it is not cached."""
+        remaining = [ttl for ttl in (SCREENSHOT_CACHE.ttl_remaining(spec.cache_key),
+                                     SCREENSHOT_CACHE.ttl_remaining("native:" + spec.cache_key))
+                     if ttl is not None]
+        return max(remaining) if remaining else None
+
+    def _users_waiting(self) -> bool:
+        return self.scheduler is not None and sum(self.scheduler.queue_depth().values()) > self._queued
+
+    def due(self) -> List[Tuple[PopularChart, Optional[float]]]:
+        """
+        Return the popular charts to render this pass, most popular first.
+
+        Returns:
+            Up to max_renders (chart, seconds until its cached copy expires) pairs;
+            the time is None for charts that are not cached at all
+        """
+        due = []
+        for chart in self.tracker.top(self.top_n, self.min_score):
+            ttl = self._cached_ttl(chart.spec)
+            if ttl is None or ttl <= self.lead_time:
+                due.append((chart, ttl))
+            if len(due) >= self.max_renders:
+                break
+        return due
+
+    async def _warm(self, chart: PopularChart, ttl: Optional[float]) -> None:
+        async with self._semaphore:
+            if self._users_waiting():
+                self.deferred += 1
+                return
+            try:
+                with track_stage("warm_render"):
+                    await self._render(chart.spec, refresh=ttl is not None)
+                self.renders += 1
+                if ttl is not None:
+                    self.refreshes += 1
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Could not warm chart {chart.spec.cache_key}: {str(e)}")
+
+    async def _render(self, spec: ChartSpec, refresh: bool) -> None:
+        """Render a chart, in a scheduler slot if there is a scheduler."""
+        async def render() -> None:
+            # Expiring copies are replaced; missing ones may still come from the disk cache
+            await self.generator.render_chart_async(*spec.as_args(), refresh=refresh, priority=WARM_PRIORITY)
+
+        if self.scheduler is None:
+            return await render()
+
+        started = False
+
+        async def in_slot() -> None:
+            nonlocal started
+            started = True
+            self._queued -= 1
+            await render()
+
+        self._queued += 1
+        try:
+            await self.scheduler.run(in_slot, WARMER_CHAT_ID, LOW)
+        finally:
+            if not started:
+                self._queued -= 1
+
+    async def warm_once(self) -> int:
+        """
+        Run one warming pass.
+
+        Returns:
+            Number of charts rendered
+        """
+        started = time.monotonic()
+        renders = self.renders
+        self.passes += 1
+        if self._users_waiting():
+            self.deferred += 1
+            return 0
+        await asyncio.gather(*(self._warm(chart, ttl) for chart, ttl in self.due()))
+        self.last_pass_seconds = time.monotonic() - started
+        if self.renders > renders:
+            logger.info(f"Warmed {self.renders - renders} popular charts in {self.last_pass_seconds:.1f}s")
+        return self.renders - renders
+
+    async def run(self, interval: float = CHART_WARMER_INTERVAL) -> None:
+        """Run a warming pass every interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.warm_once()
+            except Exception as e:
+                logger.error(f"Chart warming pass failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pass and render counters."""
+        return {
+            "passes": self.passes,
+            "renders": self.renders,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "deferred": self.deferred,
+            "last_pass_seconds": self.last_pass_seconds,
+        }
@@ -0,0 +1,280 @@
+import random
+import asyncio
+import logging
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+import httpx
+from artemisbot.data.series import Series
+from artemisbot.data.series_cache import CachedSeries, SeriesCache, SeriesKey, get_series_store, series_key
+from artemisbot.data.timeseries import Points, bucket_start, resample
+from artemisbot.utils.metrics import REGISTRY
+from artemisbot.utils.singleflight import SingleFlight
+from config import (
+    ARTEMIS_API_KEY,
+    ARTEMIS_API_BASE_URL,
+    ARTEMIS_API_TIMEOUT,
+    ARTEMIS_API_MAX_CONNECTIONS,
+    ARTEMIS_API_MAX_RETRIES,
+    ARTEMIS_API_BACKOFF,
+    NATIVE_DATA_SOURCE
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Map Artemis metric ID to the metric name used by the data API
+API_METRIC_NAMES: Dict[str, str] = {
+    "PRICE": "price",
+    "VOLUME": "24h_volume",
+    "TVL": "tvl",
+    "FEES": "fees",
+    "REVENUE": "revenue",
+    "MC": "mc",
+    "TXNS": "txns",
+    "DAA": "daa",
+    "DAU": "dau",
+    "FDMC": "fdmc",
+    "BORROWS": "borrows",
+    "DEPOSITS": "deposits"
+}
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_BACKOFF = 10.0  # seconds
+
+
+class ArtemisDataClient:
+    """
+    Fetches metric time series from the Artemis data API.
+
+    Requests share one keep-alive connection pool and are retried with
+    exponential backoff on connection errors, rate limiting and 5xx responses.
+    Series are cached per (asset, metric, granularity) in a SeriesCache, so
+    every time period is sliced from one fetch and refreshes only request the
+    days since the last cached point. Concurrent fetches of the same series
+    coalesce, so native rendering, statistics and prefetching share a request.
+    """
+
+    def __init__(self, api_key: Optional[str] = ARTEMIS_API_KEY, base_url: str = ARTEMIS_API_BASE_URL,
+                 timeout: float = ARTEMIS_API_TIMEOUT, max_connections: int = ARTEMIS_API_MAX_CONNECTIONS,
+                 max_retries: int = ARTEMIS_API_MAX_RETRIES, backoff: float = ARTEMIS_API_BACKOFF,
+                 cache: Optional[SeriesCache] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initialize the ArtemisDataClient.
+
+        Args:
+            api_key: Artemis API key
+            base_url: Base URL of the data API (point at a local stub in tests)
+            timeout: Request timeout in seconds
+            max_connections: Size of the keep-alive connection pool
+            max_retries: Retries after the first attempt of a request
+            backoff: Seconds before the first retry, doubled on each further retry
+            cache: Series store (defaults to the process-wide store)
+            transport: Optional httpx transport, e.g. httpx.MockTransport in tests
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cache = cache if cache is not None else get_series_store()
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30.0
+        )
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight = SingleFlight("series fetch")
+
+        # Counters
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # Connections belong to the loop that opened them, so a new loop needs a new pool
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self._limits,
+                transport=self._transport
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def fetch_series(self, artemis_id: str, metric: str, granularity: str, start: date, end: date) -> Points:
+        """
+        Fetch points for an asset metric between start and end (inclusive).
+
+        Args:
+            artemis_id: Artemis asset ID
+            metric: Artemis metric ID (e.g., 'PRICE')
+            granularity: The granularity of the data ('1d', '1w' or '1m')
+            start: First day to fetch
+            end: Last day to fetch
+
+        Returns:
+            Points in ascending date order at the requested granularity
+
+        Raises:
+            ValueError: If the metric is unknown or the API returns an error
+        """
+        series = await self.get_series(artemis_id, metric, granularity, start, end)
+        return series.to_points()
+
+    async def get_series(self, artemis_id: str, metric: str, granularity: str, start: date, end: date) -> Series:
+        """
+        Like fetch_series, but return a zero-copy view of the stored series arrays.
+
+        Raises:
+            ValueError: If the metric is unknown or the API returns an error
+        """
+        key = series_key(artemis_id, metric, granularity)
+        self.cache.record_request(start, end)
+        series = self.cache.get(key, start, end)
+        if series is not None:
+            return series
+
+        # Fetch from the start of the first bucket so coarse buckets are complete
+        fetch_start = bucket_start(start, granularity)
+        for _ in range(3):
+            merged = await self._inflight.do(key, lambda: self._fill(key, fetch_start, end))
+            if merged.start <= fetch_start and end <= merged.end:
+                break
+            # We joined a fill for a narrower window, so fill again for ours
+        return merged.series.window(start, end)
+
+    async def _fill(self, key: SeriesKey, start: date, end: date) -> CachedSeries:
+        """Fetch the parts of start..end missing from the store and merge them in."""
+        windows = self.cache.missing_windows(key, start, end)
+        if not windows:
+            return self.cache.peek(key)
+
+        artemis_id, metric, granularity = key
+        results = await asyncio.gather(*[
+            self._request_series(artemis_id, metric, granularity, window_start, window_end)
+            for window_start, window_end in windows
+        ])
+        if len(windows) > 1 or windows[0] != (start, end):
+            logger.info(f"Incremental fetch for {artemis_id}/{metric}/{granularity}: {windows}")
+        return self.cache.merge(
+            key,
+            [(window, Series.from_points(artemis_id, metric, granularity, points))
+             for window, (points, _) in zip(windows, results)],
+            downloaded_bytes=sum(size for _, size in results)
+        )
+
+    async def _request_series(self, artemis_id: str, metric: str, granularity: str,
+                              start: date, end: date) -> Tuple[Points, int]:
+        """Request a series from the API and return its points and the response size."""
+        metric_name = API_METRIC_NAMES[metric]
+        params = {
+            "symbols": artemis_id,
+            "startDate": start.isoformat(),
+            "endDate": end.isoformat(),
+            "APIKey": self.api_key or ""
+        }
+        resp = await self._get(f"/data/{metric_name}/", params)
+        points = resample(parse_series(resp.json(), artemis_id, metric_name), granularity, metric)
+        return points, len(resp.content)
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> httpx.Response:
+        """
+        GET a path from the API with retries and exponential backoff.
+
+        Raises:
+            ValueError: If the request still fails after all retries
+        """
+        client = self._get_client()
+        for attempt in range(self.max_retries + 1):
+            self.requests += 1
+            retry_after = None
+            try:
+                resp = await client.get(path, params=params)
+                if resp.status_code not in RETRY_STATUS_CODES:
+                    resp.raise_for_status()
+                    return resp
+                error = f"HTTP {resp.status_code}"
+                retry_after = resp.headers.get("Retry-After")
+            except httpx.HTTPStatusError as e:
+                self.failures += 1
+                raise ValueError(f"Artemis data request failed: {str(e)}")
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {str(e)}"
+
+            if attempt == self.max_retries:
+                break
+            delay = min(MAX_BACKOFF, self.backoff * 2 ** attempt) * (0.5 + random.random() / 2)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, min(MAX_BACKOFF, float(retry_after)))
+            self.retries += 1
+            logger.warning(f"Artemis data request {path} failed ({error}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+        self.failures += 1
+        raise ValueError(f"Artemis data request failed after {self.max_retries + 1} attempts: {error}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request, retry and failure counts along with cache and coalescing stats."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "cache": self.cache.stats(),
+            "inflight": self._inflight.stats(),
+        }
+
+
+def parse_series(payload: Dict, artemis_id: str, metric_name: str) -> Points:
+    """Extract (day, value) points for one asset metric from a data API response."""
+    data = payload.get("data", {})
+    assets = data.get("symbols") or data.get("artemis_ids") or {}
+    rows = (assets.get(artemis_id) or {}).get(metric_name) or []
+    if isinstance(rows, str):
+        # The API reports per-asset errors as strings
+        logger.warning(f"Artemis data API error for {artemis_id}/{metric_name}: {rows}")
+        return []
+
+    points = []
+    for row in rows:
+        value = row.get("val")
+        if value is None:
+            continue
+        points.append((date.fromisoformat(row["date"][:10]), float(value)))
+    points.sort()
+    return points
+
+
+_source = None
+
+
+def get_series_source():
+    """Return the process-wide series source selected by NATIVE_DATA_SOURCE."""
+    global _source
+    if _source is None:
+        if NATIVE_DATA_SOURCE == "fake":
+            from artemisbot.data.fake_source import FakeSeriesSource
+            _source = FakeSeriesSource()
+        else:
+            _source = ArtemisDataClient()
+            REGISTRY.register_collector("data_client", _source.stats)
+    return _source
+
+
+async def close_series_source() -> None:
+    """Close the process-wide series source's connections, if it has any."""
+    if _source is not None and hasattr(_source, "aclose"):
+        await _source.aclose()
@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import math
+import random
+from datetime import date, timedelta
+from artemisbot.data.series import Series
+from artemisbot.data.timeseries import Points, resample
+
+# Typical magnitude of each metric, so fake charts look plausible
+_BASELINES = {
+    "PRICE": 100.0,
+    "VOLUME": 5e8,
+    "TVL": 2e9,
+    "FEES": 1e6,
+    "REVENUE": 4e5,
+    "MC": 5e10,
+    "TXNS": 2e6,
+    "DAA": 3e5,
+    "DAU": 3e5,
+    "FDMC": 8e10,
+    "BORROWS": 1e9,
+    "DEPOSITS": 3e9
+}
+
+
+class FakeSeriesSource:
+    """
+    A deterministic, offline stand-in for the Artemis data API.
+
+    Every (asset, metric) pair yields the same random-walk series on every call,
+    so charts and statistics built from it are reproducible in tests and
+    benchmarks without network access or an API key.
+    """
+
+    def __init__(self, latency: float = 0.0, history_days: int = 3 * 365):
+        """
+        Initialize the FakeSeriesSource.
+
+        Args:
+            latency: Seconds to sleep per fetch, to simulate network time
+            history_days: Number of days of history before today
+        """
+        self.latency = latency
+        self.history_days = history_days
+        self.fetches = 0
+
+    async def fetch_series(self, artemis_id: str, metric: str, granularity: str, start: date, end: date) -> Points:
+        """
+        Return points for an asset metric between start and end (inclusive).
+
+        Args:
+            artemis_id: Artemis asset ID
+            metric: Artemis metric ID (e.g., 'PRICE')
+            granularity: The granularity of the data ('1d', '1w' or '1m')
+            start: First day to return
+            end: Last day to return
+        """
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.fetches += 1
+
+        seed = int(hashlib.sha256(f"{artemis_id}:{metric}".encode()).hexdigest()[:8], 16)
+        rng = random.Random(seed)
+        base = _BASELINES.get(metric.upper(), 1000.0) * (0.5 + rng.random())
+        first_day = date.today() - timedelta(days=self.history_days)
+
+        points = []
+        value = base
+        day = first_day
+        while day <= end:
+            # Gentle drift, noise and a weekly cycle
+            value *= math.exp(rng.gauss(0.0005, 0.03))
+            weekly = 1 + 0.05 * math.sin(2 * math.pi * day.toordinal() / 7)
+            if day >= start:
+                points.append((day, value * weekly))
+            day += timedelta(days=1)
+        return resample(points, granularity, metric)
+
+    async def get_series(self, artemis_id: str, metric: str, granularity: str, start: date, end: date) -> Series:
+        """Like fetch_series, but return the points as a NumPy-backed Series."""
+        points = await self.fetch_series(artemis_id, metric, granularity, start, end)
+        return Series.from_points(artemis_id, metric.upper(), granularity, points)
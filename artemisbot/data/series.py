@@ -0,0 +1,98 @@
+from datetime import date
+from typing import Optional
+import numpy as np
+from artemisbot.data.timeseries import Points, bucket_start
+
+# Dates are stored as whole days
+DATE_DTYPE = "datetime64[D]"
+
+
+def _day(value: date) -> np.datetime64:
+    return np.datetime64(value, "D")
+
+
+class Series:
+    """
+    A compact time series for one asset metric.
+
+    Dates and values live in two contiguous NumPy arrays (datetime64[D] and
+    float64, 16 bytes per point) instead of a list of tuples, and window()
+    returns views that share those arrays rather than copies. Metadata is kept
+    in __slots__ so thousands of series carry no per-instance dict.
+    """
+
+    __slots__ = ("asset_id", "metric", "granularity", "dates", "values")
+
+    def __init__(self, asset_id: str, metric: str, granularity: str, dates: np.ndarray, values: np.ndarray):
+        """
+        Initialize the Series.
+
+        Args:
+            asset_id: Artemis asset ID (as in the asset mappings)
+            metric: Artemis metric ID (e.g., 'PRICE', see url_builder.METRIC_MAP)
+            granularity: The granularity of the data ('1d', '1w' or '1m')
+            dates: Ascending datetime64[D] array
+            values: float64 array of the same length
+        """
+        self.asset_id = asset_id
+        self.metric = metric
+        self.granularity = granularity
+        self.dates = dates
+        self.values = values
+
+    @classmethod
+    def from_points(cls, asset_id: str, metric: str, granularity: str, points: Points) -> "Series":
+        """Build a series from (day, value) points in ascending date order."""
+        dates = np.array([day for day, _ in points], dtype=DATE_DTYPE)
+        values = np.array([value for _, value in points], dtype=np.float64)
+        return cls(asset_id, metric, granularity, dates, values)
+
+    def to_points(self) -> Points:
+        """Return the series as a list of (day, value) points."""
+        return list(zip(self.dates.tolist(), self.values.tolist()))
+
+    @property
+    def first_date(self) -> Optional[date]:
+        return self.dates[0].item() if len(self.dates) else None
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return self.dates[-1].item() if len(self.dates) else None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the date and value arrays."""
+        return self.dates.nbytes + self.values.nbytes
+
+    def window(self, start: date, end: date) -> "Series":
+        """
+        Return a zero-copy view of the points between start and end (inclusive).
+
+        Points are dated at the start of their bucket, so the bucket containing
+        start is kept even when it begins before start.
+        """
+        lo = np.searchsorted(self.dates, _day(bucket_start(start, self.granularity)), side="left")
+        hi = np.searchsorted(self.dates, _day(end), side="right")
+        return Series(self.asset_id, self.metric, self.granularity, self.dates[lo:hi], self.values[lo:hi])
+
+    def replace_window(self, start: date, end: date, other: "Series") -> "Series":
+        """
+        Return a new series with the points between start and end replaced by other.
+
+        Args:
+            start: First day of the replaced window
+            end: Last day of the replaced window
+            other: Points fetched for that window
+        """
+        keep = (self.dates < _day(start)) | (self.dates > _day(end))
+        dates = np.concatenate((self.dates[keep], other.dates))
+        values = np.concatenate((self.values[keep], other.values))
+        order = np.argsort(dates, kind="stable")
+        return Series(self.asset_id, self.metric, self.granularity, dates[order], values[order])
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return (f"Series({self.asset_id}/{self.metric}/{self.granularity}, {len(self)} points, "
+                f"{self.first_date}..{self.last_date})")
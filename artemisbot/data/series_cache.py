@@ -0,0 +1,229 @@
+import time
+import logging
+import threading
+from datetime import date, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from artemisbot.chart.url_builder import METRIC_MAP
+from artemisbot.data.series import Series
+from artemisbot.data.timeseries import bucket_start
+from artemisbot.utils.cache import LRUCache
+from artemisbot.utils.metrics import REGISTRY
+from config import SERIES_CACHE_MAX_BYTES, SERIES_CACHE_TTL
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# A date window as inclusive (start, end) days
+Window = Tuple[date, date]
+
+# A series key: (Artemis asset ID, Artemis metric ID, granularity)
+SeriesKey = Tuple[str, str, str]
+
+# Fixed overhead of a cache entry besides its arrays
+ENTRY_OVERHEAD = 400
+
+
+class CachedSeries(NamedTuple):
+    """The widest window fetched so far for one series."""
+    start: date
+    end: date
+    series: Series
+    fetched_at: float  # monotonic time the latest points were fetched
+
+
+def _cached_series_sizeof(entry: CachedSeries) -> int:
+    return entry.series.nbytes + ENTRY_OVERHEAD
+
+
+def series_key(asset_id: str, metric: str, granularity: str) -> SeriesKey:
+    """
+    Build the store key for an asset metric series.
+
+    Args:
+        asset_id: Artemis asset ID, as in the asset mappings
+        metric: Metric name or Artemis metric ID (e.g., 'fees' or 'FEES')
+        granularity: The granularity of the data ('1d', '1w' or '1m')
+
+    Raises:
+        ValueError: If the metric is unknown
+    """
+    metric_id = METRIC_MAP.get(metric.lower())
+    if not metric_id:
+        raise ValueError(f"Invalid metric: {metric}")
+    return (asset_id, metric_id, granularity)
+
+
+class SeriesCache:
+    """
+    Byte-accounted store of the longest window fetched per (asset, metric, granularity).
+
+    Every chart time period is a window over the same series, so one superset
+    fetch serves all shorter periods by slicing. Missing history before the
+    cached window is fetched on its own, and once the latest points are older
+    than refresh_after (or a new day starts) only the days from the last cached
+    point onward are fetched again and appended. Series are NumPy-backed and
+    accounted by their array sizes, and the least recently used are evicted
+    once the store exceeds its budget.
+    """
+
+    def __init__(self, max_bytes: int, refresh_after: float, name: str = "series"):
+        """
+        Initialize the SeriesCache.
+
+        Args:
+            max_bytes: Memory budget for all cached series arrays
+            refresh_after: Seconds before the latest points of a series are refetched
+            name: Name used in log messages
+        """
+        self.refresh_after = refresh_after
+        # Entries never expire; stale tails are refreshed incrementally instead
+        self._cache = LRUCache(max_bytes, sizeof=_cached_series_sizeof, name=name)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        # Counters; lookups are counted here rather than in the LRU, which is also read internally
+        self.lookups = 0
+        self.fetches_avoided = 0
+        self.partial_fetches = 0
+        self.full_fetches = 0
+        self.days_requested = 0
+        self.days_fetched = 0
+        self.bytes_downloaded = 0
+
+    def missing_windows(self, key: SeriesKey, start: date, end: date) -> List[Window]:
+        """
+        Return the windows that must be fetched to serve start..end for key.
+
+        Args:
+            key: Series key, (asset, metric, granularity)
+            start: First day needed (aligned to the start of its bucket)
+            end: Last day needed
+
+        Returns:
+            Windows to fetch, empty if the cached series already covers the request
+        """
+        return self._missing(self._cache.peek(key), start, end)
+
+    def _missing(self, cached: Optional[CachedSeries], start: date, end: date) -> List[Window]:
+        if cached is None:
+            return [(start, end)]
+
+        windows = []
+        if start < cached.start:
+            windows.append((start, cached.start - timedelta(days=1)))
+        stale = time.monotonic() - cached.fetched_at >= self.refresh_after
+        if end > cached.end or stale:
+            # The last point's bucket may still be filling in, so fetch it again
+            tail_start = cached.series.last_date or cached.start
+            windows.append((tail_start, max(end, cached.end)))
+        return windows
+
+    def peek(self, key: SeriesKey) -> Optional[CachedSeries]:
+        """Return the cached series for key, or None."""
+        return self._cache.peek(key)
+
+    def get(self, key: SeriesKey, start: date, end: date) -> Optional[Series]:
+        """
+        Return a view of the cached series for start..end, or None if any part must be fetched.
+
+        Args:
+            key: Series key, (asset, metric, granularity)
+            start: First day of the window
+            end: Last day of the window
+        """
+        cached = self._cache.peek(key)
+        hit = cached is not None and not self._missing(cached, bucket_start(start, key[2]), end)
+        with self._lock:
+            self.lookups += 1
+            if hit:
+                self.fetches_avoided += 1
+        return cached.series.window(start, end) if hit else None
+
+    def merge(self, key: SeriesKey, fetched: List[Tuple[Window, Series]], downloaded_bytes: int = 0) -> CachedSeries:
+        """
+        Merge freshly fetched windows into the cached series for key.
+
+        Args:
+            key: Series key, (asset, metric, granularity)
+            fetched: (window, series) pairs as returned for missing_windows
+            downloaded_bytes: Size of the responses that produced the points
+
+        Returns:
+            The updated cached series
+        """
+        cached = self._cache.peek(key)
+        now = time.monotonic()
+        if cached is None:
+            # Nothing cached, or evicted since missing_windows: combine every fetched window
+            (start, end), series = fetched[0]
+            for (window_start, window_end), window_series in fetched[1:]:
+                series = series.replace_window(window_start, window_end, window_series)
+                start = min(start, window_start)
+                end = max(end, window_end)
+            merged = CachedSeries(start, end, series, now)
+        else:
+            start, end, series, fetched_at = cached
+            for (window_start, window_end), window_series in fetched:
+                # Fetched points replace cached points in the same window
+                series = series.replace_window(window_start, window_end, window_series)
+                start = min(start, window_start)
+                end = max(end, window_end)
+                if window_end >= cached.end:
+                    fetched_at = now
+            merged = CachedSeries(start, end, series, fetched_at)
+        self._cache.set(key, merged)
+
+        fetched_days = sum((window_end - window_start).days + 1 for (window_start, window_end), _ in fetched)
+        with self._lock:
+            if cached is None:
+                self.full_fetches += 1
+            else:
+                self.partial_fetches += 1
+            self.days_fetched += fetched_days
+            self.bytes_downloaded += downloaded_bytes
+        return merged
+
+    def record_request(self, start: date, end: date) -> None:
+        """Count the days a caller asked for, to estimate bytes saved."""
+        with self._lock:
+            self.days_requested += (end - start).days + 1
+
+    def clear(self) -> None:
+        """Remove all cached series."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return fetch and memory stats, including estimated bytes saved."""
+        with self._lock:
+            bytes_per_day = self.bytes_downloaded / self.days_fetched if self.days_fetched else 0.0
+            days_saved = max(0, self.days_requested - self.days_fetched)
+            stats = {
+                "lookups": self.lookups,
+                "fetches_avoided": self.fetches_avoided,
+                "hit_rate": self.fetches_avoided / self.lookups if self.lookups else 0.0,
+                "partial_fetches": self.partial_fetches,
+                "full_fetches": self.full_fetches,
+                "days_requested": self.days_requested,
+                "days_fetched": self.days_fetched,
+                "bytes_downloaded": self.bytes_downloaded,
+                "bytes_saved": int(days_saved * bytes_per_day),
+            }
+        memory = self._cache.stats()
+        for counter in ("hits", "misses", "hit_rate"):
+            # Always zero: the store reads its LRU with peek and counts lookups itself
+            memory.pop(counter)
+        stats["memory"] = memory
+        return stats
+
+
+_store = None
+
+
+def get_series_store() -> SeriesCache:
+    """Return the process-wide series store."""
+    global _store
+    if _store is None:
+        _store = SeriesCache(SERIES_CACHE_MAX_BYTES, SERIES_CACHE_TTL)
+        REGISTRY.register_collector("series_store", _store.stats)
+    return _store
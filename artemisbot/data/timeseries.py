@@ -0,0 +1,108 @@
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+# A time series as (day, value) points in ascending date order
+Points = List[Tuple[date, float]]
+
+# Earliest day fetched for "all" time charts
+EARLIEST_DATE = date(2015, 1, 1)
+
+# Metrics that are flows over a day and add up when resampled to coarser granularity
+FLOW_METRICS = {"VOLUME", "FEES", "REVENUE", "TXNS"}
+
+# Metrics that count activity and are averaged when resampled
+ACTIVITY_METRICS = {"DAA", "DAU"}
+
+
+def period_window(time_period: str, today: Optional[date] = None) -> Tuple[date, date]:
+    """
+    Return the (start, end) dates covered by a chart time period.
+
+    Args:
+        time_period: The time period for the chart (e.g., '1w', 'ytd', 'all')
+        today: End of the window (defaults to today)
+
+    Returns:
+        Tuple of inclusive start and end dates
+
+    Raises:
+        ValueError: If the time period is invalid
+    """
+    today = today or date.today()
+    starts = {
+        "1w": today - timedelta(days=7),
+        "mtd": today.replace(day=1),
+        "1m": today - timedelta(days=30),
+        "3m": today - timedelta(days=91),
+        "6m": today - timedelta(days=182),
+        "ytd": today.replace(month=1, day=1),
+        "1y": today - timedelta(days=365),
+        "all": EARLIEST_DATE
+    }
+    start = starts.get(time_period.lower())
+    if start is None:
+        raise ValueError(f"Invalid time period: {time_period}")
+    return start, today
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    """Return the first day of the granularity bucket containing day."""
+    if granularity == "1w":
+        return day - timedelta(days=day.weekday())
+    if granularity == "1m":
+        return day.replace(day=1)
+    return day
+
+
+def slice_points(points: Points, start: date, end: date, granularity: str = "1d") -> Points:
+    """
+    Return the points of a series that fall in a date window.
+
+    Points are dated at the start of their bucket, so the bucket containing
+    start is kept even when it begins before start.
+
+    Args:
+        points: Points in ascending date order at the given granularity
+        start: First day of the window
+        end: Last day of the window
+        granularity: The granularity of the points ('1d', '1w' or '1m')
+
+    Returns:
+        The points inside the window
+    """
+    first = bucket_start(start, granularity)
+    return [(day, value) for day, value in points if first <= day <= end]
+
+
+def resample(points: Points, granularity: str, metric: str) -> Points:
+    """
+    Resample daily points to the chart granularity.
+
+    Flow metrics are summed per bucket, activity metrics averaged, and level
+    metrics (price, TVL, market cap...) take the last value in the bucket.
+
+    Args:
+        points: Daily points in ascending date order
+        granularity: The granularity of the data ('1d', '1w' or '1m')
+        metric: Artemis metric ID (e.g., 'PRICE', 'FEES')
+
+    Returns:
+        One point per bucket, dated at the start of the bucket
+    """
+    if granularity == "1d" or not points:
+        return list(points)
+
+    buckets: List[Tuple[date, List[float]]] = []
+    for day, value in points:
+        key = bucket_start(day, granularity)
+        if buckets and buckets[-1][0] == key:
+            buckets[-1][1].append(value)
+        else:
+            buckets.append((key, [value]))
+
+    metric = metric.upper()
+    if metric in FLOW_METRICS:
+        return [(key, sum(values)) for key, values in buckets]
+    if metric in ACTIVITY_METRICS:
+        return [(key, sum(values) / len(values)) for key, values in buckets]
+    return [(key, values[-1]) for key, values in buckets]
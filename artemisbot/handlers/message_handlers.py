@@ -1,66 +1,164 @@
+import asyncio
 from typing import List
 from telegram import Update, Message, Bot
 from telegram.ext import ContextTypes
+from telegram.error import BadRequest
 from artemisbot.utils.command_parser import parse_command
+from artemisbot.chart.chart_spec import ChartSpec, canonical_metric
 from artemisbot.chart.chart_generator import ChartGenerator
+from artemisbot.chart.chart_analyzer import image_fingerprint
+from artemisbot.chart.popularity import get_popularity_tracker
+from artemisbot.chart.scheduler import ChartScheduler, RateLimitError, HIGH, LOW
+from artemisbot.utils.cache import LRUCache
+from artemisbot.utils.metrics import COMMANDS, REGISTRY, track_stage
 import logging
-from config import BOT_USERNAME
+from config import BOT_USERNAME, PHOTO_FILE_ID_CACHE_TTL, PHOTO_FILE_ID_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
 
 # Initialize ChartGenerator
 chart_generator = ChartGenerator()
 
+# Rate limits and queues chart jobs in front of the generator
+chart_scheduler = ChartScheduler()
+
+# Telegram file_ids of uploaded charts, keyed by the same image fingerprint as the analysis cache;
+# each file_id counts as one unit of the budget, so it holds PHOTO_FILE_ID_CACHE_MAX_ENTRIES of them
+PHOTO_FILE_IDS = LRUCache(
+    max_bytes=PHOTO_FILE_ID_CACHE_MAX_ENTRIES,
+    ttl=PHOTO_FILE_ID_CACHE_TTL,
+    max_entries=PHOTO_FILE_ID_CACHE_MAX_ENTRIES,
+    sizeof=lambda file_id: 1,
+    name="photo file_id"
+)
+
+REGISTRY.register_collector("photo_file_id_cache", PHOTO_FILE_IDS.stats)
+REGISTRY.register_collector("scheduler", chart_scheduler.stats)
+REGISTRY.register_collector("chart_inflight", chart_generator.inflight_stats)
+
+def format_chart_caption(title: str, analysis: str) -> str:
+    """
+    Format a chart caption with its analysis, ensuring it never exceeds Telegram's 1024 character limit.
+    """
+    max_caption_length = 1024
+    base_caption = f"*{title}*\n\n*Summary:* "
+    # Reserve space for base_caption
+    reserved = len(base_caption)
+    max_analysis_length = max_caption_length - reserved
+    safe_analysis = analysis[:max_analysis_length]
+    return f"{base_caption}{safe_analysis}"
+
+
+async def send_chart_photo(update: Update, chart_image: bytes, caption: str) -> Message:
+    """
+    Reply with a chart photo, reusing Telegram's file_id if this exact image was uploaded before.
+    
+    Args:
+        update: Telegram update object
+        chart_image: The chart image as bytes
+        caption: Photo caption (Markdown)
+        
+    Returns:
+        The sent photo message
+    """
+    fingerprint = image_fingerprint(chart_image)
+    file_id = PHOTO_FILE_IDS.get(fingerprint)
+    if file_id:
+        try:
+            with track_stage("telegram_send_cached"):
+                return await update.message.reply_photo(photo=file_id, caption=caption, parse_mode="Markdown")
+        except BadRequest as e:
+            # The file_id is no longer usable, so fall back to uploading the bytes
+            logger.warning(f"Cached file_id rejected, re-uploading chart: {str(e)}")
+            PHOTO_FILE_IDS.delete(fingerprint)
+    
+    with track_stage("telegram_upload"):
+        photo_message = await update.message.reply_photo(photo=chart_image, caption=caption, parse_mode="Markdown")
+    if photo_message.photo:
+        PHOTO_FILE_IDS.set(fingerprint, photo_message.photo[-1].file_id)
+    return photo_message
+
+
 async def process_chart_command(update: Update, context: ContextTypes.DEFAULT_TYPE, 
-                      metrics: List[str], tickers_raw: List[str], asset_type: str, 
-                      time_period: str, granularity: str, is_percentage: bool,
-                      is_group: bool = False) -> None:
+                      spec: ChartSpec, is_group: bool = False) -> None:
     """
     Process a chart command and respond with the appropriate chart.
     
+    The chart is sent as soon as it is rendered; its caption is edited to include the
+    analysis once that arrives, or left as the title if the analysis misses its deadline.
+    Requests over the chat's or user's rate limit are refused, and renders are queued
+    so cached charts and private chats go ahead of uncached group renders.
+    
     Args:
         update: Telegram update object
         context: Telegram context object
-        metrics: List of metrics to chart
-        tickers_raw: List of tickers to chart
-        asset_type: Asset type (CHAIN, APPLICATION, etc.)
-        time_period: Time period for the chart
-        granularity: Data granularity
-        is_percentage: Whether to display as percentages
+        spec: The chart to send, as parsed from the command
         is_group: Whether this is a group chat message
     """
-    status_message = await update.message.reply_text(f"📊 Generating chart for {', '.join(metrics)} of {', '.join(tickers_raw)}... \n\nPlease wait while I fetch the data and analyze it for you.")
+    chat_id = update.effective_chat.id
+    user_id = update.effective_user.id if update.effective_user else None
+    try:
+        chart_scheduler.check(chat_id, user_id)
+    except RateLimitError as e:
+        # Only the first refusal in a row is answered, so a noisy chat is not flooded
+        COMMANDS.labels("chart", "rate_limited").inc()
+        if e.notify:
+            await update.message.reply_text(f"⏳ {str(e)}")
+        return
+    # Counted so the chart warmer keeps the most requested charts cached
+    get_popularity_tracker().record(spec)
+    cached = chart_generator.is_chart_cached(spec.metrics, spec.tickers, spec.time_period, spec.granularity, spec.is_percentage)
+    lane = HIGH if cached or not is_group else LOW
+    
+    status_message = await update.message.reply_text(f"📊 Generating chart for {', '.join(spec.metrics)} of {', '.join(spec.tickers)}... \n\nPlease wait while I fetch the data and analyze it for you.")
     
     try:
-        # Generate chart using ChartGenerator
-        chart_image, chart_url, title, analysis = chart_generator.generate_chart(
-            metrics, tickers_raw, asset_type, time_period, granularity, is_percentage
-        )
-        
-        # Format the caption with the analysis, ensuring it never exceeds Telegram's 1024 character limit
-        max_caption_length = 1024
-        base_caption = f"*{title}*\n\n*Summary:* "
-        # Reserve space for base_caption
-        reserved = len(base_caption)
-        max_analysis_length = max_caption_length - reserved
-        safe_analysis = analysis[:max_analysis_length]
-        caption = f"{base_caption}{safe_analysis}"
-        
-        # Send successful chart with analysis
-        await update.message.reply_photo(
-            photo=chart_image,
-            caption=caption,
-            parse_mode="Markdown"
-        )
-        await status_message.delete()
-        
+        # Render the chart using ChartGenerator, including time queued in the scheduler
+        with track_stage("render_total"):
+            chart_image, chart_url, title = await chart_scheduler.run(
+                lambda: chart_generator.render_chart_async(*spec.as_args()),
+                chat_id,
+                lane
+            )
     except ValueError as e:
+        COMMANDS.labels("chart", "rejected").inc()
         await status_message.delete()
         await update.message.reply_text(str(e))
+        return
     except Exception as e:
+        COMMANDS.labels("chart", "failed").inc()
         await status_message.delete()
         await update.message.reply_text(
             f"❌ Error: {str(e)}\n\n"
             f"Please try again later."
         )
+        return
+    
+    # Start the analysis now so it runs while the photo uploads
+    analysis_task = asyncio.create_task(chart_generator.summarize_chart_async(chart_image, *spec.as_args()))
+    
+    try:
+        # Send the chart as soon as it exists; the summary is added when it arrives
+        photo_message = await send_chart_photo(update, chart_image, f"*{title}*")
+        await status_message.delete()
+        COMMANDS.labels("chart", "sent").inc()
+    except Exception as e:
+        COMMANDS.labels("chart", "failed").inc()
+        analysis_task.cancel()
+        await status_message.delete()
+        await update.message.reply_text(
+            f"❌ Error: {str(e)}\n\n"
+            f"Please try again later."
+        )
+        return
+    
+    analysis = await analysis_task
+    if not analysis:
+        return
+    try:
+        await photo_message.edit_caption(caption=format_chart_caption(title, analysis), parse_mode="Markdown")
+    except Exception as e:
+        logger.error(f"Error adding summary to chart caption: {str(e)}")
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -70,20 +168,17 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     message_text = update.message.text.strip()
     parts = message_text.split()
     
-    # Only process messages that start with a valid metric
-    valid_metrics = ["price", "volume", "tvl", "fees", "revenue", "mc", "txns", "daa", "dau", "fdmc"]
-    
     # If message is too short or doesn't start with a valid metric, ignore it completely
-    if len(parts) < 4 or parts[0].lower() not in valid_metrics:
+    if len(parts) < 4 or canonical_metric(parts[0]) is None:
         return
     
     try:
-        metrics, tickers_raw, asset_type, time_period, granularity, is_percentage = parse_command(message_text)
+        with track_stage("parse"):
+            spec = parse_command(message_text)
         
-        await process_chart_command(
-            update, context, metrics, tickers_raw, asset_type, time_period, granularity, is_percentage
-        )
+        await process_chart_command(update, context, spec)
     except ValueError as e:
+        COMMANDS.labels("chart", "invalid").inc()
         await update.message.reply_text(
             f"Error: {str(e)}\n\n"
             f"Format: <metric> [vs <metric>] <asset> <time_period> <granularity> [%]\n"
@@ -128,18 +223,17 @@ async def handle_group_message(update: Update, context: ContextTypes.DEFAULT_TYP
         return
         
     # Only process messages that start with a valid metric
-    valid_metrics = ["price", "volume", "tvl", "fees", "revenue", "mc", "txns", "daa", "dau", "fdmc"]
-    if parts[0].lower() not in valid_metrics:
+    if canonical_metric(parts[0]) is None:
         logger.info(f"Invalid metric: {parts[0]}")
         return
         
     try:
-        metrics, tickers_raw, asset_type, time_period, granularity, is_percentage = parse_command(command_text, is_group=True)
+        with track_stage("parse"):
+            spec = parse_command(command_text, is_group=True)
         
-        await process_chart_command(
-            update, context, metrics, tickers_raw, asset_type, time_period, granularity, is_percentage, is_group=True
-        )
+        await process_chart_command(update, context, spec, is_group=True)
     except ValueError as e:
+        COMMANDS.labels("chart", "invalid").inc()
         logger.error(f"Error processing command: {str(e)}")
         await update.message.reply_text(
             f"Error: {str(e)}\n\n"
@@ -174,8 +268,10 @@ async def handle_news_command(update: Update, context: ContextTypes.DEFAULT_TYPE
             parse_mode="Markdown"
         )
         await status_message.delete()
+        COMMANDS.labels("news", "sent").inc()
         
     except Exception as e:
+        COMMANDS.labels("news", "failed").inc()
         await status_message.delete()
         await update.message.reply_text(
             f"❌ Error: {str(e)}\n\n"
@@ -4,9 +4,9 @@ from openai import AsyncOpenAI
 from typing import Optional, List
 import httpx
 from datetime import datetime
-import json
 from dotenv import load_dotenv
-from pathlib import Path
+from artemisbot.utils.asset_index import get_asset_index
+from artemisbot.utils.metrics import track_stage
 
 load_dotenv()
 
@@ -17,20 +17,6 @@ CRYPTOPANIC_API_URL = 'https://cryptopanic.com/api/v1/posts/?public=true'
 
 logger.info(f"CRYPTOPANIC_API_KEY present: {bool(CRYPTOPANIC_API_KEY)}")
 
-# Load artemis_mappings.json using absolute path
-try:
-    # Get the absolute path to the project root
-    project_root = Path(__file__).parent.parent.parent
-    mappings_path = project_root / 'config' / 'artemis_mappings.json'
-    logger.info(f"Looking for artemis_mappings.json at: {mappings_path}")
-    
-    with open(mappings_path, 'r') as f:
-        artemis_mappings = json.load(f)
-    logger.info(f"Successfully loaded artemis_mappings.json with {len(artemis_mappings)} entries")
-except Exception as e:
-    logger.error(f"Error loading artemis_mappings.json: {str(e)}")
-    artemis_mappings = {}
-
 class NewsAnalyzer:
     def __init__(self):
         """Initialize the NewsAnalyzer with OpenAI client and CryptoPanic API key."""
@@ -60,7 +46,8 @@ class NewsAnalyzer:
         logger.info(f"Making request to CryptoPanic with params: {params}")
         async with httpx.AsyncClient() as client:
             try:
-                resp = await client.get(CRYPTOPANIC_API_URL, params=params, timeout=10)
+                with track_stage("news_fetch"):
+                    resp = await client.get(CRYPTOPANIC_API_URL, params=params, timeout=10)
                 resp.raise_for_status()
                 data = resp.json()
                 logger.info(f"CryptoPanic response status: {resp.status_code}")
@@ -87,12 +74,13 @@ class NewsAnalyzer:
     async def get_market_news(self, asset: Optional[str] = None) -> str:
         """
         Get a summary of today's market news, optionally filtered by asset.
-        If asset is provided, check artemis_mappings.json for the asset symbol or artemis_id.
+        If asset is provided, it is resolved to its symbol through the shared asset index.
         """
         logger.info(f"Getting market news for asset: {asset}")
         if asset:
-            # Check artemis_mappings.json for the asset symbol or artemis_id
-            asset_symbol = artemis_mappings.get(asset.lower(), asset.lower())
+            # Resolve the symbol or artemis_id to the symbol CryptoPanic filters on
+            asset_info = get_asset_index().lookup(asset)
+            asset_symbol = asset_info["symbol"] if asset_info else asset.lower()
             logger.info(f"Using asset symbol: {asset_symbol}")
             headlines = await self.fetch_today_news(asset_symbol)
         else:
@@ -109,15 +97,16 @@ class NewsAnalyzer:
         )
         try:
             logger.info("Generating summary with OpenAI")
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a crypto market analyst providing concise news summaries."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=850,
-                temperature=0.7
-            )
+            with track_stage("news_summarize"):
+                response = await self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": "You are a crypto market analyst providing concise news summaries."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=850,
+                    temperature=0.7
+                )
             summary = response.choices[0].message.content.strip()
             logger.info("Successfully generated summary")
             if len(headlines) < 5:
@@ -0,0 +1,70 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from artemisbot.utils.metrics import REGISTRY
+from config import METRICS_LISTEN, METRICS_PORT
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serve the registry on GET /metrics."""
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.expose().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Scrapes every few seconds would drown the bot's own logs
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def start_metrics_server(listen: str = METRICS_LISTEN, port: int = METRICS_PORT) -> Optional[ThreadingHTTPServer]:
+    """
+    Serve /metrics from a background thread.
+
+    Args:
+        listen: Address to bind; keep it local unless the port is firewalled
+        port: Port to bind (0 disables the endpoint)
+
+    Returns:
+        The running server, or None if disabled or the port could not be bound
+    """
+    global _server
+    if port <= 0 or _server is not None:
+        return _server
+    try:
+        server = ThreadingHTTPServer((listen, port), MetricsHandler)
+    except OSError as e:
+        logger.error(f"Metrics endpoint disabled, could not bind {listen}:{port}: {str(e)}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Serving metrics at http://{listen}:{port}/metrics")
+    _server = server
+    return server
+
+
+def stop_metrics_server() -> None:
+    """Stop the metrics endpoint if it is running."""
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
@@ -0,0 +1,153 @@
+import hmac
+import json
+import time
+import signal
+import asyncio
+import logging
+import secrets
+from typing import Optional
+from telegram import Update
+from telegram.ext import Application
+from tornado.httpserver import HTTPServer
+from tornado.web import Application as WebApplication, RequestHandler
+from config import (
+    WEBHOOK_URL,
+    WEBHOOK_LISTEN,
+    WEBHOOK_PORT,
+    WEBHOOK_PATH,
+    WEBHOOK_SECRET_TOKEN,
+    WEBHOOK_MAX_CONNECTIONS,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Header Telegram sends with the secret token given to setWebhook
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+# Largest update body accepted; real updates are a few KB
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class TelegramWebhookHandler(RequestHandler):
+    """Accept updates posted by Telegram and put them on the application's update queue."""
+
+    def initialize(self, bot_app: Application, secret_token: str) -> None:
+        self.bot_app = bot_app
+        self.secret_token = secret_token
+
+    async def post(self) -> None:
+        received = self.request.headers.get(SECRET_TOKEN_HEADER, "")
+        if not hmac.compare_digest(received.encode(), self.secret_token.encode()):
+            logger.warning(f"Rejected webhook request from {self.request.remote_ip}: bad secret token")
+            self.set_status(403)
+            return
+
+        try:
+            data = json.loads(self.request.body)
+            update = Update.de_json(data, self.bot_app.bot)
+        except Exception as e:
+            logger.warning(f"Rejected malformed webhook update: {str(e)}")
+            self.set_status(400)
+            return
+
+        # Answer at once; the application processes updates concurrently, at most
+        # MAX_CONCURRENT_UPDATES at a time, and Telegram only needs to know we have it
+        await self.bot_app.update_queue.put(update)
+        self.set_status(200)
+
+
+class HealthHandler(RequestHandler):
+    """Report whether the bot is running, for load balancer and platform health checks."""
+
+    def initialize(self, bot_app: Application, started_at: float) -> None:
+        self.bot_app = bot_app
+        self.started_at = started_at
+
+    def get(self) -> None:
+        running = self.bot_app.running
+        self.set_status(200 if running else 503)
+        self.write({
+            "status": "ok" if running else "stopped",
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "pending_updates": self.bot_app.update_queue.qsize(),
+        })
+
+
+def build_web_app(application: Application, secret_token: str, path: str = WEBHOOK_PATH) -> WebApplication:
+    """
+    Build the HTTP app serving the webhook and the health endpoint.
+
+    Args:
+        application: The Telegram application that processes the updates
+        secret_token: Token Telegram must send in the X-Telegram-Bot-Api-Secret-Token header
+        path: URL path of the webhook, without leading slash
+
+    Returns:
+        A tornado application with POST /<path> and GET /healthz
+    """
+    return WebApplication([
+        (rf"/{path.strip('/')}/?", TelegramWebhookHandler, {"bot_app": application, "secret_token": secret_token}),
+        (r"/healthz", HealthHandler, {"bot_app": application, "started_at": time.time()}),
+    ])
+
+
+async def serve_webhook(application: Application, url: str = WEBHOOK_URL, listen: str = WEBHOOK_LISTEN,
+                        port: int = WEBHOOK_PORT, path: str = WEBHOOK_PATH,
+                        secret_token: Optional[str] = WEBHOOK_SECRET_TOKEN,
+                        max_connections: int = WEBHOOK_MAX_CONNECTIONS) -> None:
+    """
+    Serve the bot through a webhook until SIGINT or SIGTERM.
+
+    Runs the application's lifecycle the way run_polling does (including the
+    post_init and post_shutdown hooks), with an embedded HTTP server in place of
+    the getUpdates loop.
+
+    Args:
+        application: The Telegram application, built without an updater
+        url: Public base URL Telegram posts to (e.g. https://bot.example.com)
+        listen: Address to bind
+        port: Port to bind
+        path: URL path of the webhook
+        secret_token: Token Telegram must send with each update; generated if not set
+        max_connections: Concurrent connections Telegram may open to the webhook
+    """
+    if not url:
+        raise ValueError("WEBHOOK_URL must be set to run in webhook mode")
+    if not secret_token:
+        # Fine for a single instance, which sets the webhook itself on every start
+        secret_token = secrets.token_urlsafe(32)
+        logger.warning("WEBHOOK_SECRET_TOKEN not set, generated one for this run")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    server = HTTPServer(build_web_app(application, secret_token, path), xheaders=True, max_body_size=MAX_BODY_BYTES)
+    await application.initialize()
+    try:
+        if application.post_init:
+            await application.post_init(application)
+        await application.start()
+        server.listen(port, address=listen)
+        webhook_url = f"{url.rstrip('/')}/{path.strip('/')}"
+        await application.bot.set_webhook(
+            url=webhook_url,
+            secret_token=secret_token,
+            allowed_updates=Update.ALL_TYPES,
+            max_connections=max_connections,
+        )
+        logger.info(f"Serving webhook at {webhook_url} (listening on {listen}:{port})")
+        await stop.wait()
+        logger.info("Received shutdown signal")
+    finally:
+        server.stop()
+        if application.running:
+            await application.stop()
+            if application.post_stop:
+                await application.post_stop(application)
+        await application.shutdown()
+        if application.post_shutdown:
+            await application.post_shutdown(application)
@@ -0,0 +1,228 @@
+import re
+import bisect
+import logging
+from collections import Counter, defaultdict
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Candidates taken from each of the prefix and trigram passes before ranking
+MAX_CANDIDATES = 32
+
+# Suggestions scoring below this similarity are dropped
+MIN_SUGGESTION_SCORE = 0.5
+
+# Characters ignored when matching aliases ("$ETH", "bnb-chain", "the_graph")
+_ALIAS_STRIP = re.compile(r"[^a-z0-9]")
+
+
+def normalize(query: str) -> str:
+    """Reduce a user-typed asset name to its alias form: lowercase letters and digits only."""
+    return _ALIAS_STRIP.sub("", query.lower())
+
+
+def trigrams(key: str) -> Set[str]:
+    """Return the trigrams of key, padded so two-letter keys and word edges still produce some."""
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance between a and b (insertions, deletions,
+    substitutions and adjacent transpositions), or max_distance + 1 once it is
+    certain to exceed max_distance.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class Suggestion(NamedTuple):
+    """A ranked asset suggestion for a query that matched nothing exactly."""
+    id: str
+    symbol: str
+    type: str
+    score: float  # similarity in [0, 1]
+    match: str  # "prefix" or "fuzzy"
+    key: str  # the ID or symbol that matched
+
+
+class AssetIndex:
+    """
+    In-memory index over the asset mappings for exact, alias, prefix and fuzzy lookup.
+
+    Built once from the mappings: IDs and symbols go into hash maps for exact
+    lookup, their normalized forms into an alias map, a sorted key list serves
+    prefix queries by bisection, and an inverted trigram index narrows fuzzy
+    queries to a few candidates before edit distances are computed, so
+    suggestions stay well under a millisecond with tens of thousands of assets.
+    Asset info is shared by every lookup, so it is returned as read-only mappings.
+    """
+
+    def __init__(self, id_to_symbols: Dict[str, Iterable[str]], id_to_type: Dict[str, str]):
+        """
+        Build the AssetIndex.
+
+        Args:
+            id_to_symbols: Artemis ID to symbol (or list of symbols), as in artemis_mappings.json
+            id_to_type: Artemis ID to asset type
+        """
+        self._by_id: Dict[str, Mapping] = {}
+        self._by_symbol: Dict[str, Mapping] = {}
+        self._by_alias: Dict[str, Mapping] = {}
+        key_assets: Dict[str, Mapping] = {}
+
+        for artemis_id, symbols in id_to_symbols.items():
+            if isinstance(symbols, str):
+                symbols = [symbols]
+            symbols = [symbol.lower() for symbol in symbols if symbol]
+            if not symbols:
+                continue
+            asset_type = id_to_type.get(artemis_id, "unknown")
+            self._by_id[artemis_id] = MappingProxyType({"id": artemis_id, "symbol": symbols[0], "type": asset_type})
+            for symbol in symbols:
+                self._by_symbol[symbol] = MappingProxyType({"id": artemis_id, "symbol": symbol, "type": asset_type})
+
+        # Symbols win over IDs, as in parse_command's symbol-then-ID lookup order
+        for key, info in list(self._by_id.items()) + list(self._by_symbol.items()):
+            key_assets[key.lower()] = info
+            self._by_alias[normalize(key)] = info
+
+        self._keys = sorted(key_assets)
+        self._key_assets = [key_assets[key] for key in self._keys]
+        self._trigrams: Dict[str, List[int]] = defaultdict(list)
+        for position, key in enumerate(self._keys):
+            for gram in trigrams(key):
+                self._trigrams[gram].append(position)
+        self._trigrams = dict(self._trigrams)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, query: str) -> bool:
+        return self.lookup(query) is not None
+
+    def ids(self) -> List[str]:
+        """Return every indexed Artemis ID."""
+        return list(self._by_id)
+
+    def by_id(self, artemis_id: str) -> Optional[Mapping]:
+        """Return asset info for an Artemis ID, with its primary symbol."""
+        return self._by_id.get(artemis_id)
+
+    def by_symbol(self, symbol: str) -> Optional[Mapping]:
+        """Return asset info for a symbol."""
+        return self._by_symbol.get(symbol.lower())
+
+    def lookup(self, query: str) -> Optional[Mapping]:
+        """
+        Resolve a user-typed asset by symbol, then Artemis ID, then alias.
+
+        Args:
+            query: Symbol, Artemis ID or a variant of either ('$ETH', 'bnb-chain')
+
+        Returns:
+            Read-only asset info with 'id', 'symbol' and 'type', or None if nothing matches exactly
+        """
+        key = query.lower()
+        return self._by_symbol.get(key) or self._by_id.get(key) or self._by_alias.get(normalize(query))
+
+    def prefix(self, query: str, limit: int = MAX_CANDIDATES) -> List[Tuple[str, Mapping]]:
+        """Return up to limit (key, asset info) pairs whose ID or symbol starts with query."""
+        query = query.lower()
+        start = bisect.bisect_left(self._keys, query)
+        matches = []
+        for position in range(start, min(start + limit, len(self._keys))):
+            if not self._keys[position].startswith(query):
+                break
+            matches.append((self._keys[position], self._key_assets[position]))
+        return matches
+
+    def _trigram_candidates(self, query: str, max_distance: int, limit: int) -> List[int]:
+        """
+        Keys sharing the most trigrams with query, skipping those that share too few
+        to be within max_distance edits (each edit changes at most four trigrams).
+        """
+        grams = trigrams(query)
+        min_shared = len(grams) - 4 * max_distance
+        counts = Counter(chain.from_iterable(self._trigrams.get(gram, ()) for gram in grams))
+        return [position for position, shared in counts.most_common(limit) if shared >= min_shared]
+
+    def suggest(self, query: str, limit: int = 3) -> List[Suggestion]:
+        """
+        Rank the assets closest to a query that did not resolve.
+
+        Keys the query is a prefix of score by how much of the key it covers;
+        other candidates sharing trigrams with the query score by edit distance.
+
+        Args:
+            query: The unresolved asset
+            limit: Maximum suggestions to return
+
+        Returns:
+            Suggestions, best first, one per asset
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+
+        best: Dict[str, Suggestion] = {}
+
+        def consider(key: str, info: Mapping, score: float, match: str) -> None:
+            if score < MIN_SUGGESTION_SCORE:
+                return
+            current = best.get(info["id"])
+            if current is None or score > current.score:
+                best[info["id"]] = Suggestion(info["id"], info["symbol"], info["type"], score, match, key)
+
+        if len(query) >= 2:
+            for key, info in self.prefix(query):
+                consider(key, info, 0.5 + 0.5 * len(query) / len(key), "prefix")
+
+        max_distance = max(1, len(query) // 3)
+        for position in self._trigram_candidates(query, max_distance, MAX_CANDIDATES):
+            key = self._keys[position]
+            distance = edit_distance(query, key, max_distance)
+            if distance <= max_distance:
+                consider(key, self._key_assets[position], 1 - distance / max(len(query), len(key)), "fuzzy")
+
+        return sorted(best.values(), key=lambda s: (-s.score, len(s.key), s.key))[:limit]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the size of the index."""
+        return {
+            "assets": len(self._by_id),
+            "symbols": len(self._by_symbol),
+            "keys": len(self._keys),
+            "trigrams": len(self._trigrams),
+        }
+
+
+def format_suggestions(suggestions: List[Suggestion]) -> str:
+    """Format suggestions for a 'Did you mean' message, e.g. 'solana (sol), solv (solv)'."""
+    return ", ".join(
+        s.id if s.id == s.symbol else f"{s.id} ({s.symbol})" for s in suggestions
+    )
+
+
+def get_asset_index() -> AssetIndex:
+    """Return the asset index of the current mappings snapshot."""
+    from artemisbot.utils.asset_mappings import get_mappings
+    return get_mappings().index
@@ -1,74 +1,226 @@
 import json
 import os
-from typing import Dict, Optional, List
-from config import ASSET_MAPPINGS_FILE
-
-# Global mappings dictionary
-MAPPINGS = {
-    "artemis_id_to_symbols": {},
-    "symbol_to_artemis_id": {},
-    "artemis_id_to_type": {},
-    "symbol_to_type": {}
-}
-
-def load_mappings() -> None:
-    """Load asset mappings from cache or API."""
+import time
+import logging
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+from artemisbot.utils.asset_index import AssetIndex
+from artemisbot.utils.mappings_refresh import load_index
+from artemisbot.utils.metrics import REGISTRY
+from config import ASSET_MAPPINGS_FILE, ASSET_MAPPINGS_INDEX_FILE, MAPPINGS_RELOAD_INTERVAL
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class MappingsSnapshot(NamedTuple):
+    """
+    One immutable load of the asset mappings file.
+
+    The maps are read-only views and the snapshot is never modified after it
+    is built; a reload builds a new snapshot and swaps the module reference,
+    so a lookup always sees one complete version of the mappings.
+    """
+    artemis_id_to_symbols: Mapping[str, Any]
+    artemis_id_to_type: Mapping[str, str]
+    symbol_to_artemis_id: Mapping[str, str]
+    symbol_to_type: Mapping[str, str]
+    index: AssetIndex
+    path: str
+    file_signature: Tuple[int, int]  # (mtime_ns, size) of the file when it was read
+    loaded_at: float
+    load_seconds: float
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_snapshot(path: str = ASSET_MAPPINGS_FILE, index_path: str = ASSET_MAPPINGS_INDEX_FILE) -> MappingsSnapshot:
+    """
+    Read the mappings file and build a snapshot from it.
+
+    The symbol tables come from the compiled index when it was compiled from
+    this exact file, and are derived from the mappings otherwise.
+
+    Args:
+        path: Path to artemis_mappings.json
+        index_path: Path to the compiled index written by a mappings refresh
+
+    Returns:
+        The new snapshot
+
+    Raises:
+        Exception: If the file is missing or not valid JSON
+    """
+    started = time.perf_counter()
     try:
-        with open(ASSET_MAPPINGS_FILE, "r") as f:
-            raw_mappings = json.load(f)
-            
-        # Copy all mappings directly from the file
-        MAPPINGS["artemis_id_to_symbols"] = raw_mappings.get("artemis_id_to_symbols", {})
-        MAPPINGS["artemis_id_to_type"] = raw_mappings.get("artemis_id_to_type", {})
-        
-        # Build symbol_to_artemis_id and symbol_to_type mappings
-        MAPPINGS["symbol_to_artemis_id"] = {}
-        MAPPINGS["symbol_to_type"] = {}
-        
-        for artemis_id, symbols in MAPPINGS["artemis_id_to_symbols"].items():
-            if isinstance(symbols, list):
-                for symbol in symbols:
-                    MAPPINGS["symbol_to_artemis_id"][symbol.lower()] = artemis_id
-                    MAPPINGS["symbol_to_type"][symbol.lower()] = MAPPINGS["artemis_id_to_type"].get(artemis_id, "unknown")
-            else:
-                MAPPINGS["symbol_to_artemis_id"][symbols.lower()] = artemis_id
-                MAPPINGS["symbol_to_type"][symbols.lower()] = MAPPINGS["artemis_id_to_type"].get(artemis_id, "unknown")
-            
+        signature = _file_signature(path)
+        with open(path, "rb") as f:
+            source = f.read()
     except FileNotFoundError:
-        raise Exception(f"Could not find mappings file at {ASSET_MAPPINGS_FILE}")
+        raise Exception(f"Could not find mappings file at {path}")
 
-def get_asset_by_symbol(symbol: str) -> Optional[Dict]:
-    """Get asset info by symbol."""
-    if not MAPPINGS["symbol_to_artemis_id"]:
-        load_mappings()
-        
-    artemis_id = MAPPINGS["symbol_to_artemis_id"].get(symbol.lower())
-    if not artemis_id:
-        return None
-        
+    compiled = load_index(index_path, source) if index_path else None
+    if compiled is not None:
+        id_to_symbols = compiled["artemis_id_to_symbols"]
+        id_to_type = compiled["artemis_id_to_type"]
+        symbol_to_id = compiled["symbol_to_artemis_id"]
+        symbol_to_type = compiled["symbol_to_type"]
+    else:
+        raw_mappings = json.loads(source)
+        id_to_symbols = raw_mappings.get("artemis_id_to_symbols", {})
+        id_to_type = raw_mappings.get("artemis_id_to_type", {})
+
+        # Build symbol_to_artemis_id and symbol_to_type mappings
+        symbol_to_id: Dict[str, str] = {}
+        symbol_to_type: Dict[str, str] = {}
+        for artemis_id, symbols in id_to_symbols.items():
+            for symbol in symbols if isinstance(symbols, list) else [symbols]:
+                symbol_to_id[symbol.lower()] = artemis_id
+                symbol_to_type[symbol.lower()] = id_to_type.get(artemis_id, "unknown")
+
+    return MappingsSnapshot(
+        artemis_id_to_symbols=MappingProxyType(id_to_symbols),
+        artemis_id_to_type=MappingProxyType(id_to_type),
+        symbol_to_artemis_id=MappingProxyType(symbol_to_id),
+        symbol_to_type=MappingProxyType(symbol_to_type),
+        index=AssetIndex(id_to_symbols, id_to_type),
+        path=path,
+        file_signature=signature,
+        loaded_at=time.time(),
+        load_seconds=time.perf_counter() - started,
+    )
+
+
+# The current snapshot; replaced whole, never mutated
+_snapshot: Optional[MappingsSnapshot] = None
+_load_lock = threading.Lock()
+
+# Reload metrics
+_reloads = 0
+_reload_failures = 0
+_failed_signature: Optional[Tuple[int, int]] = None  # file version that last failed to load
+
+
+def load_mappings(path: str = ASSET_MAPPINGS_FILE) -> MappingsSnapshot:
+    """Read the mappings file and make it the current snapshot."""
+    global _snapshot
+    snapshot = read_snapshot(path)
+    _snapshot = snapshot
+    logger.info(f"Loaded {len(snapshot.artemis_id_to_symbols)} asset mappings in {snapshot.load_seconds * 1000:.1f}ms")
+    return snapshot
+
+
+def get_mappings() -> MappingsSnapshot:
+    """Return the current mappings snapshot, loading it if startup has not already."""
+    snapshot = _snapshot
+    if snapshot is None:
+        with _load_lock:
+            snapshot = _snapshot or load_mappings()
+    return snapshot
+
+
+def reload_if_changed() -> bool:
+    """
+    Load the mappings file again if it changed since the current snapshot was read.
+
+    A file that fails to load (for example one caught mid-write) leaves the
+    current snapshot in place, and is retried once the file changes again.
+
+    Returns:
+        Whether a new snapshot was swapped in
+    """
+    global _reloads, _reload_failures, _failed_signature
+    current = get_mappings()
+    signature = None
+    try:
+        signature = _file_signature(current.path)
+        if signature in (current.file_signature, _failed_signature):
+            return False
+        with _load_lock:
+            load_mappings(current.path)
+    except Exception as e:
+        _reload_failures += 1
+        _failed_signature = signature
+        logger.error(f"Could not reload asset mappings, keeping the previous version: {str(e)}")
+        return False
+    _reloads += 1
+    return True
+
+
+class MappingsWatcher:
+    """Background thread that reloads the mappings whenever the file changes."""
+
+    def __init__(self, interval: float = MAPPINGS_RELOAD_INTERVAL):
+        """
+        Initialize the MappingsWatcher.
+
+        Args:
+            interval: Seconds between checks of the file's modification time
+        """
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="mappings-watcher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            reload_if_changed()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+_watcher: Optional[MappingsWatcher] = None
+
+
+def start_mappings_watcher() -> None:
+    """
+    Load the mappings now and keep them in sync with the file.
+
+    Called at startup, so the first request does not pay for parsing the
+    file and building the asset index.
+    """
+    global _watcher
+    get_mappings()
+    if MAPPINGS_RELOAD_INTERVAL > 0 and _watcher is None:
+        _watcher = MappingsWatcher()
+        _watcher.start()
+
+
+def mappings_stats() -> Dict[str, Any]:
+    """Return the size, age and reload counters of the mappings snapshot."""
+    snapshot = get_mappings()
     return {
-        "id": artemis_id,
-        "symbol": symbol.lower(),
-        "type": MAPPINGS["symbol_to_type"].get(symbol.lower(), "unknown")
+        "assets": len(snapshot.artemis_id_to_symbols),
+        "symbols": len(snapshot.symbol_to_artemis_id),
+        "loaded_at": snapshot.loaded_at,
+        "load_seconds": snapshot.load_seconds,
+        "reloads": _reloads,
+        "reload_failures": _reload_failures,
     }
 
-def get_asset_by_id(artemis_id: str) -> Optional[Dict]:
+
+REGISTRY.register_collector("mappings", mappings_stats)
+
+
+def get_asset_by_symbol(symbol: str) -> Optional[Mapping]:
+    """Get asset info by symbol."""
+    return get_mappings().index.by_symbol(symbol)
+
+
+def get_asset_by_id(artemis_id: str) -> Optional[Mapping]:
     """Get asset info by Artemis ID."""
-    if not MAPPINGS["artemis_id_to_symbols"]:
-        load_mappings()
-        
-    symbols = MAPPINGS["artemis_id_to_symbols"].get(artemis_id)
-    if not symbols:
-        return None
-        
-    # Use the first symbol in the list
-    symbol = symbols[0] if isinstance(symbols, list) else symbols
-    
-    return {
-        "id": artemis_id,
-        "symbol": symbol,
-        "type": MAPPINGS["artemis_id_to_type"].get(artemis_id, "unknown")
-    }
+    return get_mappings().index.by_id(artemis_id)
+
 
 def clean_asset_params(asset: str, asset_type: str) -> Dict:
     """
@@ -85,11 +237,11 @@ def clean_asset_params(asset: str, asset_type: str) -> Dict:
         ValueError: If the asset is not found
     """
     # Try to get asset info
-    asset_info = get_asset_by_symbol(asset) or get_asset_by_id(asset)
+    asset_info = get_mappings().index.lookup(asset)
     if not asset_info:
         raise ValueError(f"Unknown asset: {asset}")
         
     return {
         "id": asset_info["id"],
         "type": asset_type.lower()
-    }
\ No newline at end of file
+    }
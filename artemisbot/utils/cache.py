@@ -0,0 +1,184 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _default_sizeof(value: Any) -> int:
+    """Size of a cached value in bytes, as far as we can cheaply tell."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return 1
+
+
+class LRUCache:
+    """
+    A thread-safe LRU cache with per-entry TTLs and a memory budget.
+
+    Entries are evicted least-recently-used first once the total size exceeds
+    max_bytes. Expired entries are swept proactively on writes (at most once per
+    sweep_interval seconds) as well as on reads of the same key.
+    """
+
+    def __init__(self, max_bytes: int, ttl: Optional[float] = None, max_entries: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = _default_sizeof, sweep_interval: float = 30.0,
+                 name: str = "cache"):
+        """
+        Initialize the LRUCache.
+
+        Args:
+            max_bytes: Memory budget for all cached values
+            ttl: Default time-to-live in seconds (None means entries never expire)
+            max_entries: Optional cap on the number of entries
+            sizeof: Callable returning the size of a value in bytes
+            sweep_interval: Minimum seconds between proactive expiry sweeps
+            name: Name used in log messages
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.name = name
+        self._sizeof = sizeof
+        self._sweep_interval = sweep_interval
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._last_sweep = time.monotonic()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, _, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Like get, but without counting a hit or miss; for callers that keep their own stats."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, _, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting least-recently-used entries to stay within budget.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds for this entry (defaults to the cache TTL)
+        """
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            logger.info(f"Not caching {size} byte value in {self.name} cache (budget {self.max_bytes} bytes)")
+            return
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+
+            if now - self._last_sweep >= self._sweep_interval:
+                self._sweep(now)
+            while self._bytes > self.max_bytes or (self.max_entries and len(self._entries) > self.max_entries):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove key from the cache if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def ttl_remaining(self, key: Hashable) -> Optional[float]:
+        """Seconds until key expires, or None if it is not cached (without touching LRU order)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at = entry[0]
+            if expires_at is None:
+                return float("inf")
+            return max(0.0, expires_at - time.monotonic())
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry and return how many were removed."""
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _sweep(self, now: float) -> int:
+        expired = [key for key, (expires_at, _, _) in self._entries.items()
+                   if expires_at is not None and expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
+
+    def __contains__(self, key: Hashable) -> bool:
+        remaining = self.ttl_remaining(key)
+        return remaining is not None and remaining > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
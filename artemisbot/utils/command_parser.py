@@ -1,7 +1,7 @@
-from typing import List, Tuple
-from artemisbot.utils.asset_mappings import get_asset_by_symbol, get_asset_by_id
+from artemisbot.chart.chart_spec import ChartSpec, METRICS, canonical_metric
+from artemisbot.utils.asset_index import get_asset_index, format_suggestions
 
-def parse_command(command_text: str, is_group: bool = False) -> Tuple[List[str], List[str], str, str, str, bool]:
+def parse_command(command_text: str, is_group: bool = False) -> ChartSpec:
     """
     Parse command text into its components.
     
@@ -10,13 +10,8 @@ def parse_command(command_text: str, is_group: bool = False) -> Tuple[List[str],
         is_group: Whether this is a group chat command
         
     Returns:
-        Tuple containing:
-        - metrics: List of metrics to chart
-        - tickers: List of asset tickers
-        - asset_type: The type of asset
-        - time_period: The time period for the chart
-        - granularity: The granularity of the data
-        - is_percentage: Whether to display as percentages
+        The canonical ChartSpec, equal for equivalent commands ('mcap vs price eth'
+        and 'marketcap vs price ethereum' give the same spec)
         
     Raises:
         ValueError: If the command format is invalid
@@ -66,10 +61,9 @@ def parse_command(command_text: str, is_group: bool = False) -> Tuple[List[str],
     is_percentage = len(remaining_parts) > 3 and remaining_parts[3] == "%"
     
     # Validate metrics
-    valid_metrics = ["price", "volume", "tvl", "fees", "revenue", "mc", "txns", "daa", "dau", "fdmc"]
     for metric in metrics:
-        if metric not in valid_metrics:
-            raise ValueError(format_error(f"Invalid metric '{metric}'. Must be one of: {', '.join(valid_metrics)}"))
+        if canonical_metric(metric) is None:
+            raise ValueError(format_error(f"Invalid metric '{metric}'. Must be one of: {', '.join(METRICS)}"))
     
     # Validate time period
     valid_periods = ["1w", "mtd", "1m", "3m", "6m", "ytd", "1y", "all"]
@@ -81,9 +75,13 @@ def parse_command(command_text: str, is_group: bool = False) -> Tuple[List[str],
     if granularity not in valid_granularities:
         raise ValueError(format_error(f"Invalid granularity '{granularity}'. Must be one of: {', '.join(valid_granularities)}"))
     
-    # Try to resolve asset
-    asset_info = get_asset_by_symbol(asset) or get_asset_by_id(asset)
+    # Try to resolve asset, suggesting close matches for typos
+    asset_index = get_asset_index()
+    asset_info = asset_index.lookup(asset)
     if not asset_info:
+        suggestions = asset_index.suggest(asset)
+        if suggestions:
+            raise ValueError(format_error(f"Asset '{asset}' not found. Did you mean: {format_suggestions(suggestions)}?"))
         raise ValueError(format_error(f"Asset '{asset}' not found"))
     
-    return metrics, [asset_info["id"]], asset_info["type"], time_period, granularity, is_percentage
+    return ChartSpec.create(metrics, [asset_info["id"]], asset_info["type"], time_period, granularity, is_percentage)
@@ -0,0 +1,207 @@
+import os
+import time
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    A size-bounded, content-addressed file cache that survives restarts.
+
+    Each entry is stored at <directory>/<key[:2]>/<key><suffix> and written
+    through a temporary file plus an atomic rename, so readers never see a
+    partial file. Freshness is judged from the file's modification time against
+    a TTL supplied by the caller, which lets different kinds of entries live for
+    different lengths of time. Once the directory exceeds max_bytes the least
+    recently used files are deleted; after a restart, recency falls back to the
+    write time.
+
+    Several processes (the bot and its render workers) may share a directory.
+    Each keeps its own index, so the index is rebuilt from the directory before
+    evicting and at least every rescan_interval seconds on writes; max_bytes
+    then bounds the whole directory, give or take what the other processes
+    wrote since the last rescan. Files written by other processes count as
+    older than this process's own, by write time. Eviction frees down to 90%
+    of max_bytes so a full cache does not rescan on every write.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".png", rescan_interval: float = 60.0):
+        """
+        Initialize the DiskCache and index any files left by a previous run.
+
+        Args:
+            directory: Root directory for cached files
+            max_bytes: Maximum total size of cached files
+            suffix: File extension for cached entries
+            rescan_interval: Maximum seconds between rebuilds of the index from the directory
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.rescan_interval = rescan_interval
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # key -> size, least recently used first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._last_scan = 0.0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.write_errors = 0
+
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._scan()
+            self._evict()
+        logger.info(f"Disk cache at {self.directory} holds {len(self._index)} entries ({self._bytes} bytes)")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}{self.suffix}")
+
+    def _scan(self) -> None:
+        """Rebuild the in-memory index from the files on disk, oldest first. Caller holds the lock."""
+        found = []
+        now = time.time()
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if filename.startswith(".tmp"):
+                    # Leftover from an interrupted write; recent ones may be another process mid-write
+                    if now - stat.st_mtime > self.rescan_interval:
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+                    continue
+                if filename.endswith(self.suffix):
+                    found.append((stat.st_mtime, filename[:-len(self.suffix)], stat.st_size))
+
+        # Files this process has not seen go first by write time, then its own in recency order
+        sizes = {key: size for _, key, size in found}
+        index = OrderedDict((key, size) for _, key, size in sorted(found) if key not in self._index)
+        for key in self._index:
+            if key in sizes:
+                index[key] = sizes[key]
+        self._index = index
+        self._bytes = sum(index.values())
+        self._last_scan = time.monotonic()
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[bytes]:
+        """
+        Return the cached bytes for key, or None if missing or older than ttl.
+
+        Args:
+            key: Content address of the entry
+            ttl: Maximum age in seconds (None means any age is acceptable)
+        """
+        path = self._path(key)
+        try:
+            if ttl is not None and time.time() - os.path.getmtime(path) >= ttl:
+                self._drop(key)
+                with self._lock:
+                    self.misses += 1
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self._bytes -= self._index.pop(key, 0)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+            self.hits += 1
+        return data
+
+    def contains(self, key: str, ttl: Optional[float] = None) -> bool:
+        """Whether a fresh entry exists for key, without reading it."""
+        with self._lock:
+            if key not in self._index:
+                return False
+        if ttl is None:
+            return True
+        try:
+            return time.time() - os.path.getmtime(self._path(key)) < ttl
+        except OSError:
+            return False
+
+    def set(self, key: str, data: bytes) -> None:
+        """Atomically write data for key, evicting old entries to stay within budget."""
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".tmp", dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Error writing disk cache entry {key}: {str(e)}")
+            with self._lock:
+                self.write_errors += 1
+            return
+
+        with self._lock:
+            self._bytes -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._bytes += len(data)
+            if self._bytes > self.max_bytes or time.monotonic() - self._last_scan >= self.rescan_interval:
+                # Count what other processes sharing the directory wrote (or deleted) before evicting
+                self._scan()
+                if key in self._index:
+                    self._index.move_to_end(key)
+                self._evict()
+
+    def _drop(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+        with self._lock:
+            self._bytes -= self._index.pop(key, 0)
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the cache fits its budget. Caller holds the lock."""
+        if self._bytes <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        while self._bytes > target and self._index:
+            key, size = self._index.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "write_errors": self.write_errors,
+            }
@@ -0,0 +1,269 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import tempfile
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from config import ARTEMIS_API_KEY, ASSET_MAPPINGS_FILE, ASSET_MAPPINGS_INDEX_FILE, MAPPINGS_REFRESH_INTERVAL
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Version of the compiled index file layout
+INDEX_FORMAT = 1
+
+
+class MappingsDiff(NamedTuple):
+    """Asset changes between two versions of the mappings."""
+    added: List[str]
+    removed: List[str]
+    retyped: List[Tuple[str, str, str]]  # (artemis_id, old type, new type)
+    resymboled: List[Tuple[str, List[str], List[str]]]  # (artemis_id, old symbols, new symbols)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.retyped or self.resymboled)
+
+    def summary(self, limit: int = 10) -> str:
+        """Describe the changes in a few lines, listing at most limit assets per kind."""
+        def sample(items: List[Any]) -> str:
+            shown = ", ".join(str(item) for item in items[:limit])
+            return shown + (f", ... ({len(items) - limit} more)" if len(items) > limit else "")
+
+        if not self.changed:
+            return "No changes"
+        lines = []
+        if self.added:
+            lines.append(f"Added {len(self.added)}: {sample(self.added)}")
+        if self.removed:
+            lines.append(f"Removed {len(self.removed)}: {sample(self.removed)}")
+        if self.retyped:
+            lines.append(f"Retyped {len(self.retyped)}: {sample([f'{i} {old}->{new}' for i, old, new in self.retyped])}")
+        if self.resymboled:
+            lines.append(f"Symbols changed {len(self.resymboled)}: "
+                         f"{sample([f'{i} {old}->{new}' for i, old, new in self.resymboled])}")
+        return "\n".join(lines)
+
+
+def fetch_assets(api_key: str = ARTEMIS_API_KEY) -> List[Dict]:
+    """Fetch all assets from the Artemis API."""
+    from artemis import Artemis  # only needed to refresh the mappings
+
+    client = Artemis(api_key=api_key)
+    response = client.asset.list()
+
+    if isinstance(response, dict) and 'assets' in response:
+        return response['assets']
+    return []
+
+
+def build_mappings(assets: List[Dict]) -> Dict:
+    """Build mappings from the assets data."""
+    mappings = {
+        "artemis_id_to_symbols": {},
+        "symbol_to_artemis_id": {},
+        "artemis_id_to_type": {},
+        "symbol_to_type": {}
+    }
+
+    for asset in assets:
+        if not isinstance(asset, dict):
+            continue
+
+        artemis_id = asset.get("artemis_id")
+        symbol = (asset.get("symbol") or "").lower()
+
+        # Get asset type from metadata.about.asset, default to "application" if not "chain"
+        metadata = asset.get("metadata", {}) or {}
+        about = metadata.get("about", {}) or {}
+        asset_type = "chain" if about.get("asset") == "chain" else "application"
+
+        if not artemis_id or not symbol:
+            continue
+
+        mappings["artemis_id_to_symbols"][artemis_id] = [symbol]
+        mappings["symbol_to_artemis_id"][symbol] = artemis_id
+        mappings["artemis_id_to_type"][artemis_id] = asset_type
+        mappings["symbol_to_type"][symbol] = asset_type
+
+    # Sorted keys keep the file stable between refreshes, so unchanged data gives identical bytes
+    return {name: dict(sorted(mapping.items())) for name, mapping in mappings.items()}
+
+
+def _symbols(value: Any) -> List[str]:
+    return value if isinstance(value, list) else [value]
+
+
+def diff_mappings(old: Dict, new: Dict) -> MappingsDiff:
+    """
+    Compare two versions of the mappings.
+
+    Args:
+        old: The current mappings (empty if there are none yet)
+        new: The freshly built mappings
+
+    Returns:
+        Added, removed, retyped and resymboled assets, each sorted by Artemis ID
+    """
+    old_symbols = old.get("artemis_id_to_symbols", {})
+    new_symbols = new.get("artemis_id_to_symbols", {})
+    old_types = old.get("artemis_id_to_type", {})
+    new_types = new.get("artemis_id_to_type", {})
+    kept = sorted(old_symbols.keys() & new_symbols.keys())
+    return MappingsDiff(
+        added=sorted(new_symbols.keys() - old_symbols.keys()),
+        removed=sorted(old_symbols.keys() - new_symbols.keys()),
+        retyped=[(i, old_types.get(i), new_types.get(i)) for i in kept if old_types.get(i) != new_types.get(i)],
+        resymboled=[
+            (i, _symbols(old_symbols[i]), _symbols(new_symbols[i]))
+            for i in kept if _symbols(old_symbols[i]) != _symbols(new_symbols[i])
+        ],
+    )
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Replace a file so readers see either the old or the new contents, never a partial write.
+
+    The data goes to a temporary file in the same directory, is flushed to disk,
+    and is then renamed over path.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def encode_mappings(mappings: Dict) -> bytes:
+    """Serialize mappings the way they are stored in artemis_mappings.json."""
+    return json.dumps(mappings, indent=2).encode()
+
+
+def source_digest(data: bytes) -> str:
+    """Digest of the mappings file contents, recorded in the compiled index."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def encode_index(mappings: Dict, source: bytes) -> bytes:
+    """
+    Build the compiled index file for a mappings file.
+
+    It holds every lookup table the bot needs, already derived and in compact
+    JSON, plus the digest of the mappings file it was compiled from so a stale
+    index is never used.
+    """
+    id_to_symbols = mappings.get("artemis_id_to_symbols", {})
+    id_to_type = mappings.get("artemis_id_to_type", {})
+    symbol_to_id: Dict[str, str] = {}
+    symbol_to_type: Dict[str, str] = {}
+    for artemis_id, symbols in id_to_symbols.items():
+        for symbol in _symbols(symbols):
+            symbol_to_id[symbol.lower()] = artemis_id
+            symbol_to_type[symbol.lower()] = id_to_type.get(artemis_id, "unknown")
+    index = {
+        "format": INDEX_FORMAT,
+        "source_sha256": source_digest(source),
+        "artemis_id_to_symbols": id_to_symbols,
+        "artemis_id_to_type": id_to_type,
+        "symbol_to_artemis_id": symbol_to_id,
+        "symbol_to_type": symbol_to_type,
+    }
+    return json.dumps(index, separators=(",", ":")).encode()
+
+
+def load_index(index_path: str, source: bytes) -> Optional[Dict]:
+    """
+    Load a compiled index if it was compiled from exactly this mappings file.
+
+    Args:
+        index_path: Path to the compiled index
+        source: Contents of the mappings file
+
+    Returns:
+        The compiled tables, or None if the index is missing, unreadable or stale
+    """
+    try:
+        with open(index_path, "rb") as f:
+            index = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if index.get("format") != INDEX_FORMAT or index.get("source_sha256") != source_digest(source):
+        return None
+    return index
+
+
+def refresh_mappings(path: str = ASSET_MAPPINGS_FILE, index_path: str = ASSET_MAPPINGS_INDEX_FILE,
+                     assets: Optional[List[Dict]] = None, dry_run: bool = False, force: bool = False) -> MappingsDiff:
+    """
+    Fetch the asset list and update the mappings file and its compiled index if anything changed.
+
+    Args:
+        path: Mappings file to update
+        index_path: Compiled index file to write alongside it ('' to skip)
+        assets: Asset list to use instead of fetching it from the API
+        dry_run: Compute the diff without writing anything
+        force: Write the files even if nothing changed
+
+    Returns:
+        The changes between the current and the fetched mappings
+    """
+    started = time.perf_counter()
+    if assets is None:
+        assets = fetch_assets()
+    if not assets:
+        raise ValueError("The Artemis API returned no assets; keeping the current mappings")
+    new_mappings = build_mappings(assets)
+
+    try:
+        with open(path, "rb") as f:
+            current_source = f.read()
+        old_mappings = json.loads(current_source)
+    except (FileNotFoundError, ValueError):
+        current_source, old_mappings = None, {}
+
+    diff = diff_mappings(old_mappings, new_mappings)
+    unchanged = old_mappings == new_mappings
+    index_current = not index_path or (current_source is not None and load_index(index_path, current_source) is not None)
+
+    if dry_run:
+        logger.info(f"Mappings refresh (dry run) for {len(assets)} assets:\n{diff.summary()}")
+        return diff
+    if unchanged and index_current and not force:
+        logger.info(f"Mappings unchanged ({len(assets)} assets), skipped write in {time.perf_counter() - started:.2f}s")
+        return diff
+
+    source = current_source if unchanged and not force else encode_mappings(new_mappings)
+    if index_path:
+        # Index first: a reader that sees the new mappings file then finds a matching index
+        write_atomic(index_path, encode_index(new_mappings, source))
+    if not unchanged or force:
+        write_atomic(path, source)
+    logger.info(f"Mappings updated ({len(assets)} assets) in {time.perf_counter() - started:.2f}s:\n{diff.summary()}")
+    return diff
+
+
+async def run_mappings_refresh_loop(interval: float = MAPPINGS_REFRESH_INTERVAL) -> None:
+    """
+    Refresh the mappings every interval seconds until cancelled.
+
+    The bot's mappings watcher picks up the rewritten file, so new assets
+    become available without a restart.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(refresh_mappings)
+        except Exception as e:
+            logger.error(f"Mappings refresh failed: {str(e)}")
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical async calls into a single execution.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same result instead of starting their own. Each
+    waiter is shielded from the others, so cancelling one waiter (for example
+    a request that timed out) never cancels the shared work for the rest.
+    """
+
+    def __init__(self, name: str = "singleflight"):
+        """
+        Initialize the SingleFlight.
+
+        Args:
+            name: Name used in log messages
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        # Counters
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn for key, or join the run already in flight for key.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            fn: Zero-argument callable returning an awaitable with the result
+
+        Returns:
+            The result of the shared call (exceptions are propagated to every waiter)
+        """
+        self.calls += 1
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+            logger.info(f"Coalesced request into in-flight {self.name} call ({len(self._inflight)} in flight)")
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every waiter was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return call, coalesced and in-flight counts."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
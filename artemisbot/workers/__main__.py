@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Run the render worker processes.
+
+The bot enqueues chart renders when RENDER_BACKEND=queue; these workers take
+them from the shared job queue (RENDER_QUEUE_PATH) and render them.
+
+Usage:
+    python -m artemisbot.workers [--processes 2] [--concurrency 2]
+"""
+
+import os
+import sys
+import argparse
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from artemisbot.workers.supervisor import WorkerSupervisor
+from config import RENDER_WORKERS, RENDER_WORKER_CONCURRENCY
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=RENDER_WORKERS, help="Worker processes to run")
+    parser.add_argument("--concurrency", type=int, default=RENDER_WORKER_CONCURRENCY, help="Jobs rendered at once per process")
+    args = parser.parse_args()
+    WorkerSupervisor(processes=args.processes, concurrency=args.concurrency).run()
+
+
+if __name__ == "__main__":
+    main()
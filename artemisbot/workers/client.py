@@ -0,0 +1,129 @@
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from artemisbot.utils.metrics import REGISTRY, track_stage
+from artemisbot.workers.job_queue import DONE, FAILED, JobQueue, get_job_queue
+from config import RENDER_JOB_TIMEOUT, RENDER_JOB_MAX_ATTEMPTS
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Poll interval while waiting for a job, growing from the first to the last value
+POLL_INTERVALS = (0.05, 0.1, 0.2, 0.5)
+
+
+class RenderQueueClient:
+    """
+    Bot-side handle on the render workers.
+
+    Enqueues render jobs and awaits their results, so the bot process only
+    dispatches and never drives a browser itself. Queue calls run in a thread
+    to keep SQLite off the event loop.
+    """
+
+    def __init__(self, queue: Optional[JobQueue] = None, timeout: float = RENDER_JOB_TIMEOUT):
+        """
+        Initialize the RenderQueueClient.
+
+        Args:
+            queue: Job queue shared with the workers (defaults to get_job_queue())
+            timeout: Seconds to wait for a result, per attempt a job is allowed
+        """
+        self.queue = queue or get_job_queue()
+        self.timeout = timeout
+
+        # Counters
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.timed_out = 0
+
+    async def run(self, kind: str, payload: Dict[str, Any], priority: int = 1) -> Tuple[Optional[bytes], Dict[str, Any]]:
+        """
+        Enqueue a job and wait for a worker to finish it.
+
+        Args:
+            kind: Job kind understood by the workers ("render" or "generate")
+            payload: Job arguments
+            priority: Lower runs first
+
+        Returns:
+            Tuple of the job's binary result and its result metadata
+
+        Raises:
+            ValueError: If the job failed because of the request itself
+            ChartRenderError: If the workers failed or did not answer in time
+        """
+        from artemisbot.chart.chart_generator import ChartRenderError
+
+        job_id = await asyncio.to_thread(self.queue.enqueue, kind, payload, priority)
+        self.submitted += 1
+        deadline = time.monotonic() + self.timeout * RENDER_JOB_MAX_ATTEMPTS
+        polls = 0
+        while True:
+            status = await asyncio.to_thread(self.queue.status, job_id)
+            if status in (DONE, FAILED):
+                break
+            if time.monotonic() >= deadline:
+                # Take the job off the queue so no worker renders a chart nobody will receive
+                if await asyncio.to_thread(self.queue.cancel, job_id, "Nobody waited for the result."):
+                    self.timed_out += 1
+                    logger.warning(f"Render job {job_id} not finished after {self.timeout * RENDER_JOB_MAX_ATTEMPTS:.0f}s")
+                    raise ChartRenderError("The chart renderer is busy right now. Please try again in a moment.")
+                continue  # it finished just now
+            await asyncio.sleep(POLL_INTERVALS[min(polls, len(POLL_INTERVALS) - 1)])
+            polls += 1
+
+        job = await asyncio.to_thread(self.queue.get, job_id)
+        if job.status == FAILED:
+            self.failed += 1
+            if job.error_type == "value":
+                raise ValueError(job.error)
+            raise ChartRenderError(job.error or "Chart generation failed.")
+        self.succeeded += 1
+        return job.result, job.result_meta or {}
+
+    async def render_chart(self, metrics: List[str], tickers: List[str], asset_type: str,
+                           time_period: str, granularity: str, is_percentage: bool = False,
+                           renderer: Optional[str] = None, refresh: bool = False,
+                           priority: int = 1) -> Tuple[bytes, str, str]:
+        """
+        Render a chart on a worker; same arguments and result as ChartGenerator.render_chart_async.
+        """
+        payload = {
+            "metrics": metrics,
+            "tickers": tickers,
+            "asset_type": asset_type,
+            "time_period": time_period,
+            "granularity": granularity,
+            "is_percentage": is_percentage,
+            "renderer": renderer,
+            "refresh": refresh,
+        }
+        with track_stage("queue_render"):
+            chart_image, meta = await self.run("render", payload, priority)
+        return chart_image, meta["chart_url"], meta["title"]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return job counters and the state of the shared queue."""
+        return {
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "queue": self.queue.stats(),
+        }
+
+
+_client = None
+
+
+def get_render_queue_client() -> RenderQueueClient:
+    """Return the process-wide render queue client."""
+    global _client
+    if _client is None:
+        _client = RenderQueueClient()
+        REGISTRY.register_collector("render_queue", _client.stats)
+    return _client
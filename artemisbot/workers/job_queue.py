@@ -0,0 +1,345 @@
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+from config import RENDER_QUEUE_PATH, RENDER_JOB_MAX_ATTEMPTS
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    result BLOB,
+    result_meta TEXT,
+    error TEXT,
+    error_type TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (status, priority, created_at);
+CREATE TABLE IF NOT EXISTS workers (
+    id TEXT PRIMARY KEY,
+    pid INTEGER,
+    host TEXT,
+    started_at REAL,
+    heartbeat_at REAL,
+    jobs_done INTEGER NOT NULL DEFAULT 0,
+    jobs_failed INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class Job(NamedTuple):
+    """A render job and, once finished, its result."""
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    worker_id: Optional[str]
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    result: Optional[bytes]
+    result_meta: Optional[Dict[str, Any]]
+    error: Optional[str]
+    error_type: Optional[str]
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+class JobQueue:
+    """
+    Interface of a render job queue shared by the bot and the render workers.
+
+    Workers claim a job with a lease and must heartbeat before the lease runs
+    out; a job whose lease expires (its worker crashed or hung) is handed to
+    another worker until it runs out of attempts.
+    """
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], priority: int = 1,
+                max_attempts: int = RENDER_JOB_MAX_ATTEMPTS) -> str:
+        """Add a job and return its ID."""
+        raise NotImplementedError
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """Lease the next job to worker_id, or return None if none is waiting."""
+        raise NotImplementedError
+
+    def heartbeat(self, worker_id: str, job_ids: List[str], lease_seconds: float) -> None:
+        """Record that worker_id is alive and extend the leases of its jobs."""
+        raise NotImplementedError
+
+    def complete(self, job_id: str, worker_id: str, result: Optional[bytes], result_meta: Dict[str, Any]) -> None:
+        """Store a job's result."""
+        raise NotImplementedError
+
+    def fail(self, job_id: str, worker_id: str, error: str, error_type: str, retry: bool) -> None:
+        """Record a failed attempt; the job is queued again if retry is set and attempts remain."""
+        raise NotImplementedError
+
+    def cancel(self, job_id: str, error: str) -> bool:
+        """Fail a job nobody is waiting for any more; returns False if it had already finished."""
+        raise NotImplementedError
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by ID."""
+        raise NotImplementedError
+
+    def status(self, job_id: str) -> Optional[str]:
+        """Return a job's status without loading its result."""
+        raise NotImplementedError
+
+    def purge(self, older_than: float) -> int:
+        """Delete jobs that finished more than older_than seconds ago and return how many."""
+        raise NotImplementedError
+
+    def forget_worker(self, worker_id: str) -> None:
+        """Remove a stopped worker from the worker registry."""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Return job counts by status and worker liveness."""
+        raise NotImplementedError
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    A JobQueue in a local SQLite database.
+
+    Works across processes on one host (or any processes sharing the database
+    file on a local volume). Each thread gets its own connection, the database
+    runs in WAL mode so readers do not block the writer, and claims use
+    BEGIN IMMEDIATE so two workers never lease the same job.
+    """
+
+    def __init__(self, path: str = RENDER_QUEUE_PATH):
+        """
+        Initialize the SQLiteJobQueue, creating the database if needed.
+
+        Args:
+            path: Database file path
+        """
+        self.path = path
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], priority: int = 1,
+                max_attempts: int = RENDER_JOB_MAX_ATTEMPTS) -> str:
+        job_id = uuid.uuid4().hex
+        self._conn().execute(
+            "INSERT INTO jobs (id, kind, payload, priority, status, max_attempts, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, kind, json.dumps(payload), priority, QUEUED, max_attempts, time.time())
+        )
+        return job_id
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._requeue_expired(conn, now)
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY priority, created_at LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, lease_expires_at = ?, started_at = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, worker_id, now + lease_seconds, now, row["id"])
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return self.get(row["id"])
+
+    def _requeue_expired(self, conn: sqlite3.Connection, now: float) -> None:
+        """Take back jobs whose worker stopped heartbeating."""
+        expired = conn.execute(
+            "SELECT id, worker_id, attempts, max_attempts FROM jobs WHERE status = ? AND lease_expires_at < ?",
+            (RUNNING, now)
+        ).fetchall()
+        for row in expired:
+            if row["attempts"] < row["max_attempts"]:
+                logger.warning(f"Lease of job {row['id']} on worker {row['worker_id']} expired, requeueing")
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL WHERE id = ?",
+                    (QUEUED, row["id"])
+                )
+            else:
+                logger.warning(f"Lease of job {row['id']} on worker {row['worker_id']} expired, giving up")
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = ?, error = ?, error_type = ? WHERE id = ?",
+                    (FAILED, now, "The chart renderer stopped responding.", "timeout", row["id"])
+                )
+
+    def heartbeat(self, worker_id: str, job_ids: List[str], lease_seconds: float) -> None:
+        conn = self._conn()
+        now = time.time()
+        conn.execute(
+            "INSERT INTO workers (id, pid, host, started_at, heartbeat_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at",
+            (worker_id, os.getpid(), socket.gethostname(), now, now)
+        )
+        for job_id in job_ids:
+            conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND worker_id = ? AND status = ?",
+                (now + lease_seconds, job_id, worker_id, RUNNING)
+            )
+
+    def complete(self, job_id: str, worker_id: str, result: Optional[bytes], result_meta: Dict[str, Any]) -> None:
+        conn = self._conn()
+        updated = conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, result = ?, result_meta = ?, lease_expires_at = NULL "
+            "WHERE id = ? AND worker_id = ? AND status = ?",
+            (DONE, time.time(), result, json.dumps(result_meta), job_id, worker_id, RUNNING)
+        ).rowcount
+        if not updated:
+            # The lease expired and the job was handed to another worker meanwhile
+            logger.warning(f"Discarding result of job {job_id}: worker {worker_id} no longer holds it")
+        conn.execute("UPDATE workers SET jobs_done = jobs_done + 1 WHERE id = ?", (worker_id,))
+
+    def fail(self, job_id: str, worker_id: str, error: str, error_type: str, retry: bool) -> None:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND worker_id = ? AND status = ?",
+                (job_id, worker_id, RUNNING)
+            ).fetchone()
+            if row is not None:
+                if retry and row["attempts"] < row["max_attempts"]:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL, "
+                        "error = ?, error_type = ? WHERE id = ?",
+                        (QUEUED, error, error_type, job_id)
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, finished_at = ?, lease_expires_at = NULL, "
+                        "error = ?, error_type = ? WHERE id = ?",
+                        (FAILED, time.time(), error, error_type, job_id)
+                    )
+            conn.execute("UPDATE workers SET jobs_failed = jobs_failed + 1 WHERE id = ?", (worker_id,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def cancel(self, job_id: str, error: str) -> bool:
+        # A worker still rendering the job has its result discarded by complete()
+        return bool(self._conn().execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, lease_expires_at = NULL, error = ?, error_type = ? "
+            "WHERE id = ? AND status IN (?, ?)",
+            (FAILED, time.time(), error, "cancelled", job_id, QUEUED, RUNNING)
+        ).rowcount)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return Job(
+            id=row["id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            worker_id=row["worker_id"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            result=row["result"],
+            result_meta=json.loads(row["result_meta"]) if row["result_meta"] else None,
+            error=row["error"],
+            error_type=row["error_type"],
+        )
+
+    def status(self, job_id: str) -> Optional[str]:
+        row = self._conn().execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row["status"] if row else None
+
+    def purge(self, older_than: float) -> int:
+        return self._conn().execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+            (DONE, FAILED, time.time() - older_than)
+        ).rowcount
+
+    def forget_worker(self, worker_id: str) -> None:
+        self._conn().execute("DELETE FROM workers WHERE id = ?", (worker_id,))
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._conn()
+        counts = {status: 0 for status in (QUEUED, RUNNING, DONE, FAILED)}
+        for row in conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        oldest = conn.execute("SELECT MIN(created_at) AS t FROM jobs WHERE status = ?", (QUEUED,)).fetchone()["t"]
+        workers = conn.execute("SELECT * FROM workers").fetchall()
+        now = time.time()
+        return {
+            "jobs": counts,
+            "oldest_queued_seconds": now - oldest if oldest else 0.0,
+            "workers": {
+                row["id"]: {
+                    "pid": row["pid"],
+                    "host": row["host"],
+                    "heartbeat_age_seconds": now - row["heartbeat_at"],
+                    "jobs_done": row["jobs_done"],
+                    "jobs_failed": row["jobs_failed"],
+                }
+                for row in workers
+            },
+        }
+
+
+_queue = None
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide render job queue."""
+    global _queue
+    if _queue is None:
+        _queue = SQLiteJobQueue()
+    return _queue
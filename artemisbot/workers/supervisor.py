@@ -0,0 +1,149 @@
+import time
+import uuid
+import signal
+import socket
+import logging
+import multiprocessing
+from typing import Dict, List, Optional
+from artemisbot.workers.job_queue import get_job_queue
+from artemisbot.workers.worker import run_worker
+from config import RENDER_WORKERS, RENDER_WORKER_CONCURRENCY, WORKER_LEASE_SECONDS
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Seconds between checks on the worker processes
+CHECK_INTERVAL = 1.0
+
+# Finished jobs are deleted after this many seconds
+JOB_RETENTION = 3600
+
+# Seconds a stopping worker gets to finish its jobs before it is killed
+STOP_GRACE_SECONDS = 30
+
+
+class WorkerSupervisor:
+    """
+    Keep a fixed number of render worker processes running.
+
+    Restarts workers that exit (including the ones that stop themselves after
+    a hung render) and kills workers whose heartbeat has gone stale, so their
+    jobs' leases expire and other workers pick the jobs up. Runs apart from
+    the bot, so renderers can be scaled (or moved to a bigger machine sharing
+    the queue volume) without touching the dispatcher.
+    """
+
+    def __init__(self, processes: int = RENDER_WORKERS, concurrency: int = RENDER_WORKER_CONCURRENCY,
+                 stale_after: float = WORKER_LEASE_SECONDS):
+        """
+        Initialize the WorkerSupervisor.
+
+        Args:
+            processes: Worker processes to keep running
+            concurrency: Jobs rendered at once by each worker
+            stale_after: Seconds without a heartbeat before a worker is killed
+        """
+        self.processes = max(1, processes)
+        self.concurrency = concurrency
+        self.stale_after = stale_after
+        self.queue = get_job_queue()
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[Optional[multiprocessing.Process]] = [None] * self.processes
+        self._worker_ids: List[Optional[str]] = [None] * self.processes
+        self._started_at: Dict[int, float] = {}
+        self._stopping = False
+
+        # Counters
+        self.restarts = 0
+        self.killed_stale = 0
+
+    def _start(self, slot: int) -> None:
+        # Name the worker here so its registry row can be removed if it dies without cleaning up
+        worker_id = f"{socket.gethostname()}-worker{slot}-{uuid.uuid4().hex[:6]}"
+        process = self._context.Process(
+            target=run_worker, args=(self.concurrency, worker_id), name=f"render-worker-{slot}", daemon=False
+        )
+        process.start()
+        self._workers[slot] = process
+        self._worker_ids[slot] = worker_id
+        self._started_at[process.pid] = time.time()
+        logger.info(f"Started render worker {slot} (pid {process.pid})")
+
+    def _heartbeat_ages(self) -> Dict[int, float]:
+        """Seconds since each worker process last heartbeated, by pid."""
+        now = time.time()
+        return {
+            worker["pid"]: worker["heartbeat_age_seconds"]
+            for worker in self.queue.stats()["workers"].values()
+            # Give new processes time to import and send their first heartbeat
+            if worker["pid"] in self._started_at and now - self._started_at[worker["pid"]] > self.stale_after
+        }
+
+    def check(self) -> None:
+        """Restart exited workers and kill workers that stopped heartbeating."""
+        for pid, age in self._heartbeat_ages().items():
+            if age > self.stale_after:
+                process = next((p for p in self._workers if p is not None and p.pid == pid), None)
+                if process is not None and process.is_alive():
+                    logger.error(f"Render worker pid {pid} missed heartbeats for {age:.0f}s, killing it")
+                    process.kill()
+                    self.killed_stale += 1
+
+        for slot, process in enumerate(self._workers):
+            if process is not None and process.is_alive():
+                continue
+            if process is not None:
+                process.join()
+                self._started_at.pop(process.pid, None)
+                # A killed or crashed worker never reached forget_worker itself
+                self.queue.forget_worker(self._worker_ids[slot])
+                logger.warning(f"Render worker {slot} (pid {process.pid}) exited with code {process.exitcode}, restarting")
+                self.restarts += 1
+            self._start(slot)
+
+    def stop(self, *_) -> None:
+        """Ask the workers to finish their jobs and exit."""
+        self._stopping = True
+
+    def run(self) -> None:
+        """Run the workers until SIGINT or SIGTERM."""
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        logger.info(f"Supervising {self.processes} render workers ({self.concurrency} jobs each)")
+        last_purge = 0.0
+        while not self._stopping:
+            self.check()
+            if time.time() - last_purge > JOB_RETENTION / 10:
+                purged = self.queue.purge(JOB_RETENTION)
+                if purged:
+                    logger.info(f"Purged {purged} finished render jobs")
+                last_purge = time.time()
+            time.sleep(CHECK_INTERVAL)
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop every worker, killing those that do not exit within the grace period."""
+        workers = [p for p in self._workers if p is not None and p.is_alive()]
+        for process in workers:
+            process.terminate()
+        deadline = time.time() + STOP_GRACE_SECONDS
+        for process in workers:
+            process.join(max(0.0, deadline - time.time()))
+            if process.is_alive():
+                logger.warning(f"Render worker pid {process.pid} did not stop in time, killing it")
+                process.kill()
+                process.join()
+        for worker_id in self._worker_ids:
+            if worker_id is not None:
+                self.queue.forget_worker(worker_id)
+        logger.info("Render workers stopped")
+
+    def stats(self) -> Dict[str, int]:
+        """Return supervisor counters."""
+        return {
+            "processes": self.processes,
+            "alive": sum(1 for p in self._workers if p is not None and p.is_alive()),
+            "restarts": self.restarts,
+            "killed_stale": self.killed_stale,
+        }
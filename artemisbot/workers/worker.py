@@ -0,0 +1,196 @@
+import os
+import uuid
+import socket
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+from artemisbot.chart.chart_generator import ChartGenerator, ChartRenderError
+from artemisbot.workers.job_queue import Job, JobQueue, get_job_queue
+from config import (
+    CHART_RENDERER,
+    BROWSER_POOL_PREWARM,
+    RENDER_JOB_TIMEOUT,
+    RENDER_WORKER_CONCURRENCY,
+    WORKER_HEARTBEAT_INTERVAL,
+    WORKER_LEASE_SECONDS,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Seconds between queue polls while idle
+IDLE_POLL_INTERVAL = 0.1
+
+
+class RenderWorker:
+    """
+    A render worker process: claims jobs from the queue and renders them.
+
+    Runs concurrency job slots on one event loop around a local ChartGenerator,
+    and heartbeats every WORKER_HEARTBEAT_INTERVAL seconds to keep the leases
+    of its running jobs. A job that runs past RENDER_JOB_TIMEOUT is given back
+    to the queue and the worker stops once its other jobs finish, since the
+    render thread (and the browser it holds) may be stuck for good; the
+    supervisor then starts a fresh process.
+    """
+
+    def __init__(self, queue: Optional[JobQueue] = None, concurrency: int = RENDER_WORKER_CONCURRENCY,
+                 job_timeout: float = RENDER_JOB_TIMEOUT, heartbeat_interval: float = WORKER_HEARTBEAT_INTERVAL,
+                 lease_seconds: float = WORKER_LEASE_SECONDS, worker_id: Optional[str] = None):
+        """
+        Initialize the RenderWorker.
+
+        Args:
+            queue: Job queue to take jobs from (defaults to get_job_queue())
+            concurrency: Jobs rendered at once by this process
+            job_timeout: Seconds a job may run before it is abandoned
+            heartbeat_interval: Seconds between heartbeats
+            lease_seconds: Lease granted on each claim and heartbeat
+            worker_id: Name of this worker in the queue (generated if not given)
+        """
+        self.queue = queue or get_job_queue()
+        self.concurrency = max(1, concurrency)
+        self.job_timeout = job_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.lease_seconds = lease_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.generator = ChartGenerator(max_workers=self.concurrency, render_backend="local")
+        self._running_jobs: Dict[str, Job] = {}
+        self._stopping: Optional[asyncio.Event] = None
+
+        # Counters
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self.jobs_timed_out = 0
+
+    def stop(self) -> None:
+        """Stop claiming jobs; running jobs are allowed to finish."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def run(self) -> None:
+        """Process jobs until stop() is called or a job hangs."""
+        self._stopping = asyncio.Event()
+        await asyncio.to_thread(self.queue.heartbeat, self.worker_id, [], self.lease_seconds)
+        logger.info(f"Render worker {self.worker_id} started with {self.concurrency} slots")
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        try:
+            await asyncio.gather(*[self._slot() for _ in range(self.concurrency)])
+        finally:
+            heartbeat.cancel()
+            await asyncio.to_thread(self.queue.forget_worker, self.worker_id)
+            # A hung render thread would never finish, so only wait for renders after a clean run
+            self.generator.shutdown(wait=not self.jobs_timed_out)
+            logger.info(f"Render worker {self.worker_id} stopped "
+                        f"({self.jobs_done} done, {self.jobs_failed} failed, {self.jobs_timed_out} timed out)")
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await asyncio.to_thread(
+                    self.queue.heartbeat, self.worker_id, list(self._running_jobs), self.lease_seconds
+                )
+            except Exception as e:
+                logger.error(f"Heartbeat failed: {str(e)}")
+
+    async def _slot(self) -> None:
+        while not self._stopping.is_set():
+            job = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_seconds)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), IDLE_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._process(job)
+
+    async def _process(self, job: Job) -> None:
+        self._running_jobs[job.id] = job
+        try:
+            result, meta = await asyncio.wait_for(self._execute(job), self.job_timeout)
+        except asyncio.TimeoutError:
+            self.jobs_timed_out += 1
+            logger.error(f"Job {job.id} ran past {self.job_timeout:.0f}s, giving it back and restarting")
+            await asyncio.to_thread(
+                self.queue.fail, job.id, self.worker_id, "The chart took too long to render. Please try again.",
+                "timeout", True
+            )
+            self._stopping.set()
+        except ChartRenderError as e:
+            self.jobs_failed += 1
+            await asyncio.to_thread(self.queue.fail, job.id, self.worker_id, str(e), "render", True)
+        except ValueError as e:
+            # A problem with the request itself; another attempt would fail the same way
+            self.jobs_failed += 1
+            await asyncio.to_thread(self.queue.fail, job.id, self.worker_id, str(e), "value", False)
+        except Exception as e:
+            self.jobs_failed += 1
+            logger.error(f"Job {job.id} failed: {str(e)}")
+            await asyncio.to_thread(
+                self.queue.fail, job.id, self.worker_id, "Chart generation failed. Please try again.", "error", True
+            )
+        else:
+            self.jobs_done += 1
+            await asyncio.to_thread(self.queue.complete, job.id, self.worker_id, result, meta)
+        finally:
+            del self._running_jobs[job.id]
+
+    async def _execute(self, job: Job) -> Tuple[Optional[bytes], Dict[str, Any]]:
+        """Run a job and return its binary result and metadata."""
+        p = job.payload
+        args = (p["metrics"], p["tickers"], p["asset_type"], p["time_period"], p["granularity"], p["is_percentage"])
+        if job.kind == "render":
+            chart_image, chart_url, title = await self.generator.render_chart_async(
+                *args, renderer=p.get("renderer"), refresh=p.get("refresh", False)
+            )
+            return chart_image, {"chart_url": chart_url, "title": title}
+        if job.kind == "generate":
+            chart_image, chart_url, title, analysis = await self.generator.generate_chart_async(*args)
+            return chart_image, {"chart_url": chart_url, "title": title, "analysis": analysis}
+        raise ValueError(f"Unknown job kind: {job.kind}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return this worker's job counters."""
+        return {
+            "worker_id": self.worker_id,
+            "running": len(self._running_jobs),
+            "jobs_done": self.jobs_done,
+            "jobs_failed": self.jobs_failed,
+            "jobs_timed_out": self.jobs_timed_out,
+        }
+
+
+def run_worker(concurrency: int = RENDER_WORKER_CONCURRENCY, worker_id: Optional[str] = None) -> None:
+    """Entry point of a worker process: render jobs until SIGTERM or a hung job."""
+    import signal
+    import atexit
+    import threading
+    from artemisbot.chart.browser_pool import get_browser_pool
+    from artemisbot.data.client import close_series_source
+    from artemisbot.utils.asset_mappings import start_mappings_watcher
+
+    start_mappings_watcher()
+
+    if CHART_RENDERER == "browser":
+        browser_pool = get_browser_pool()
+        atexit.register(browser_pool.close)
+        if BROWSER_POOL_PREWARM:
+            threading.Thread(target=browser_pool.start, daemon=True).start()
+
+    worker = RenderWorker(concurrency=concurrency, worker_id=worker_id)
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, worker.stop)
+        try:
+            await worker.run()
+        finally:
+            await close_series_source()
+
+    asyncio.run(main())
+    if worker.jobs_timed_out:
+        # Skip joining the hung render thread at interpreter exit; the supervisor starts a replacement
+        os._exit(1)
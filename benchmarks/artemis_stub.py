@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+A local stand-in for the Artemis data API.
+
+Serves GET /data/<metric>/?symbols=...&startDate=...&endDate=... with the same
+response shape as the real API, using the deterministic FakeSeriesSource
+series. Latency and a failure rate can be injected to exercise the data
+client's connection pooling and retries.
+
+Usage:
+    python benchmarks/artemis_stub.py [--port 8765] [--latency 0.05] [--fail-rate 0.1]
+
+Then point the bot or the benchmarks at it with
+ARTEMIS_API_BASE_URL=http://127.0.0.1:8765
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import threading
+from datetime import date
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artemisbot.data.client import API_METRIC_NAMES
+from artemisbot.data.fake_source import FakeSeriesSource
+
+# Map data API metric name back to the Artemis metric ID
+METRIC_IDS = {name: metric for metric, name in API_METRIC_NAMES.items()}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler for the stub data API; settings live on the server."""
+
+    protocol_version = "HTTP/1.1"  # keep connections alive like the real API
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            # Each TCP connection has its own client port, so this counts connections opened
+            server.connections.add(self.client_address)
+        if server.latency:
+            time.sleep(server.latency)
+        if server.fail_rate and random.random() < server.fail_rate:
+            return self._send(503, {"error": "stub failure"})
+
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        if len(parts) != 2 or parts[0] != "data" or parts[1] not in METRIC_IDS:
+            return self._send(404, {"error": "not found"})
+
+        query = parse_qs(url.query)
+        try:
+            symbols = query["symbols"][0].split(",")
+            start = date.fromisoformat(query["startDate"][0])
+            end = date.fromisoformat(query["endDate"][0])
+        except (KeyError, ValueError):
+            return self._send(400, {"error": "symbols, startDate and endDate are required"})
+
+        metric_name = parts[1]
+        metric = METRIC_IDS[metric_name]
+        assets = {}
+        for symbol in symbols:
+            points = asyncio.run(server.source.fetch_series(symbol, metric, "1d", start, end))
+            assets[symbol] = {metric_name: [{"date": day.isoformat(), "val": value} for day, value in points]}
+        self._send(200, {"data": {"symbols": assets}})
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub(port: int = 0, latency: float = 0.0, fail_rate: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Start the stub server in a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        latency: Seconds to sleep before answering each request
+        fail_rate: Fraction of requests answered with HTTP 503
+
+    Returns:
+        The running server; its base URL is f"http://127.0.0.1:{server.server_port}"
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.fail_rate = fail_rate
+    server.source = FakeSeriesSource()
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.connections = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of delay per request")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests that fail with 503")
+    args = parser.parse_args()
+
+    server = start_stub(args.port, args.latency, args.fail_rate)
+    print(f"Artemis data API stub listening on http://127.0.0.1:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
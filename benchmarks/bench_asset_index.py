@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark asset resolution and did-you-mean suggestions.
+
+Builds an AssetIndex over the real asset mappings and over a synthetic
+universe of --assets random IDs, then times exact lookups, and suggestions for
+typo'd queries (one character dropped, two swapped, or a prefix), against a
+linear scan with the same edit distance as the baseline.
+
+Usage:
+    python benchmarks/bench_asset_index.py [--assets 50000] [--queries 1000]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import string
+import argparse
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artemisbot.utils.asset_index import AssetIndex, edit_distance, get_asset_index
+
+
+def synthetic_mappings(count: int, rng: random.Random) -> dict:
+    """Random IDs with one symbol each, roughly shaped like real asset IDs."""
+    mappings = {}
+    while len(mappings) < count:
+        name = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12)))
+        if rng.random() < 0.2:
+            name += "-" + "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 6)))
+        mappings[name] = [name.replace("-", "")[:rng.randint(2, 5)] + str(len(mappings))]
+    return mappings
+
+
+def typo(key: str, rng: random.Random) -> str:
+    """Drop a character, swap two neighbours or keep a prefix."""
+    kind = rng.randrange(3)
+    if kind == 0 and len(key) > 3:
+        i = rng.randrange(len(key))
+        return key[:i] + key[i + 1:]
+    if kind == 1 and len(key) > 3:
+        i = rng.randrange(len(key) - 1)
+        return key[:i] + key[i + 1] + key[i] + key[i + 2:]
+    return key[:max(2, len(key) // 2)]
+
+
+def linear_suggest(keys: list, query: str) -> str:
+    """Baseline: the closest key by edit distance over every key."""
+    return min(keys, key=lambda key: edit_distance(query, key, len(query) + len(key)))
+
+
+def run(name: str, index: AssetIndex, ids: list, queries: int, rng: random.Random, baseline: bool) -> dict:
+    exact = [rng.choice(ids) for _ in range(queries)]
+    typos = [typo(artemis_id, rng) for artemis_id in exact]
+
+    started = time.perf_counter()
+    for query in exact:
+        index.lookup(query)
+    lookup_us = (time.perf_counter() - started) / queries * 1e6
+
+    started = time.perf_counter()
+    hits = 0
+    for artemis_id, query in zip(exact, typos):
+        suggestions = index.suggest(query)
+        hits += any(s.id == artemis_id for s in suggestions)
+    suggest_ms = (time.perf_counter() - started) / queries * 1000
+
+    result = {
+        "index": name,
+        "stats": index.stats(),
+        "lookup_us": round(lookup_us, 2),
+        "suggest_ms": round(suggest_ms, 3),
+        "suggest_top3_hit_rate": round(hits / queries, 3),
+    }
+    if baseline:
+        sample = typos[:min(queries, 50)]
+        started = time.perf_counter()
+        for query in sample:
+            linear_suggest(ids, query)
+        result["linear_scan_ms"] = round((time.perf_counter() - started) / len(sample) * 1000, 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=50000, help="Synthetic assets to index")
+    parser.add_argument("--queries", type=int, default=1000, help="Queries per measurement")
+    parser.add_argument("--no-baseline", action="store_true", help="Skip the linear-scan baseline")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    real = get_asset_index()
+    results = [run("artemis_mappings", real, real.ids(), args.queries, rng, not args.no_baseline)]
+
+    mappings = synthetic_mappings(args.assets, rng)
+    started = time.perf_counter()
+    synthetic = AssetIndex(mappings, {})
+    build_ms = (time.perf_counter() - started) * 1000
+    result = run("synthetic", synthetic, list(mappings), args.queries, rng, not args.no_baseline)
+    result["build_ms"] = round(build_ms, 1)
+    results.append(result)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
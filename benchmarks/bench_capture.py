@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark the two chart capture modes used by take_screenshot.
+
+Loads a chart page once in a headless Chrome session, then repeatedly captures
+the chart region with the browser-clipped CDP mode and with the full
+screenshot plus PIL crop mode, reporting latency and output size for each.
+
+Usage:
+    python benchmarks/bench_capture.py [--url URL] [--runs 20]
+
+Without --url a synthetic page with a Highcharts-sized SVG chart is used, so
+no network access or Artemis credentials are needed.
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import statistics
+import urllib.parse
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artemisbot.chart.browser_pool import launch_driver
+from artemisbot.chart.screenshot import _locate_chart, capture_chart_cdp, capture_chart_pil
+
+SYNTHETIC_PAGE = """<!DOCTYPE html>
+<html><body style="margin:0;background:#fff">
+<div style="height:140px"></div>
+<div class="highcharts-container" style="width:1200px;height:600px;margin-left:200px">
+<svg width="1200" height="600" xmlns="http://www.w3.org/2000/svg">
+<rect width="1200" height="600" fill="#101018"/>
+<polyline fill="none" stroke="#8A88FF" stroke-width="3" points="{points}"/>
+</svg>
+</div>
+</body></html>"""
+
+
+def synthetic_url() -> str:
+    """Build a data: URL for a page with a single synthetic chart."""
+    points = " ".join(f"{x * 12},{300 + int(200 * ((x * 37) % 17 - 8) / 8)}" for x in range(100))
+    return "data:text/html," + urllib.parse.quote(SYNTHETIC_PAGE.format(points=points))
+
+
+def bench(fn, driver, location, size, runs: int) -> dict:
+    """Time runs captures with fn and summarize latency and output size."""
+    timings = []
+    data = b""
+    for _ in range(runs):
+        start = time.perf_counter()
+        data = fn(driver, location, size)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "runs": runs,
+        "mean_ms": round(statistics.mean(timings), 2),
+        "p50_ms": round(timings[len(timings) // 2], 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 2),
+        "bytes": len(data),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Chart page to capture (defaults to a synthetic page)")
+    parser.add_argument("--runs", type=int, default=20, help="Captures per mode")
+    args = parser.parse_args()
+
+    driver = launch_driver()
+    try:
+        driver.get(args.url or synthetic_url())
+        location, size = _locate_chart(driver)
+        if not size["width"] or not size["height"]:
+            sys.exit("No highcharts-container found on the page")
+
+        # Warm up both paths once before timing
+        capture_chart_cdp(driver, location, size)
+        capture_chart_pil(driver, location, size)
+
+        results = {
+            "chart_size": size,
+            "cdp": bench(capture_chart_cdp, driver, location, size, args.runs),
+            "pil": bench(capture_chart_pil, driver, location, size, args.runs),
+        }
+        print(json.dumps(results, indent=2))
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
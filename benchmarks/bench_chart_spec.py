@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Replay a chart request log and compare cache hit rates and URL build cost
+with and without canonical ChartSpec keys.
+
+The log is synthetic: --charts distinct charts requested with a Zipf-like
+popularity, each request typed the way users vary it (symbol or ID, '$' and
+case, metric aliases, a metric repeated). Each request goes through
+an LRU of --cache-size entries keyed two ways:
+
+- typed: metrics in the order they were typed, asset resolved to its ID (the
+  key before ChartSpec, which rejected aliases; they are de-aliased here so
+  only duplicates differ)
+- spec: ChartSpec.cache_key, with aliases and duplicates normalized
+
+'vs' metrics typed in the other order draw a different chart (the first metric
+is the line), so they are not varied here.
+
+Usage:
+    python benchmarks/bench_chart_spec.py [--requests 20000] [--charts 300] [--cache-size 200]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from collections import OrderedDict
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artemisbot.chart.chart_spec import METRIC_ALIASES, canonical_metric, chart_spec_cache_stats
+from artemisbot.chart.url_builder import build_chart_url, chart_spec_key
+from artemisbot.utils.asset_index import get_asset_index
+from artemisbot.utils.command_parser import parse_command
+
+PERIODS = ["1w", "1m", "3m", "1y"]
+GRANULARITIES = ["1d", "1w"]
+PAIRS = [["price"], ["tvl"], ["fees"], ["price", "tvl"], ["fees", "revenue"], ["price", "mc"], ["volume", "price"]]
+ALIASES_BY_METRIC = {}
+for alias, metric in METRIC_ALIASES.items():
+    ALIASES_BY_METRIC.setdefault(metric, []).append(alias)
+
+
+def charts(count: int, rng: random.Random) -> list:
+    """Distinct charts as (metrics, asset info, period, granularity)."""
+    index = get_asset_index()
+    ids = sorted(index.ids())
+    chosen = set()
+    while len(chosen) < count:
+        chosen.add((rng.randrange(len(PAIRS)), rng.choice(ids), rng.choice(PERIODS), rng.choice(GRANULARITIES)))
+    return [(PAIRS[p], index.by_id(i), period, granularity) for p, i, period, granularity in sorted(chosen)]
+
+
+def typed_request(chart: tuple, rng: random.Random) -> tuple:
+    """A command for chart as a user might type it, and its de-aliased metrics in typed order."""
+    metrics, asset, period, granularity = chart
+    metrics = list(metrics)
+    if rng.random() < 0.05:
+        metrics.append(metrics[0])
+    typed = [rng.choice(ALIASES_BY_METRIC[m]) if m in ALIASES_BY_METRIC and rng.random() < 0.2 else m for m in metrics]
+    name = rng.choice([asset["id"], asset["symbol"], "$" + asset["symbol"].upper(), asset["id"].capitalize()])
+    text = f"{' vs '.join(typed)} {name} {period} {granularity}"
+    return text, [canonical_metric(m) for m in typed], asset["id"], period, granularity
+
+
+class LRU:
+    """Entry-count LRU tracking hits."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.lookups = 0
+
+    def access(self, key: str) -> None:
+        self.lookups += 1
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = True
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def hit_rate(self) -> float:
+        return round(self.hits / max(1, self.lookups), 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Requests in the replayed log")
+    parser.add_argument("--charts", type=int, default=300, help="Distinct charts requested")
+    parser.add_argument("--cache-size", type=int, default=200, help="Entries in the simulated chart cache")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    chart_list = charts(args.charts, rng)
+    weights = [1 / (rank + 1) for rank in range(len(chart_list))]
+    log = [typed_request(chart, rng) for chart in rng.choices(chart_list, weights, k=args.requests)]
+
+    typed_cache, spec_cache = LRU(args.cache_size), LRU(args.cache_size)
+    typed_keys, spec_keys = set(), set()
+
+    started = time.perf_counter()
+    for _, typed, artemis_id, period, granularity in log:
+        build_chart_url(typed, [artemis_id], "", period, granularity)
+    url_rebuild_us = (time.perf_counter() - started) / len(log) * 1e6
+
+    started = time.perf_counter()
+    for text, typed, artemis_id, period, granularity in log:
+        spec = parse_command(text)
+        spec.url
+        spec_cache.access(spec.cache_key)
+        spec_keys.add(spec.cache_key)
+    spec_us = (time.perf_counter() - started) / len(log) * 1e6
+
+    for _, typed, artemis_id, period, granularity in log:
+        key = chart_spec_key(typed, [artemis_id], period, granularity)
+        typed_cache.access(key)
+        typed_keys.add(key)
+
+    print(json.dumps({
+        "requests": len(log),
+        "distinct_charts": len(chart_list),
+        "cache_size": args.cache_size,
+        "typed_keys": {"distinct": len(typed_keys), "hit_rate": typed_cache.hit_rate()},
+        "spec_keys": {"distinct": len(spec_keys), "hit_rate": spec_cache.hit_rate()},
+        "build_chart_url_us": round(url_rebuild_us, 1),
+        "parse_and_memoized_url_us": round(spec_us, 1),
+        "memo": chart_spec_cache_stats(),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
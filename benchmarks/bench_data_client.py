@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Artemis data client against the local stub API.
+
+Fetches the series behind a set of charts concurrently, first cold and then
+warm, and reports latency, HTTP requests, TCP connections opened, retries,
+fetches avoided by the series cache and bytes saved. With --fail-rate the
+stub fails some requests with HTTP 503 so the retry path is exercised too.
+
+Usage:
+    python benchmarks/bench_data_client.py [--latency 0.05] [--fail-rate 0.1] [--rounds 5]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artemis_stub import start_stub
+from artemisbot.data.client import ArtemisDataClient
+from artemisbot.data.timeseries import period_window
+
+# (artemis_id, metric, granularity, time_period); some share a series on purpose
+FETCHES = [
+    ("ethereum", "FEES", "1d", "3m"),
+    ("ethereum", "FEES", "1d", "1m"),
+    ("ethereum", "REVENUE", "1d", "3m"),
+    ("solana", "PRICE", "1d", "1y"),
+    ("solana", "PRICE", "1d", "1w"),
+    ("bitcoin", "MC", "1w", "all"),
+    ("aave", "TVL", "1d", "6m"),
+    ("aave", "TVL", "1d", "6m"),
+]
+
+
+async def fetch_all(client: ArtemisDataClient) -> float:
+    """Fetch every benchmark series concurrently and return the elapsed milliseconds."""
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        client.fetch_series(artemis_id, metric, granularity, *period_window(period))
+        for artemis_id, metric, granularity, period in FETCHES
+    ])
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(args) -> dict:
+    server = start_stub(latency=args.latency, fail_rate=args.fail_rate)
+    client = ArtemisDataClient(api_key="stub", base_url=f"http://127.0.0.1:{server.server_port}", backoff=0.05)
+    try:
+        cold_ms = await fetch_all(client)
+        warm_ms = [await fetch_all(client) for _ in range(args.rounds)]
+
+        # Bypass the cache to measure connection reuse across repeated requests
+        client.cache.clear()
+        uncached_ms = await fetch_all(client)
+    finally:
+        await client.aclose()
+        server.shutdown()
+
+    stats = client.stats()
+    return {
+        "fetches_per_round": len(FETCHES),
+        "cold_ms": round(cold_ms, 2),
+        "warm_avg_ms": round(sum(warm_ms) / len(warm_ms), 2),
+        "uncached_ms": round(uncached_ms, 2),
+        "http_requests": stats["requests"],
+        "tcp_connections": len(server.connections),
+        "retries": stats["retries"],
+        "failures": stats["failures"],
+        "coalesced": stats["inflight"]["coalesced"],
+        "fetches_avoided": stats["cache"]["fetches_avoided"],
+        "partial_fetches": stats["cache"]["partial_fetches"],
+        "bytes_downloaded": stats["cache"]["bytes_downloaded"],
+        "bytes_saved": stats["cache"]["bytes_saved"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub delay per request in seconds")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of stub requests that fail with 503")
+    parser.add_argument("--rounds", type=int, default=5, help="Warm rounds after the cold round")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
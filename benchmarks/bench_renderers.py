@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Compare latency and memory of the native and Selenium chart renderers.
+
+The native renderer draws charts from FakeSeriesSource data, so it runs
+offline. The Selenium renderer is only measured with --browser, since it needs
+Chrome and access to the chart builder (use --url to point it at a local page).
+
+Usage:
+    python benchmarks/bench_renderers.py [--runs 10] [--browser] [--url URL]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import resource
+import statistics
+import tracemalloc
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artemisbot.chart import native_renderer
+from artemisbot.chart.url_builder import build_chart_config, build_chart_url
+from artemisbot.data.fake_source import FakeSeriesSource
+
+# (metrics, tickers, time_period, granularity, is_percentage)
+CHARTS = [
+    (["price"], ["solana"], "1w", "1d", False),
+    (["fees", "revenue"], ["ethereum"], "3m", "1d", False),
+    (["tvl"], ["aave"], "1y", "1w", True),
+    (["price", "mc"], ["bitcoin"], "all", "1m", False),
+]
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MB."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def children_peak_rss_mb() -> float:
+    """Peak resident set size of any waited-for child process (e.g. Chrome) in MB."""
+    return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+
+
+def summarize(timings) -> dict:
+    timings = sorted(timings)
+    return {
+        "runs": len(timings),
+        "mean_ms": round(statistics.mean(timings), 2),
+        "p50_ms": round(timings[len(timings) // 2], 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 2),
+    }
+
+
+def bench_native(runs: int) -> dict:
+    """Fetch fake series and draw every benchmark chart runs times."""
+    source = FakeSeriesSource()
+    configs = [(build_chart_config(m, t, "chain", p, g, pct), p, g) for m, t, p, g, pct in CHARTS]
+
+    def render(config, period, granularity):
+        points = asyncio.run(native_renderer.fetch_chart_data(config, source, period, granularity))
+        return native_renderer.draw_chart(config, points, granularity)
+
+    rss_before = rss_mb()
+    timings = []
+    for _ in range(runs):
+        for config in configs:
+            start = time.perf_counter()
+            render(*config)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    # Measure allocations in a separate pass, since tracing slows rendering down
+    tracemalloc.start()
+    for config in configs:
+        render(*config)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = summarize(timings)
+    result["python_peak_alloc_mb"] = round(peak / 1024 / 1024, 2)
+    result["rss_growth_mb"] = round(rss_mb() - rss_before, 2)
+    return result
+
+
+def bench_browser(runs: int, url: str = None) -> dict:
+    """Render every benchmark chart with take_screenshot, bypassing the screenshot cache."""
+    from artemisbot.chart.screenshot import take_screenshot, SCREENSHOT_CACHE
+    from artemisbot.chart.browser_pool import get_browser_pool
+
+    urls = [url] if url else [build_chart_url(m, t, "chain", p, g, pct) for m, t, p, g, pct in CHARTS]
+    rss_before = rss_mb()
+    timings = []
+    errors = 0
+    for _ in range(runs):
+        for chart_url in urls:
+            SCREENSHOT_CACHE.clear()
+            start = time.perf_counter()
+            result = take_screenshot(chart_url)
+            timings.append((time.perf_counter() - start) * 1000)
+            if not isinstance(result, bytes):
+                errors += 1
+    get_browser_pool().close()
+
+    result = summarize(timings)
+    result["errors"] = errors
+    result["rss_growth_mb"] = round(rss_mb() - rss_before, 2)
+    result["chrome_peak_rss_mb"] = round(children_peak_rss_mb(), 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Renders per chart")
+    parser.add_argument("--browser", action="store_true", help="Also benchmark the Selenium renderer")
+    parser.add_argument("--url", help="Chart page for the Selenium renderer (defaults to the chart builder)")
+    args = parser.parse_args()
+
+    if not native_renderer.is_available():
+        sys.exit("matplotlib is not installed")
+
+    results = {"native": bench_native(args.runs)}
+    if args.browser:
+        results["selenium"] = bench_browser(args.runs, args.url)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Compare the memory used by time series held as Python objects and as Series.
+
+Builds the same synthetic daily history (assets x metrics x years) as a list
+of {"date", "val"} dicts per series (the API JSON shape), as a list of
+(date, float) tuples, and as NumPy-backed Series, and reports the traced
+allocation of each along with the time to slice a 3m window from every series.
+
+Usage:
+    python benchmarks/bench_series_memory.py [--assets 200] [--metrics 10] [--years 3]
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+from datetime import date, timedelta
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artemisbot.chart.url_builder import METRIC_MAP
+from artemisbot.data.series import Series
+from artemisbot.data.timeseries import period_window, slice_points
+
+
+def build(kind: str, assets: int, metrics: list, days: int):
+    """Build every series in the given representation."""
+    first_day = date.today() - timedelta(days=days - 1)
+    store = {}
+    for asset in range(assets):
+        for metric in metrics:
+            points = [(first_day + timedelta(days=i), float(asset * 1000 + i)) for i in range(days)]
+            if kind == "dicts":
+                store[(f"asset{asset}", metric)] = [{"date": day.isoformat(), "val": value} for day, value in points]
+            elif kind == "tuples":
+                store[(f"asset{asset}", metric)] = points
+            else:
+                store[(f"asset{asset}", metric)] = Series.from_points(f"asset{asset}", metric, "1d", points)
+    return store
+
+
+def measure(kind: str, assets: int, metrics: list, days: int) -> dict:
+    """Trace the allocation of one representation and time a window slice over it."""
+    gc.collect()
+    tracemalloc.start()
+    store = build(kind, assets, metrics, days)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start, end = period_window("3m")
+    started = time.perf_counter()
+    for value in store.values():
+        if kind == "series":
+            value.window(start, end)
+        elif kind == "tuples":
+            slice_points(value, start, end)
+    slice_ms = (time.perf_counter() - started) * 1000
+    return {
+        "mb": round(current / 1024 / 1024, 2),
+        "bytes_per_point": round(current / (len(store) * days), 1),
+        "slice_3m_ms": round(slice_ms, 2) if kind != "dicts" else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=200, help="Number of assets")
+    parser.add_argument("--metrics", type=int, default=10, help="Metrics per asset (at most %d)" % len(METRIC_MAP))
+    parser.add_argument("--years", type=int, default=3, help="Years of daily history")
+    args = parser.parse_args()
+
+    metrics = list(METRIC_MAP.values())[:args.metrics]
+    days = args.years * 365
+    results = {"series_count": args.assets * len(metrics), "points_per_series": days}
+    for kind in ("dicts", "tuples", "series"):
+        results[kind] = measure(kind, args.assets, metrics, days)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
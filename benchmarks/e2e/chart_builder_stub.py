@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+A local stand-in for the Artemis chart builder.
+
+Serves GET /chart-builder/<url-encoded chart config> with a page that draws
+one SVG line per series of the config into a .highcharts-container after
+--render-delay seconds, and exposes a minimal Highcharts.charts object so the
+readiness check and capture in take_screenshot work exactly as on the real
+page. Charts whose config title contains "nodata" show "No data available".
+
+Usage:
+    python benchmarks/e2e/chart_builder_stub.py [--port 8766] [--render-delay 0.3]
+
+Then point the bot at it with
+CHART_BUILDER_URL=http://127.0.0.1:8766/chart-builder
+"""
+
+import json
+import argparse
+import threading
+from urllib.parse import unquote, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Chart builder stub</title>
+<style>
+body { margin: 0; font-family: sans-serif; background: #fff; }
+header { height: 120px; padding: 16px; }
+.highcharts-container { position: relative; width: 1200px; height: 600px; margin: 0 40px; }
+</style>
+</head>
+<body>
+<header><h1 id="title"></h1></header>
+<div id="chart"></div>
+<script>
+var config = __CONFIG__;
+var renderDelayMs = __DELAY_MS__;
+var colors = ["#8A88FF", "#EFCE6C", "#FF6B6B", "#4ECDC4", "#45B7D1"];
+window.Highcharts = {charts: []};
+document.getElementById("title").textContent = config.title || "";
+
+function draw() {
+    if ((config.title || "").toLowerCase().indexOf("nodata") !== -1) {
+        document.getElementById("chart").textContent = "No data available";
+        return;
+    }
+    var container = document.createElement("div");
+    container.className = "highcharts-container";
+    var width = 1200, height = 600, count = 90;
+    var svg = document.createElementNS("http://www.w3.org/2000/svg", "svg");
+    svg.setAttribute("width", width);
+    svg.setAttribute("height", height);
+    var chart = {hasLoaded: true, series: []};
+    (config.series || []).forEach(function (item, s) {
+        var seed = 0, key = item.asset.artemisId + item.metric.artemisId;
+        for (var k = 0; k < key.length; k++) seed = (seed * 31 + key.charCodeAt(k)) % 9973;
+        var points = [], coords = [];
+        for (var i = 0; i < count; i++) {
+            var x = 40 + i * (width - 80) / (count - 1);
+            var y = height / 2 + Math.sin((i + seed) / 9) * 150 + Math.cos((i * seed) % 17) * 20;
+            points.push({plotX: x, plotY: y, graphic: {}});
+            coords.push(x.toFixed(1) + "," + y.toFixed(1));
+        }
+        var line = document.createElementNS("http://www.w3.org/2000/svg", "polyline");
+        line.setAttribute("points", coords.join(" "));
+        line.setAttribute("fill", "none");
+        line.setAttribute("stroke", colors[s % colors.length]);
+        line.setAttribute("stroke-width", "2");
+        svg.appendChild(line);
+        chart.series.push({visible: true, points: points, graph: line,
+                           afterAnimate: function () {}, finishedAnimating: true});
+    });
+    container.appendChild(svg);
+    document.getElementById("chart").appendChild(container);
+    Highcharts.charts.push(chart);
+}
+setTimeout(draw, renderDelayMs);
+</script>
+</body>
+</html>
+"""
+
+
+class ChartBuilderHandler(BaseHTTPRequestHandler):
+    """Request handler for the chart-builder stub; settings live on the server."""
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        prefix = "/chart-builder/"
+        if not path.startswith(prefix):
+            return self._send(404, b"not found", "text/plain")
+        try:
+            config = json.loads(unquote(path[len(prefix):]))
+        except ValueError:
+            return self._send(400, b"bad chart config", "text/plain")
+        with self.server.lock:
+            self.server.requests += 1
+        page = PAGE.replace("__CONFIG__", json.dumps(config)).replace(
+            "__DELAY_MS__", str(int(self.server.render_delay * 1000))
+        )
+        self._send(200, page.encode(), "text/html; charset=utf-8")
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_chart_builder(port: int = 0, render_delay: float = 0.3) -> ThreadingHTTPServer:
+    """
+    Start the chart-builder stub in a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        render_delay: Seconds the page waits before drawing the chart
+
+    Returns:
+        The running server; its base URL is f"http://127.0.0.1:{server.server_port}/chart-builder"
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), ChartBuilderHandler)
+    server.daemon_threads = True
+    server.render_delay = render_delay
+    server.lock = threading.Lock()
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8766, help="Port to listen on")
+    parser.add_argument("--render-delay", type=float, default=0.3, help="Seconds before the page draws the chart")
+    args = parser.parse_args()
+
+    server = start_chart_builder(args.port, args.render_delay)
+    print(f"Chart builder stub listening on http://127.0.0.1:{server.server_port}/chart-builder")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+A local stand-in for the OpenAI chat completions API.
+
+Answers POST /v1/chat/completions with a fixed summary after --latency
+seconds, for both the image and the text prompts the bot sends.
+
+Usage:
+    python benchmarks/e2e/openai_stub.py [--port 8767] [--latency 1.5]
+
+Then point the bot at it with
+OPENAI_BASE_URL=http://127.0.0.1:8767/v1 OPENAI_API_KEY=stub
+"""
+
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SUMMARY = (
+    "The series rose steadily over the period with a sharp drawdown mid-way, "
+    "then recovered to a new high. Volatility eased towards the end."
+)
+
+
+class OpenAIHandler(BaseHTTPRequestHandler):
+    """Request handler for the OpenAI stub; settings live on the server."""
+
+    protocol_version = "HTTP/1.1"  # the openai client keeps connections alive
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            return self._send(404, {"error": {"message": "not found"}})
+        try:
+            request = json.loads(body)
+        except ValueError:
+            return self._send(400, {"error": {"message": "invalid JSON"}})
+        with self.server.lock:
+            self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self._send(200, {
+            "id": f"chatcmpl-stub-{self.server.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": SUMMARY},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 40, "total_tokens": 140},
+        })
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_openai_stub(port: int = 0, latency: float = 1.5) -> ThreadingHTTPServer:
+    """
+    Start the OpenAI stub in a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        latency: Seconds to wait before answering each completion
+
+    Returns:
+        The running server; its base URL is f"http://127.0.0.1:{server.server_port}/v1"
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), OpenAIHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.lock = threading.Lock()
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8767, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=1.5, help="Seconds per completion")
+    args = parser.parse_args()
+
+    server = start_openai_stub(args.port, args.latency)
+    print(f"OpenAI stub listening on http://127.0.0.1:{server.server_port}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
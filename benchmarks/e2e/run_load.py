@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Drive the bot's group chart handler end to end, fully offline, and report
+latency, throughput and resource use as JSON.
+
+Everything the bot talks to is replaced by a local stub: the chart builder
+page take_screenshot loads (chart_builder_stub), the OpenAI API
+(openai_stub), the Telegram Bot API (telegram_stub) and, for the native
+renderer, the Artemis data API (benchmarks/artemis_stub). Each request is a
+'=art ...' group message from its own chat and user, so per-chat rate limits
+do not interfere, passed to handle_group_message at --concurrency.
+
+Reported per request:
+- latency: from the update arriving to the handler returning (chart sent and
+  its caption edited with the summary)
+- time_to_photo: from the update arriving to the stub receiving sendPhoto
+
+plus throughput, chart outcomes, stub call counts, the peak RSS of this
+process and the peak number and RSS of Chrome processes.
+
+Usage:
+    python benchmarks/e2e/run_load.py [--requests 200] [--concurrency 16] [--renderer browser]
+        [--distinct 20] [--openai-latency 1.5] [--render-delay 0.3] [--output result.json]
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import logging
+import argparse
+import threading
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, "..", ".."))
+
+# Add project root and the benchmarks directory to Python path
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from chart_builder_stub import start_chart_builder
+from openai_stub import start_openai_stub
+from telegram_stub import start_telegram_stub
+
+BOT_TOKEN = "123456:LOADTEST"
+COMMANDS = [
+    "price {asset} 1m 1d",
+    "tvl {asset} 3m 1d",
+    "fees {asset} 1m 1d",
+    "price vs tvl {asset} 1m 1d",
+    "fees vs revenue {asset} 1y 1w",
+]
+OUTCOMES = ("sent", "failed", "rejected", "rate_limited", "invalid")
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Nearest-rank percentile of values, in milliseconds."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return round(ordered[rank] * 1000, 1)
+
+
+def summarize(values: list) -> dict:
+    return {
+        "p50_ms": percentile(values, 0.50),
+        "p95_ms": percentile(values, 0.95),
+        "p99_ms": percentile(values, 0.99),
+        "max_ms": round(max(values) * 1000, 1) if values else 0.0,
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process, from /proc (Linux only)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return 0.0
+
+
+def chrome_processes() -> tuple:
+    """Number and total RSS in MB of running Chrome/Chromium processes."""
+    count, rss_kb = 0, 0
+    for pid in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                executable = f.read().split(b"\0", 1)[0].lower()
+            if b"chrome" not in executable and b"chromium" not in executable:
+                continue
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        rss_kb += int(line.split()[1])
+            count += 1
+        except OSError:
+            continue
+    return count, round(rss_kb / 1024, 1)
+
+
+class ChromeSampler(threading.Thread):
+    """Samples the Chrome process count and RSS until stopped, keeping the peaks."""
+
+    def __init__(self, interval: float = 0.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_count = 0
+        self.peak_rss_mb = 0.0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            count, rss_mb = chrome_processes()
+            self.peak_count = max(self.peak_count, count)
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def configure_environment(args) -> dict:
+    """Start the stubs and point the bot's configuration at them; must run before the bot is imported."""
+    chart_builder = start_chart_builder(render_delay=args.render_delay)
+    openai_server = start_openai_stub(latency=args.openai_latency)
+    telegram = start_telegram_stub(latency=args.telegram_latency)
+    # The data API stub imports the bot's config, so its port is fixed before the environment is set
+    artemis_port = free_port()
+    os.environ.update({
+        "CHART_BUILDER_URL": f"http://127.0.0.1:{chart_builder.server_port}/chart-builder",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{openai_server.server_port}/v1",
+        "OPENAI_API_KEY": "stub",
+        "TELEGRAM_BOT_TOKEN": BOT_TOKEN,
+        "ARTEMIS_API_BASE_URL": f"http://127.0.0.1:{artemis_port}",
+        "NATIVE_DATA_SOURCE": "artemis",
+        "CHART_RENDERER": args.renderer,
+        "RENDER_BACKEND": "local",
+        "METRICS_PORT": "0",
+        "CHART_DISK_CACHE_DIR": "",
+        "MAPPINGS_RELOAD_INTERVAL": "0",
+    })
+    from artemis_stub import start_stub
+
+    artemis = start_stub(port=artemis_port, latency=args.data_latency)
+    return {"chart_builder": chart_builder, "openai": openai_server, "telegram": telegram, "artemis": artemis}
+
+
+def commands(distinct: int) -> list:
+    """distinct chart commands over the assets in the mappings file."""
+    from artemisbot.utils.asset_index import get_asset_index
+
+    index = get_asset_index()
+    assets = sorted(index.ids())
+    result = []
+    for i in range(distinct):
+        template = COMMANDS[i % len(COMMANDS)]
+        result.append("=art " + template.format(asset=assets[(i * 7) % len(assets)]))
+    return result
+
+
+async def run(args, stubs: dict) -> dict:
+    from telegram import Update
+    from telegram.ext import Application, CallbackContext
+    from artemisbot.handlers.message_handlers import handle_group_message
+    from artemisbot.utils.metrics import COMMANDS as COMMAND_COUNTS
+
+    # The handlers log every message at INFO; keep the report readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    telegram = stubs["telegram"]
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .base_url(f"http://127.0.0.1:{telegram.server_port}/bot")
+        .base_file_url(f"http://127.0.0.1:{telegram.server_port}/file/bot")
+        .concurrent_updates(args.concurrency)
+        .build()
+    )
+    await application.initialize()
+
+    texts = commands(args.distinct)
+    before = {outcome: COMMAND_COUNTS.labels("chart", outcome).value for outcome in OUTCOMES}
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies, started_at, errors = [], {}, []
+
+    async def one(i: int) -> None:
+        chat_id = -(100000 + i)
+        update = Update.de_json({
+            "update_id": i + 1,
+            "message": {
+                "message_id": i + 1,
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "group", "title": "Load test"},
+                "from": {"id": 500000 + i, "is_bot": False, "first_name": "Load"},
+                "text": texts[i % len(texts)],
+            },
+        }, application.bot)
+        async with semaphore:
+            started = time.perf_counter()
+            started_at[chat_id] = started
+            try:
+                await handle_group_message(update, CallbackContext.from_update(update, application))
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {str(e)}")
+            latencies.append(time.perf_counter() - started)
+
+    sampler = ChromeSampler()
+    sampler.start()
+    run_started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - run_started
+    sampler.stop()
+    await application.shutdown()
+
+    time_to_photo = [
+        sent - started_at[chat_id] for chat_id, sent in telegram.first_photo.items() if chat_id in started_at
+    ]
+    return {
+        "config": {
+            "renderer": args.renderer,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "distinct_charts": len(texts),
+            "render_delay_s": args.render_delay,
+            "openai_latency_s": args.openai_latency,
+            "telegram_latency_s": args.telegram_latency,
+            "data_latency_s": args.data_latency,
+        },
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(args.requests / elapsed, 2) if elapsed else 0.0,
+        "latency": summarize(latencies),
+        "time_to_photo": summarize(time_to_photo),
+        "outcomes": {
+            outcome: int(COMMAND_COUNTS.labels("chart", outcome).value - before[outcome]) for outcome in OUTCOMES
+        },
+        "handler_errors": errors[:10],
+        "stub_calls": {
+            "telegram": dict(telegram.calls),
+            "openai": stubs["openai"].requests,
+            "chart_builder": stubs["chart_builder"].requests,
+            "artemis": stubs["artemis"].requests,
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "chrome": {"peak_processes": sampler.peak_count, "peak_rss_mb": sampler.peak_rss_mb},
+    }
+
+
+def passed(result: dict, requests: int) -> bool:
+    """Whether every command got its chart: none failed, no handler raised and all were sent."""
+    outcomes = result["outcomes"]
+    return not outcomes["failed"] and not result["handler_errors"] and outcomes["sent"] >= requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Chart commands to send")
+    parser.add_argument("--concurrency", type=int, default=16, help="Commands handled at once")
+    parser.add_argument("--renderer", choices=["browser", "native"], default="browser", help="Chart renderer under test")
+    parser.add_argument("--distinct", type=int, default=20, help="Distinct charts among the commands")
+    parser.add_argument("--openai-latency", type=float, default=1.5, help="Seconds per OpenAI completion")
+    parser.add_argument("--render-delay", type=float, default=0.3, help="Seconds the chart page takes to draw")
+    parser.add_argument("--telegram-latency", type=float, default=0.05, help="Seconds per Bot API call")
+    parser.add_argument("--data-latency", type=float, default=0.05, help="Seconds per Artemis data API request")
+    parser.add_argument("--output", help="Write the JSON report to this file as well as stdout")
+    args = parser.parse_args()
+
+    stubs = configure_environment(args)
+    result = asyncio.run(run(args, stubs))
+
+    report = json.dumps(result, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+
+    for server in stubs.values():
+        server.shutdown()
+    # Browser pool threads and executors would otherwise keep the process alive
+    os._exit(0 if passed(result, args.requests) else 1)
+
+
+if __name__ == "__main__":
+    main()
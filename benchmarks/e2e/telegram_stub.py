@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+A local stand-in for the Telegram Bot API.
+
+Answers POST /bot<token>/<method> for the methods the chart and news handlers
+call (getMe, sendMessage, sendPhoto, editMessageCaption, deleteMessage) with
+well-formed results after --latency seconds, and records when each chat got
+its first photo so a load run can report time to chart.
+
+Usage:
+    python benchmarks/e2e/telegram_stub.py [--port 8768] [--latency 0.05]
+
+Then point the bot at it with
+Application.builder().base_url("http://127.0.0.1:8768/bot")
+"""
+
+import re
+import json
+import time
+import argparse
+import threading
+from collections import Counter
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BOT_USER = {"id": 1000, "is_bot": True, "first_name": "Artemis", "username": "artemis_stub_bot"}
+
+# chat_id as a multipart form field, for sendPhoto uploads
+MULTIPART_CHAT_ID = re.compile(rb'name="chat_id"\r\n\r\n(-?\d+)')
+
+
+def parse_params(content_type: str, body: bytes) -> dict:
+    """Read the request parameters from a JSON, urlencoded or multipart body."""
+    if content_type.startswith("application/json"):
+        return json.loads(body or b"{}")
+    if content_type.startswith("multipart/form-data"):
+        match = MULTIPART_CHAT_ID.search(body)
+        return {"chat_id": match.group(1).decode()} if match else {}
+    return {key: values[0] for key, values in parse_qs(body.decode()).items()}
+
+
+class TelegramHandler(BaseHTTPRequestHandler):
+    """Request handler for the Bot API stub; settings live on the server."""
+
+    protocol_version = "HTTP/1.1"  # python-telegram-bot keeps connections alive
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        parts = [part for part in self.path.split("?")[0].split("/") if part]
+        if len(parts) != 2 or not parts[0].startswith("bot"):
+            return self._send(404, {"ok": False, "error_code": 404, "description": "Not Found"})
+        method = parts[1]
+        params = parse_params(self.headers.get("Content-Type", ""), body)
+        chat_id = int(params.get("chat_id") or 0)
+
+        server = self.server
+        with server.lock:
+            server.calls[method] += 1
+            server.message_id += 1
+            message_id = server.message_id
+            if method == "sendPhoto":
+                server.first_photo.setdefault(chat_id, time.perf_counter())
+        if server.latency:
+            time.sleep(server.latency)
+
+        message = {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "group", "title": "Load test"},
+            "from": BOT_USER,
+        }
+        if method == "getMe":
+            result = BOT_USER
+        elif method in ("sendMessage", "editMessageText"):
+            result = {**message, "text": params.get("text", "")}
+        elif method == "sendPhoto":
+            file_id = f"stub-photo-{message_id}"
+            result = {**message, "caption": params.get("caption", ""), "photo": [
+                {"file_id": file_id, "file_unique_id": file_id, "width": 1280, "height": 720, "file_size": len(body)},
+            ]}
+        elif method == "editMessageCaption":
+            result = {**message, "caption": params.get("caption", "")}
+        elif method in ("deleteMessage", "deleteWebhook", "setMyCommands"):
+            result = True
+        else:
+            return self._send(400, {"ok": False, "error_code": 400, "description": f"Unsupported method {method}"})
+        self._send(200, {"ok": True, "result": result})
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_telegram_stub(port: int = 0, latency: float = 0.05) -> ThreadingHTTPServer:
+    """
+    Start the Bot API stub in a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        latency: Seconds to wait before answering each call
+
+    Returns:
+        The running server; its base URL is f"http://127.0.0.1:{server.server_port}/bot".
+        server.calls counts calls by method and server.first_photo maps chat IDs to the
+        perf_counter() time of their first sendPhoto.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), TelegramHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.lock = threading.Lock()
+    server.calls = Counter()
+    server.message_id = 0
+    server.first_photo = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8768, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per API call")
+    args = parser.parse_args()
+
+    server = start_telegram_stub(args.port, args.latency)
+    print(f"Telegram Bot API stub listening on http://127.0.0.1:{server.server_port}/bot")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
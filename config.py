@@ -21,9 +21,107 @@ LOG_FILE = os.getenv("LOG_FILE", "logs/artemisbot.log")
 CHART_TIMEOUT = int(os.getenv("CHART_TIMEOUT", "10"))  # seconds
 CHART_WINDOW_SIZE = (1920, 1080)
 CHART_RENDER_DELAY = int(os.getenv("CHART_RENDER_DELAY", "2"))  # seconds
+CHART_READY_TIMEOUT = float(os.getenv("CHART_READY_TIMEOUT", str(CHART_TIMEOUT)))  # max seconds to wait for a chart to draw
+CHART_CAPTURE_MODE = os.getenv("CHART_CAPTURE_MODE", "cdp").lower()  # "cdp" (browser-clipped) or "pil" (full screenshot + crop)
+CHART_ANALYSIS_TIMEOUT = float(os.getenv("CHART_ANALYSIS_TIMEOUT", "20"))  # seconds to wait for the chart summary
+CHART_SUMMARY_MODE = os.getenv("CHART_SUMMARY_MODE", "llm").lower()  # "llm" (reads the image), "grounded" (LLM on computed stats) or "template" (no LLM)
+CHART_RENDERER = os.getenv("CHART_RENDERER", "browser").lower()  # "browser" (chart builder) or "native" (in-process)
+CHART_BUILDER_URL = os.getenv("CHART_BUILDER_URL", "https://app.artemisanalytics.com/chart-builder")  # point at a local stub for benchmarks
+CHART_NATIVE_FALLBACK = os.getenv("CHART_NATIVE_FALLBACK", "true").lower() == "true"  # draw natively if the browser fails
+ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", "3600"))  # seconds a chart summary is reused
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "1000"))
+CHART_SPEC_CACHE_SIZE = int(os.getenv("CHART_SPEC_CACHE_SIZE", "4096"))  # memoized chart URLs, titles and configs
+
+# Telegram file_ids of uploaded charts, so repeat sends skip the upload
+PHOTO_FILE_ID_CACHE_TTL = int(os.getenv("PHOTO_FILE_ID_CACHE_TTL", "86400"))  # seconds
+PHOTO_FILE_ID_CACHE_MAX_ENTRIES = int(os.getenv("PHOTO_FILE_ID_CACHE_MAX_ENTRIES", "2000"))
+
+# Browser pool configuration
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_RENDERS = int(os.getenv("BROWSER_MAX_RENDERS", "50"))  # renders before a browser is recycled
+BROWSER_ACQUIRE_TIMEOUT = int(os.getenv("BROWSER_ACQUIRE_TIMEOUT", "30"))  # seconds
+BROWSER_POOL_PREWARM = os.getenv("BROWSER_POOL_PREWARM", "true").lower() == "true"
+
+# Screenshot cache configuration
+SCREENSHOT_CACHE_TTL = int(os.getenv("SCREENSHOT_CACHE_TTL", "300"))  # seconds
+SCREENSHOT_CACHE_MAX_BYTES = int(os.getenv("SCREENSHOT_CACHE_MAX_MB", "64")) * 1024 * 1024
+
+# Optional on-disk chart cache (disabled when CHART_DISK_CACHE_DIR is empty)
+CHART_DISK_CACHE_DIR = os.getenv("CHART_DISK_CACHE_DIR", "")
+CHART_DISK_CACHE_MAX_BYTES = int(os.getenv("CHART_DISK_CACHE_MAX_MB", "512")) * 1024 * 1024
+
+# How long a cached chart stays fresh on disk, by time period (seconds)
+CHART_CACHE_TTL_BY_PERIOD: Dict[str, int] = {
+    "1w": 30 * 60,
+    "mtd": 60 * 60,
+    "1m": 60 * 60,
+    "3m": 3 * 60 * 60,
+    "6m": 3 * 60 * 60,
+    "ytd": 6 * 60 * 60,
+    "1y": 6 * 60 * 60,
+    "all": 12 * 60 * 60
+}
+
+# Background pre-rendering of popular charts
+POPULARITY_HALF_LIFE = float(os.getenv("POPULARITY_HALF_LIFE", "1800"))  # seconds for a chart's request count to decay by half
+POPULARITY_MAX_ENTRIES = int(os.getenv("POPULARITY_MAX_ENTRIES", "2000"))  # charts tracked at once
+CHART_WARMER_INTERVAL = float(os.getenv("CHART_WARMER_INTERVAL", "60"))  # seconds between warming passes (0 disables)
+CHART_WARMER_TOP_N = int(os.getenv("CHART_WARMER_TOP_N", "30"))  # most requested charts kept warm
+CHART_WARMER_MIN_SCORE = float(os.getenv("CHART_WARMER_MIN_SCORE", "2"))  # decayed request count a chart needs to be warmed
+CHART_WARMER_LEAD_TIME = float(os.getenv("CHART_WARMER_LEAD_TIME", "120"))  # re-render charts expiring within this many seconds
+CHART_WARMER_MAX_RENDERS = int(os.getenv("CHART_WARMER_MAX_RENDERS", "10"))  # renders per warming pass
+CHART_WARMER_CONCURRENCY = int(os.getenv("CHART_WARMER_CONCURRENCY", "1"))  # warming renders at once
+
+# Concurrency configuration
+CHART_CONCURRENCY = int(os.getenv("CHART_CONCURRENCY", str(BROWSER_POOL_SIZE)))  # charts generated at once
+MAX_CONCURRENT_UPDATES = int(os.getenv("MAX_CONCURRENT_UPDATES", "32"))  # Telegram updates handled at once
+SCHEDULER_MAX_CONCURRENT = int(os.getenv("SCHEDULER_MAX_CONCURRENT", str(CHART_CONCURRENCY)))  # chart jobs running at once
+SCHEDULER_MAX_QUEUE = int(os.getenv("SCHEDULER_MAX_QUEUE", "100"))  # chart jobs waiting at once
+SCHEDULER_LOW_MAX_WAIT = float(os.getenv("SCHEDULER_LOW_MAX_WAIT", "30"))  # seconds a low-lane job waits before it goes ahead of the high lane
+CHAT_RATE_PER_MINUTE = float(os.getenv("CHAT_RATE_PER_MINUTE", "6"))  # charts per minute per chat
+CHAT_BURST = int(os.getenv("CHAT_BURST", "5"))
+USER_RATE_PER_MINUTE = float(os.getenv("USER_RATE_PER_MINUTE", "4"))  # charts per minute per user
+USER_BURST = int(os.getenv("USER_BURST", "3"))
+
+# Telegram update delivery
+BOT_MODE = os.getenv("BOT_MODE", "polling").lower()  # "polling" (getUpdates, for local dev) or "webhook"
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")  # public base URL Telegram posts updates to, e.g. https://bot.example.com
+WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", os.getenv("PORT", "8443")))  # Heroku provides PORT
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "telegram")
+WEBHOOK_SECRET_TOKEN = os.getenv("WEBHOOK_SECRET_TOKEN", "")  # checked on every update; generated per run if empty
+WEBHOOK_MAX_CONNECTIONS = int(os.getenv("WEBHOOK_MAX_CONNECTIONS", "40"))  # concurrent connections Telegram may open
+
+# Prometheus-style metrics endpoint (GET /metrics)
+METRICS_LISTEN = os.getenv("METRICS_LISTEN", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))  # 0 disables the endpoint
+
+# Render workers (RENDER_BACKEND=queue hands renders to `python -m artemisbot.workers` processes)
+RENDER_BACKEND = os.getenv("RENDER_BACKEND", "local").lower()  # "local" (in the bot process) or "queue" (render workers)
+RENDER_QUEUE_PATH = os.getenv("RENDER_QUEUE_PATH", "render_queue.db")  # SQLite job queue shared by the bot and workers
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "2"))  # worker processes started by the supervisor
+RENDER_WORKER_CONCURRENCY = int(os.getenv("RENDER_WORKER_CONCURRENCY", str(CHART_CONCURRENCY)))  # jobs per worker process
+RENDER_JOB_TIMEOUT = float(os.getenv("RENDER_JOB_TIMEOUT", "60"))  # seconds a render may take before it is abandoned
+RENDER_JOB_MAX_ATTEMPTS = int(os.getenv("RENDER_JOB_MAX_ATTEMPTS", "2"))  # tries before a job is failed
+WORKER_HEARTBEAT_INTERVAL = float(os.getenv("WORKER_HEARTBEAT_INTERVAL", "5"))  # seconds
+WORKER_LEASE_SECONDS = float(os.getenv("WORKER_LEASE_SECONDS", "30"))  # seconds without a heartbeat before a job is requeued
+RENDER_SPAWN_WORKERS = os.getenv("RENDER_SPAWN_WORKERS", "false").lower() == "true"  # start the workers from main.py
+
+# Artemis data API configuration (used by the native renderer)
+ARTEMIS_API_BASE_URL = os.getenv("ARTEMIS_API_BASE_URL", "https://api.artemisxyz.com")
+NATIVE_DATA_SOURCE = os.getenv("NATIVE_DATA_SOURCE", "artemis").lower()  # "artemis" or "fake" (offline synthetic data)
+ARTEMIS_API_TIMEOUT = float(os.getenv("ARTEMIS_API_TIMEOUT", "10"))  # seconds per request
+ARTEMIS_API_MAX_CONNECTIONS = int(os.getenv("ARTEMIS_API_MAX_CONNECTIONS", "10"))  # pooled keep-alive connections
+ARTEMIS_API_MAX_RETRIES = int(os.getenv("ARTEMIS_API_MAX_RETRIES", "3"))  # retries on connection errors, 429 and 5xx
+ARTEMIS_API_BACKOFF = float(os.getenv("ARTEMIS_API_BACKOFF", "0.5"))  # seconds before the first retry, doubled each time
+SERIES_CACHE_TTL = int(os.getenv("SERIES_CACHE_TTL", "900"))  # seconds before the latest points of a cached series are refetched
+SERIES_CACHE_MAX_BYTES = int(os.getenv("SERIES_CACHE_MAX_MB", "32")) * 1024 * 1024
 
 # Asset configuration
 ASSET_MAPPINGS_FILE = os.getenv("ASSET_MAPPINGS_FILE", "config/artemis_mappings.json")
+ASSET_MAPPINGS_INDEX_FILE = os.getenv("ASSET_MAPPINGS_INDEX_FILE", "config/artemis_mappings.index.json")  # precompiled lookup tables
+MAPPINGS_RELOAD_INTERVAL = float(os.getenv("MAPPINGS_RELOAD_INTERVAL", "30"))  # seconds between checks for a changed file (0 disables)
+MAPPINGS_REFRESH_INTERVAL = float(os.getenv("MAPPINGS_REFRESH_INTERVAL", "0"))  # seconds between fetches of the asset list from the API (0 disables)
 
 # Artemis URL constants
 BASE_URL = "https://app.artemis.xyz/chart-builder/"
@@ -11,7 +11,11 @@ Example: fees ethereum eth chain 1w 1d
 import os
 import sys
 import signal
+import asyncio
+import atexit
 import logging
+import threading
+import subprocess
 from pathlib import Path
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 from artemisbot.handlers.message_handlers import (
@@ -19,7 +23,26 @@ from artemisbot.handlers.message_handlers import (
     handle_message,
     handle_group_message,
     welcome_message,
-    command_handler
+    command_handler,
+    chart_generator,
+    chart_scheduler
+)
+from artemisbot.chart.browser_pool import get_browser_pool
+from artemisbot.chart.popularity import get_popularity_tracker
+from artemisbot.chart.warmer import ChartWarmer
+from artemisbot.data.client import close_series_source
+from artemisbot.utils.asset_mappings import start_mappings_watcher
+from artemisbot.server.metrics import start_metrics_server
+from artemisbot.utils.mappings_refresh import run_mappings_refresh_loop
+from artemisbot.utils.metrics import REGISTRY
+from config import (
+    BOT_MODE,
+    BROWSER_POOL_PREWARM,
+    CHART_WARMER_INTERVAL,
+    MAPPINGS_REFRESH_INTERVAL,
+    MAX_CONCURRENT_UPDATES,
+    RENDER_BACKEND,
+    RENDER_SPAWN_WORKERS,
 )
 from dotenv import load_dotenv
 
@@ -87,6 +110,27 @@ def signal_handler(signum, frame):
     logger.info("Received shutdown signal")
     sys.exit(0)
 
+# Background tasks refreshing the asset mappings from the API and keeping popular charts cached, if enabled
+_mappings_refresh_task = None
+_chart_warmer_task = None
+
+async def post_init(application: Application) -> None:
+    """Start background tasks that run alongside the bot."""
+    global _mappings_refresh_task, _chart_warmer_task
+    if MAPPINGS_REFRESH_INTERVAL > 0:
+        _mappings_refresh_task = asyncio.create_task(run_mappings_refresh_loop(MAPPINGS_REFRESH_INTERVAL))
+    if CHART_WARMER_INTERVAL > 0:
+        warmer = ChartWarmer(chart_generator, get_popularity_tracker(), chart_scheduler)
+        REGISTRY.register_collector("chart_warmer", warmer.stats)
+        _chart_warmer_task = asyncio.create_task(warmer.run(CHART_WARMER_INTERVAL))
+
+async def post_shutdown(application: Application) -> None:
+    """Release resources held across updates once the bot stops."""
+    for task in (_mappings_refresh_task, _chart_warmer_task):
+        if task is not None:
+            task.cancel()
+    await close_series_source()
+
 def main():
     """Start the bot."""
     logger.info("Initializing bot...")
@@ -100,10 +144,41 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
+    # Load the asset mappings before the first command, and reload them when the file changes
+    start_mappings_watcher()
+    
+    # Per-stage latencies, error codes and component stats for Prometheus
+    start_metrics_server()
+    
+    if RENDER_BACKEND == "queue":
+        # Charts are rendered by the worker processes; this process only enqueues them
+        if RENDER_SPAWN_WORKERS:
+            logger.info("Starting render workers...")
+            workers = subprocess.Popen([sys.executable, "-m", "artemisbot.workers"])
+            atexit.register(workers.terminate)
+    else:
+        # Launch browser sessions in the background so the first chart skips Chrome's cold start
+        browser_pool = get_browser_pool()
+        atexit.register(browser_pool.close)
+        if BROWSER_POOL_PREWARM:
+            logger.info("Pre-warming browser pool (size %d)...", browser_pool.size)
+            threading.Thread(target=browser_pool.start, daemon=True).start()
+    
     try:
         logger.info("Creating Telegram application...")
         # Create the Application
-        application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+        # Handle updates concurrently so a slow chart does not hold up other chats
+        builder = (
+            Application.builder()
+            .token(TELEGRAM_BOT_TOKEN)
+            .concurrent_updates(MAX_CONCURRENT_UPDATES)
+            .post_init(post_init)
+            .post_shutdown(post_shutdown)
+        )
+        if BOT_MODE == "webhook":
+            # Updates arrive through our own HTTP server instead of the getUpdates loop
+            builder = builder.updater(None)
+        application = builder.build()
         
         logger.info("Adding handlers...")
         # Add handlers
@@ -125,8 +200,13 @@ def main():
         application.add_handler(MessageHandler(filters.StatusUpdate.NEW_CHAT_MEMBERS, welcome_message))
         
         # Start the bot
-        logger.info("Starting bot...")
-        application.run_polling()
+        if BOT_MODE == "webhook":
+            from artemisbot.server.webhook import serve_webhook
+            logger.info("Starting bot in webhook mode...")
+            asyncio.run(serve_webhook(application))
+        else:
+            logger.info("Starting bot...")
+            application.run_polling()
         
     except Exception as e:
         logger.error(f"❌ Error starting bot: {str(e)}")
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Modules that create API clients at import time only need a key to be set
+os.environ.setdefault("OPENAI_API_KEY", "test")
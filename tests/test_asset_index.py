@@ -0,0 +1,89 @@
+import pytest
+from artemisbot.utils.asset_index import AssetIndex, edit_distance, format_suggestions, normalize
+
+
+@pytest.fixture
+def index():
+    return AssetIndex(
+        {
+            "ethereum": "eth",
+            "solana": "sol",
+            "solv": "solv",
+            "bnb_chain": ["bnb", "bsc"],
+            "the-graph": "grt",
+            "empty": [],
+        },
+        {"ethereum": "chain", "solana": "chain", "solv": "protocol", "bnb_chain": "chain"},
+    )
+
+
+def test_exact_lookup_by_symbol_and_id(index):
+    assert index.lookup("ETH") == {"id": "ethereum", "symbol": "eth", "type": "chain"}
+    assert index.lookup("Solana")["id"] == "solana"
+    assert index.by_symbol("bsc")["id"] == "bnb_chain"
+    assert index.by_id("bnb_chain")["symbol"] == "bnb"
+    assert index.lookup("the-graph")["type"] == "unknown"
+
+
+def test_assets_without_symbols_are_skipped(index):
+    assert "empty" not in index
+    assert len(index) == 5
+
+
+def test_alias_lookup_ignores_case_and_punctuation(index):
+    assert normalize("$Bnb-Chain") == "bnbchain"
+    assert index.lookup("$ETH")["id"] == "ethereum"
+    assert index.lookup("BNB Chain")["id"] == "bnb_chain"
+    assert index.lookup("thegraph")["id"] == "the-graph"
+    assert index.lookup("nothing") is None
+
+
+def test_prefix_returns_keys_in_order(index):
+    assert [key for key, _ in index.prefix("sol")] == ["sol", "solana", "solv"]
+    assert index.prefix("sol", limit=1) == [("sol", index.by_symbol("sol"))]
+    assert index.prefix("xyz") == []
+
+
+def test_suggest_prefers_the_closest_prefix(index):
+    suggestions = index.suggest("sola")
+    assert suggestions[0].id == "solana"
+    assert suggestions[0].match in ("prefix", "fuzzy")
+    assert {s.id for s in suggestions} == {"solana", "solv"}
+
+
+def test_suggest_finds_typos(index):
+    suggestions = index.suggest("etherium")
+    assert suggestions[0].id == "ethereum"
+    assert suggestions[0].match == "fuzzy"
+    assert suggestions[0].score == pytest.approx(1 - 1 / 8)
+
+
+def test_suggest_returns_one_entry_per_asset(index):
+    ids = [s.id for s in index.suggest("bn", limit=10)]
+    assert len(ids) == len(set(ids))
+
+
+def test_suggest_drops_unrelated_queries(index):
+    assert index.suggest("zzzzzz") == []
+    assert index.suggest("  ") == []
+
+
+def test_edit_distance_counts_transpositions_and_stops_early():
+    assert edit_distance("solana", "sloana", 2) == 1
+    assert edit_distance("eth", "teh", 2) == 1
+    assert edit_distance("bitcoin", "eth", 2) == 3
+
+
+def test_format_suggestions(index):
+    assert format_suggestions(index.suggest("etherium", limit=1)) == "ethereum (eth)"
+    assert format_suggestions(index.suggest("solv", limit=1)) == "solv"
+
+
+def test_asset_info_is_read_only(index):
+    info = index.lookup("eth")
+    with pytest.raises(TypeError):
+        info["id"] = "bitcoin"
+    with pytest.raises(TypeError):
+        index.by_id("ethereum")["symbol"] = "btc"
+    assert index.lookup("eth")["id"] == "ethereum"
+    assert dict(info) == {"id": "ethereum", "symbol": "eth", "type": "chain"}
@@ -0,0 +1,91 @@
+import time
+from artemisbot.utils.cache import LRUCache
+
+
+def test_get_returns_cached_value_and_counts_hits():
+    cache = LRUCache(max_bytes=100)
+    cache.set("a", b"12345")
+    assert cache.get("a") == b"12345"
+    assert cache.get("missing", "default") == "default"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_evicts_least_recently_used_over_byte_budget():
+    cache = LRUCache(max_bytes=10)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", b"cccc")
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_value_larger_than_budget_is_not_cached():
+    cache = LRUCache(max_bytes=4)
+    cache.set("big", b"12345")
+    assert len(cache) == 0
+
+
+def test_max_entries_caps_entry_count():
+    cache = LRUCache(max_bytes=1000, max_entries=2)
+    for key in "abc":
+        cache.set(key, b"x")
+    assert len(cache) == 2
+    assert "a" not in cache
+
+
+def test_replacing_a_key_keeps_byte_count_exact():
+    cache = LRUCache(max_bytes=100)
+    cache.set("a", b"1234")
+    cache.set("a", b"12")
+    assert cache.stats()["bytes"] == 2
+
+
+def test_entries_expire_after_ttl():
+    cache = LRUCache(max_bytes=100, ttl=0.05)
+    cache.set("a", b"x")
+    cache.set("long", b"y", ttl=100)
+    assert cache.get("a") == b"x"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.get("long") == b"y"
+
+
+def test_entries_without_ttl_never_expire():
+    cache = LRUCache(max_bytes=100)
+    cache.set("a", b"x")
+    assert cache.ttl_remaining("a") == float("inf")
+
+
+def test_per_entry_ttl_and_ttl_remaining():
+    cache = LRUCache(max_bytes=100, ttl=100)
+    cache.set("short", b"x", ttl=10)
+    assert cache.ttl_remaining("missing") is None
+    cache.set("default", b"y")
+    assert 9 < cache.ttl_remaining("short") <= 10
+    assert 99 < cache.ttl_remaining("default") <= 100
+
+
+def test_purge_expired_removes_only_expired_entries():
+    cache = LRUCache(max_bytes=100, ttl=0.01)
+    cache.set("a", b"x")
+    cache.set("b", b"y", ttl=100)
+    time.sleep(0.02)
+    assert cache.purge_expired() == 1
+    assert len(cache) == 1
+    assert cache.stats()["bytes"] == 1
+
+
+def test_peek_does_not_count_hits_or_misses():
+    cache = LRUCache(max_bytes=100)
+    cache.set("a", b"x")
+    assert cache.peek("a") == b"x"
+    assert cache.peek("missing") is None
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["misses"] == 0
@@ -0,0 +1,33 @@
+from artemisbot.chart.chart_spec import ChartSpec
+from artemisbot.utils.command_parser import parse_command
+
+
+def test_metrics_keep_the_typed_order():
+    spec = parse_command("tvl vs price eth 1m 1d")
+    assert spec.metrics == ("tvl", "price")
+    types = {item["metric"]["artemisId"]: item["setting"]["type"] for item in spec.config["series"]}
+    assert types == {"TVL": "LINE", "PRICE": "COLUMN"}
+
+
+def test_aliases_duplicates_and_asset_names_share_a_spec():
+    spec = ChartSpec.create(["mcap", "price", "mc"], ["eth"], "chain", "1M", "1D")
+    assert spec == ChartSpec.create(["mc", "price"], ["ethereum"], "chain", "1m", "1d")
+    assert spec.metrics == ("mc", "price")
+
+
+def test_reversed_metrics_are_a_different_chart():
+    tvl_first = parse_command("tvl vs price eth 1m 1d")
+    price_first = parse_command("price vs tvl eth 1m 1d")
+    assert tvl_first.cache_key != price_first.cache_key
+    assert tvl_first.url != price_first.url
+
+
+def test_specs_sharing_a_cache_key_draw_the_same_chart():
+    specs = [ChartSpec.create(metrics, ["ethereum"], "chain", "1m", "1d")
+             for metrics in (["price", "tvl", "fees"], ["price", "fees", "tvl"], ["price", "tvl", "fee", "price"])]
+    by_key = {}
+    for spec in specs:
+        by_key.setdefault(spec.cache_key, []).append(spec)
+    assert len(by_key) == 2
+    for same_key in by_key.values():
+        assert len({(spec.url, spec.title) for spec in same_key}) == 1
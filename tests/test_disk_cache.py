@@ -0,0 +1,84 @@
+import os
+import time
+from artemisbot.utils.disk_cache import DiskCache
+
+
+def files_in(directory):
+    return sorted(name for _, _, names in os.walk(directory) for name in names)
+
+
+def test_set_and_get_roundtrip(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=1000)
+    cache.set("abcd", b"chart")
+    assert cache.get("abcd") == b"chart"
+    assert cache.contains("abcd")
+    assert files_in(tmp_path) == ["abcd.png"]
+
+
+def test_write_leaves_no_temporary_files(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=1000)
+    for i in range(5):
+        cache.set(f"key{i}", b"x" * 10)
+    assert not [name for name in files_in(tmp_path) if name.startswith(".tmp")]
+
+
+def test_entries_survive_a_restart(tmp_path):
+    DiskCache(str(tmp_path), max_bytes=1000).set("abcd", b"chart")
+    reopened = DiskCache(str(tmp_path), max_bytes=1000)
+    assert reopened.get("abcd") == b"chart"
+    assert reopened.stats()["bytes"] == 5
+
+
+def test_stale_temporary_files_are_removed_on_start(tmp_path):
+    stale = tmp_path / "ab" / ".tmpxyz"
+    stale.parent.mkdir()
+    stale.write_bytes(b"partial")
+    old = time.time() - 3600
+    os.utime(stale, (old, old))
+    DiskCache(str(tmp_path), max_bytes=1000)
+    assert not stale.exists()
+
+
+def test_ttl_is_judged_from_write_time(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=1000)
+    cache.set("abcd", b"chart")
+    old = time.time() - 100
+    os.utime(tmp_path / "ab" / "abcd.png", (old, old))
+    assert cache.get("abcd", ttl=200) == b"chart"
+    assert not cache.contains("abcd", ttl=50)
+    assert cache.get("abcd", ttl=50) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_evicts_least_recently_used_over_budget(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=30)
+    for key in ("aa1", "bb2", "cc3"):
+        cache.set(key, b"x" * 10)
+        time.sleep(0.01)
+    cache.get("aa1")
+    cache.set("dd4", b"x" * 10)
+    assert cache.get("bb2") is None
+    assert cache.get("aa1") is not None
+    assert cache.stats()["bytes"] <= 30
+
+
+def test_missing_file_is_dropped_from_byte_count(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=1000)
+    cache.set("abcd", b"chart")
+    os.remove(tmp_path / "ab" / "abcd.png")
+    assert cache.get("abcd") is None
+    assert cache.stats()["bytes"] == 0
+    assert cache.stats()["entries"] == 0
+
+
+def test_budget_covers_files_written_by_other_processes(tmp_path):
+    ours = DiskCache(str(tmp_path), max_bytes=50, rescan_interval=0)
+    theirs = DiskCache(str(tmp_path), max_bytes=50)
+    for i in range(4):
+        theirs.set(f"t{i}", b"x" * 10)
+        time.sleep(0.01)
+    ours.set("mine", b"x" * 20)
+    on_disk = sum(os.path.getsize(os.path.join(root, name))
+                  for root, _, names in os.walk(tmp_path) for name in names)
+    assert on_disk <= 50
+    assert ours.get("mine") is not None
@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+from artemisbot.chart.chart_generator import ChartRenderError
+from artemisbot.workers.client import RenderQueueClient
+from artemisbot.workers.job_queue import DONE, FAILED, SQLiteJobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteJobQueue(str(tmp_path / "queue.db"))
+
+
+def test_claim_skips_cancelled_jobs(queue):
+    cancelled = queue.enqueue("render", {"n": 1})
+    waiting = queue.enqueue("render", {"n": 2})
+    assert queue.cancel(cancelled, "gone")
+    job = queue.claim("w1", lease_seconds=30)
+    assert job.id == waiting
+    assert queue.get(cancelled).error_type == "cancelled"
+
+
+def test_result_of_a_cancelled_running_job_is_discarded(queue):
+    job_id = queue.enqueue("render", {})
+    queue.claim("w1", lease_seconds=30)
+    assert queue.cancel(job_id, "gone")
+    queue.complete(job_id, "w1", b"png", {})
+    job = queue.get(job_id)
+    assert job.status == FAILED and job.result is None
+
+
+def test_finished_job_is_not_cancelled(queue):
+    job_id = queue.enqueue("render", {})
+    queue.claim("w1", lease_seconds=30)
+    queue.complete(job_id, "w1", b"png", {})
+    assert not queue.cancel(job_id, "gone")
+    assert queue.status(job_id) == DONE
+
+
+def test_client_timeout_cancels_the_job(queue):
+    client = RenderQueueClient(queue=queue, timeout=0.05)
+    with pytest.raises(ChartRenderError):
+        asyncio.run(client.run("render", {}))
+    assert client.timed_out == 1
+    assert queue.claim("w1", lease_seconds=30) is None
+
+
+def test_forget_worker_removes_its_row(queue):
+    queue.heartbeat("w1", [], lease_seconds=30)
+    queue.heartbeat("w2", [], lease_seconds=30)
+    queue.forget_worker("w1")
+    assert list(queue.stats()["workers"]) == ["w2"]
@@ -0,0 +1,119 @@
+import json
+import os
+import pytest
+from artemisbot.utils.mappings_refresh import (
+    build_mappings,
+    diff_mappings,
+    encode_mappings,
+    load_index,
+    refresh_mappings,
+    write_atomic,
+)
+
+
+def asset(artemis_id, symbol, asset_type="application"):
+    return {"artemis_id": artemis_id, "symbol": symbol, "metadata": {"about": {"asset": asset_type}}}
+
+
+ASSETS = [asset("ethereum", "ETH", "chain"), asset("uniswap", "uni")]
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "mappings.json"), str(tmp_path / "mappings.index.json")
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_first_refresh_writes_mappings_and_index(paths):
+    path, index_path = paths
+    diff = refresh_mappings(path, index_path, assets=ASSETS)
+    assert diff.added == ["ethereum", "uniswap"] and not diff.removed
+    source = read(path)
+    assert source == encode_mappings(build_mappings(ASSETS))
+    assert json.loads(source)["symbol_to_artemis_id"] == {"eth": "ethereum", "uni": "uniswap"}
+    index = load_index(index_path, source)
+    assert index["artemis_id_to_type"] == {"ethereum": "chain", "uniswap": "application"}
+
+
+def test_unchanged_assets_skip_the_write(paths):
+    path, index_path = paths
+    refresh_mappings(path, index_path, assets=ASSETS)
+    os.utime(path, ns=(1, 1))
+    os.utime(index_path, ns=(1, 1))
+
+    diff = refresh_mappings(path, index_path, assets=list(reversed(ASSETS)))
+    assert not diff.changed
+    assert os.stat(path).st_mtime_ns == 1 and os.stat(index_path).st_mtime_ns == 1
+
+
+def test_stale_index_is_rebuilt_without_rewriting_mappings(paths):
+    path, index_path = paths
+    refresh_mappings(path, index_path, assets=ASSETS)
+    source = read(path)
+    write_atomic(index_path, b"{}")
+    os.utime(path, ns=(1, 1))
+
+    diff = refresh_mappings(path, index_path, assets=ASSETS)
+    assert not diff.changed
+    assert read(path) == source and os.stat(path).st_mtime_ns == 1
+    assert load_index(index_path, source) is not None
+
+
+def test_changes_are_diffed_and_written(paths):
+    path, index_path = paths
+    refresh_mappings(path, index_path, assets=ASSETS)
+    new_assets = [asset("ethereum", "eth", "application"), asset("solana", "sol", "chain")]
+
+    diff = refresh_mappings(path, index_path, assets=new_assets)
+    assert diff.added == ["solana"]
+    assert diff.removed == ["uniswap"]
+    assert diff.retyped == [("ethereum", "chain", "application")]
+    assert read(path) == encode_mappings(build_mappings(new_assets))
+    assert load_index(index_path, read(path)) is not None
+
+
+def test_dry_run_writes_nothing(paths):
+    path, index_path = paths
+    diff = refresh_mappings(path, index_path, assets=ASSETS, dry_run=True)
+    assert diff.added == ["ethereum", "uniswap"]
+    assert not os.path.exists(path) and not os.path.exists(index_path)
+
+
+def test_force_rewrites_unchanged_mappings(paths):
+    path, index_path = paths
+    refresh_mappings(path, index_path, assets=ASSETS)
+    source = read(path)
+    os.utime(path, ns=(1, 1))
+
+    diff = refresh_mappings(path, index_path, assets=ASSETS, force=True)
+    assert not diff.changed
+    assert read(path) == source and os.stat(path).st_mtime_ns != 1
+
+
+def test_empty_asset_list_keeps_the_current_mappings(paths):
+    path, index_path = paths
+    refresh_mappings(path, index_path, assets=ASSETS)
+    source = read(path)
+    with pytest.raises(ValueError):
+        refresh_mappings(path, index_path, assets=[])
+    assert read(path) == source
+
+
+def test_diff_reports_symbol_changes():
+    old = build_mappings([asset("ethereum", "eth")])
+    new = build_mappings([asset("ethereum", "weth")])
+    diff = diff_mappings(old, new)
+    assert diff.resymboled == [("ethereum", ["eth"], ["weth"])]
+    assert "Symbols changed 1" in diff.summary()
+
+
+def test_write_atomic_leaves_no_temporary_files(tmp_path):
+    path = tmp_path / "sub" / "file.json"
+    write_atomic(str(path), b"one")
+    write_atomic(str(path), b"two")
+    assert path.read_bytes() == b"two"
+    assert os.listdir(path.parent) == ["file.json"]
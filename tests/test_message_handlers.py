@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+from telegram.error import BadRequest
+from artemisbot.handlers.message_handlers import PHOTO_FILE_IDS, send_chart_photo
+from artemisbot.chart.chart_analyzer import image_fingerprint
+
+
+class StubMessage:
+    """Records reply_photo calls and rejects the file_ids in stale."""
+
+    def __init__(self, stale=()):
+        self.stale = set(stale)
+        self.sent = []
+
+    async def reply_photo(self, photo, caption, parse_mode):
+        self.sent.append(photo)
+        if isinstance(photo, str) and photo in self.stale:
+            raise BadRequest("Wrong file identifier/http url specified")
+        file_id = photo if isinstance(photo, str) else f"uploaded-{len(self.sent)}"
+        return SimpleNamespace(photo=[SimpleNamespace(file_id="thumb"), SimpleNamespace(file_id=file_id)])
+
+
+def send(message, image):
+    return asyncio.run(send_chart_photo(SimpleNamespace(message=message), image, "caption"))
+
+
+def test_repeated_image_reuses_the_uploaded_file_id():
+    image = b"chart-reused"
+    PHOTO_FILE_IDS.delete(image_fingerprint(image))
+    message = StubMessage()
+    send(message, image)
+    send(message, image)
+    assert message.sent == [image, "uploaded-1"]
+
+
+def test_rejected_file_id_is_evicted_and_the_image_reuploaded():
+    image = b"chart-stale"
+    fingerprint = image_fingerprint(image)
+    PHOTO_FILE_IDS.set(fingerprint, "stale-id")
+    message = StubMessage(stale={"stale-id"})
+
+    sent = send(message, image)
+    assert message.sent == ["stale-id", image]
+    assert sent.photo[-1].file_id == "uploaded-2"
+    assert PHOTO_FILE_IDS.peek(fingerprint) == "uploaded-2"
+
+
+def test_each_file_id_takes_one_unit_of_the_budget():
+    assert PHOTO_FILE_IDS.max_bytes == PHOTO_FILE_IDS.max_entries
+    before = PHOTO_FILE_IDS.stats()["bytes"]
+    PHOTO_FILE_IDS.set("size-probe", "x" * 1000)
+    assert PHOTO_FILE_IDS.stats()["bytes"] == before + 1
+    PHOTO_FILE_IDS.delete("size-probe")
@@ -0,0 +1,49 @@
+import asyncio
+from datetime import date, timedelta
+import pytest
+from artemisbot.chart import native_renderer
+from artemisbot.chart.chart_spec import ChartSpec
+from artemisbot.chart.url_builder import build_chart_config, series_label
+from artemisbot.data.fake_source import FakeSeriesSource
+
+
+def fetch(source, *args):
+    return asyncio.run(source.fetch_series(*args))
+
+
+def test_fake_source_is_deterministic():
+    start, end = date.today() - timedelta(days=30), date.today()
+    first = fetch(FakeSeriesSource(), "solana", "PRICE", "1d", start, end)
+    second = fetch(FakeSeriesSource(), "solana", "PRICE", "1d", start, end)
+    assert first == second
+    assert first != fetch(FakeSeriesSource(), "ethereum", "PRICE", "1d", start, end)
+
+
+def test_fake_source_returns_the_requested_window():
+    start, end = date.today() - timedelta(days=13), date.today()
+    points = fetch(FakeSeriesSource(), "solana", "TVL", "1d", start, end)
+    assert len(points) == 14
+    assert points[0][0] == start
+    assert points[-1][0] == end
+    assert all(value > 0 for _, value in points)
+
+
+def test_fake_source_resamples_to_weeks():
+    start, end = date.today() - timedelta(days=90), date.today()
+    daily = fetch(FakeSeriesSource(), "solana", "FEES", "1d", start, end)
+    weekly = fetch(FakeSeriesSource(), "solana", "FEES", "1w", start, end)
+    assert len(daily) // 8 <= len(weekly) <= len(daily) // 6 + 1
+
+
+@pytest.mark.skipif(not native_renderer.is_available(), reason="matplotlib is not installed")
+def test_native_renderer_draws_png_from_fake_data():
+    config = build_chart_config(["price", "tvl"], ["solana"], "", "1m", "1d")
+    points = asyncio.run(native_renderer.fetch_chart_data(config, FakeSeriesSource(), "1m", "1d"))
+    assert len(points) == 2 and all(points)
+    image = native_renderer.draw_chart(config, points, "1d")
+    assert image.startswith(b"\x89PNG")
+
+
+def test_series_labels_use_metric_display_names():
+    spec = ChartSpec.create(["tvl", "mc"], ["ethereum"], "chain", "1m", "1d")
+    assert [series_label(item) for item in spec.config["series"]] == ["Ethereum TVL", "Ethereum Market Cap"]
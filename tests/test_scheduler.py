@@ -0,0 +1,118 @@
+import asyncio
+import time
+import pytest
+from artemisbot.chart.scheduler import ChartScheduler, RateLimitError, TokenBucket, HIGH, LOW
+
+
+def test_token_bucket_allows_burst_then_refills():
+    bucket = TokenBucket(rate=10.0, capacity=2)
+    now = time.monotonic()
+    for _ in range(2):
+        assert bucket.available(now)
+        bucket.take()
+    assert not bucket.available(now)
+    assert bucket.retry_after() == pytest.approx(0.1, abs=0.01)
+    assert bucket.available(now + 0.1)
+
+
+def test_check_enforces_chat_and_user_limits():
+    scheduler = ChartScheduler(chat_rate=0.01, chat_burst=2, user_rate=0.01, user_burst=1)
+    scheduler.check("chat", "alice")
+    with pytest.raises(RateLimitError):
+        scheduler.check("chat", "alice")  # alice's allowance is used up
+    scheduler.check("chat", "bob")
+    with pytest.raises(RateLimitError):
+        scheduler.check("chat", "carol")  # the chat's allowance is used up
+
+
+def test_only_first_rejection_in_a_row_notifies():
+    scheduler = ChartScheduler(chat_rate=0.01, chat_burst=1)
+    scheduler.check("chat")
+    notify = []
+    for _ in range(3):
+        with pytest.raises(RateLimitError) as error:
+            scheduler.check("chat")
+        notify.append(error.value.notify)
+    assert notify == [True, False, False]
+
+
+def test_bucket_of_an_active_chat_is_kept_past_the_idle_ttl():
+    scheduler = ChartScheduler(chat_rate=0.01, chat_burst=2)
+    scheduler._buckets.ttl = 0.05
+    scheduler.check("chat")
+    time.sleep(0.03)
+    scheduler.check("chat")
+    time.sleep(0.03)  # 0.06s since the bucket was created, 0.03s since last used
+    with pytest.raises(RateLimitError):
+        scheduler.check("chat")
+
+
+def run_jobs(scheduler, jobs, hold=0.0):
+    """Queue (chat_id, lane) jobs behind one running job and return their start order."""
+    async def scenario():
+        order = []
+        gate = asyncio.Event()
+
+        async def blocker():
+            await gate.wait()
+
+        def job(name):
+            async def fn():
+                order.append(name)
+            return fn
+
+        running = asyncio.ensure_future(scheduler.run(blocker, "blocker", HIGH))
+        await asyncio.sleep(0)
+        tasks = []
+        for chat_id, lane in jobs:
+            tasks.append(asyncio.ensure_future(scheduler.run(job(f"{chat_id}/{LANE_NAMES[lane]}"), chat_id, lane)))
+            await asyncio.sleep(0)
+        await asyncio.sleep(hold)
+        gate.set()
+        await asyncio.gather(running, *tasks)
+        return order
+
+    return asyncio.run(scenario())
+
+
+LANE_NAMES = {HIGH: "high", LOW: "low"}
+
+
+def test_high_lane_is_served_before_low_lane():
+    scheduler = ChartScheduler(max_concurrent=1)
+    order = run_jobs(scheduler, [("a", LOW), ("b", HIGH), ("c", LOW), ("d", HIGH)])
+    assert order == ["b/high", "d/high", "a/low", "c/low"]
+
+
+def test_chats_take_turns_within_a_lane():
+    scheduler = ChartScheduler(max_concurrent=1)
+    order = run_jobs(scheduler, [("a", LOW), ("a", LOW), ("a", LOW), ("b", LOW), ("c", LOW)])
+    assert order == ["a/low", "b/low", "c/low", "a/low", "a/low"]
+
+
+def test_low_lane_job_that_waited_too_long_goes_first():
+    scheduler = ChartScheduler(max_concurrent=1, low_max_wait=0.05)
+    order = run_jobs(scheduler, [("a", LOW), ("b", HIGH)], hold=0.06)
+    assert order == ["a/low", "b/high"]
+    assert scheduler.stats()["aged_promotions"] == 1
+
+
+def test_max_concurrent_bounds_running_jobs():
+    async def scenario():
+        scheduler = ChartScheduler(max_concurrent=2)
+        running = peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(scheduler.run(job, f"chat{i}") for i in range(6)))
+        return peak, scheduler.stats()
+
+    peak, stats = asyncio.run(scenario())
+    assert peak == 2
+    assert stats["completed"] == 6
+    assert stats["running"] == 0 and stats["queued"] == 0
@@ -0,0 +1,78 @@
+from datetime import date, timedelta
+from artemisbot.data.series import Series
+from artemisbot.data.series_cache import SeriesCache
+
+KEY = ("solana", "PRICE", "1d")
+D0 = date(2024, 1, 1)
+
+
+def series(start: date, end: date, value: float = 1.0) -> Series:
+    days = (end - start).days + 1
+    return Series.from_points(*KEY[:2], KEY[2], [(start + timedelta(days=i), value) for i in range(days)])
+
+
+def day(n: int) -> date:
+    return D0 + timedelta(days=n)
+
+
+def test_empty_cache_needs_the_whole_window():
+    cache = SeriesCache(max_bytes=10 ** 6, refresh_after=3600)
+    assert cache.missing_windows(KEY, day(0), day(9)) == [(day(0), day(9))]
+
+
+def test_covered_window_needs_nothing_and_is_served_by_slicing():
+    cache = SeriesCache(max_bytes=10 ** 6, refresh_after=3600)
+    cache.merge(KEY, [((day(0), day(29)), series(day(0), day(29)))])
+    assert cache.missing_windows(KEY, day(10), day(20)) == []
+    window = cache.get(KEY, day(10), day(20))
+    assert window.first_date == day(10)
+    assert window.last_date == day(20)
+
+
+def test_older_history_and_newer_days_are_fetched_separately():
+    cache = SeriesCache(max_bytes=10 ** 6, refresh_after=3600)
+    cache.merge(KEY, [((day(10), day(19)), series(day(10), day(19)))])
+    # The tail refetch starts at the last cached point, whose bucket may still be filling in
+    assert cache.missing_windows(KEY, day(0), day(25)) == [(day(0), day(9)), (day(19), day(25))]
+
+
+def test_stale_tail_is_refetched():
+    cache = SeriesCache(max_bytes=10 ** 6, refresh_after=0)
+    cache.merge(KEY, [((day(0), day(9)), series(day(0), day(9)))])
+    assert cache.missing_windows(KEY, day(0), day(9)) == [(day(9), day(9))]
+
+
+def test_merge_replaces_points_in_fetched_windows():
+    cache = SeriesCache(max_bytes=10 ** 6, refresh_after=3600)
+    cache.merge(KEY, [((day(10), day(19)), series(day(10), day(19), 1.0))])
+    merged = cache.merge(KEY, [
+        ((day(0), day(9)), series(day(0), day(9), 2.0)),
+        ((day(19), day(25)), series(day(19), day(25), 3.0)),
+    ])
+    points = dict(merged.series.to_points())
+    assert (merged.start, merged.end) == (day(0), day(25))
+    assert len(points) == 26
+    assert points[day(5)] == 2.0 and points[day(15)] == 1.0 and points[day(19)] == 3.0
+
+
+def test_merge_after_eviction_keeps_every_fetched_window():
+    cache = SeriesCache(max_bytes=10 ** 6, refresh_after=3600)
+    cache.merge(KEY, [((day(10), day(19)), series(day(10), day(19)))])
+    windows = cache.missing_windows(KEY, day(0), day(25))
+    cache.clear()  # evicted between missing_windows and merge
+    merged = cache.merge(KEY, [(window, series(*window)) for window in windows])
+    assert merged.series.first_date == day(0)
+    assert merged.series.last_date == day(25)
+    assert cache.missing_windows(KEY, day(0), day(9)) == []
+
+
+def test_each_get_is_counted_once():
+    cache = SeriesCache(max_bytes=10 ** 6, refresh_after=3600)
+    assert cache.get(KEY, day(0), day(9)) is None
+    cache.merge(KEY, [((day(0), day(9)), series(day(0), day(9)))])
+    assert cache.get(KEY, day(0), day(9)) is not None
+    stats = cache.stats()
+    assert stats["lookups"] == 2
+    assert stats["fetches_avoided"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert "hits" not in stats["memory"]
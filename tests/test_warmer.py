@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+from artemisbot.chart import chart_generator
+from artemisbot.chart.chart_generator import ChartGenerator
+from artemisbot.chart.chart_spec import ChartSpec
+from artemisbot.chart.popularity import PopularityTracker
+from artemisbot.chart.scheduler import HIGH, ChartScheduler
+from artemisbot.chart.screenshot import SCREENSHOT_CACHE
+from artemisbot.chart.warmer import WARM_PRIORITY, ChartWarmer
+
+
+class FakeQueueClient:
+    """Stands in for the render workers and records the refresh flag and priority of each job."""
+
+    def __init__(self):
+        self.refresh = []
+        self.priority = []
+
+    async def render_chart(self, metrics, tickers, asset_type, time_period, granularity,
+                           is_percentage=False, renderer=None, refresh=False, priority=1):
+        self.refresh.append(refresh)
+        self.priority.append(priority)
+        return b"png", "url", "title"
+
+
+@pytest.fixture
+def queue_client(monkeypatch):
+    client = FakeQueueClient()
+    monkeypatch.setattr(chart_generator, "get_render_queue_client", lambda: client)
+    return client
+
+
+def test_warmer_renders_through_the_queue_and_refreshes_expiring_copies(queue_client):
+    spec = ChartSpec.create(["price"], ["eth"], "chain", "1m", "1d")
+    for key in (spec.cache_key, "native:" + spec.cache_key):
+        SCREENSHOT_CACHE.delete(key)
+    tracker = PopularityTracker()
+    tracker.record(spec)
+    warmer = ChartWarmer(ChartGenerator(render_backend="queue"), tracker, min_score=0, lead_time=10 ** 9)
+
+    assert asyncio.run(warmer.warm_once()) == 1  # not cached yet
+    assert asyncio.run(warmer.warm_once()) == 1  # cached, but expiring within the lead time
+    assert queue_client.refresh == [False, True]
+    assert queue_client.priority == [WARM_PRIORITY, WARM_PRIORITY]
+    assert warmer.refreshes == 1
+
+
+def test_warm_renders_wait_for_a_scheduler_slot(queue_client):
+    async def scenario():
+        scheduler = ChartScheduler(max_concurrent=1)
+        tracker = PopularityTracker()
+        for metric in ("tvl", "fees"):
+            spec = ChartSpec.create([metric], ["eth"], "chain", "1y", "1w")
+            SCREENSHOT_CACHE.delete(spec.cache_key)
+            tracker.record(spec)
+        warmer = ChartWarmer(ChartGenerator(render_backend="queue"), tracker, scheduler,
+                             min_score=0, concurrency=2)
+
+        gate = asyncio.Event()
+        user = asyncio.ensure_future(scheduler.run(gate.wait, "user", HIGH))
+        await asyncio.sleep(0)
+        warming = asyncio.ensure_future(warmer.warm_once())
+        await asyncio.sleep(0.05)
+        rendered_while_user_ran = len(queue_client.priority)
+        queued = scheduler.queue_depth()["low"]
+        gate.set()
+        renders = await warming
+        await user
+        return rendered_while_user_ran, queued, renders, warmer.deferred
+
+    rendered_while_user_ran, queued, renders, deferred = asyncio.run(scenario())
+    assert rendered_while_user_ran == 0
+    assert queued == 2  # both warm renders wait in the low lane; neither counts as a user
+    assert (renders, deferred) == (2, 0)
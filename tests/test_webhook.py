@@ -0,0 +1,61 @@
+import json
+import asyncio
+import httpx
+import pytest
+from types import SimpleNamespace
+from tornado.httpserver import HTTPServer
+from tornado.testing import bind_unused_port
+from artemisbot.server.webhook import SECRET_TOKEN_HEADER, build_web_app
+
+SECRET = "s3cret"
+
+UPDATE = {
+    "update_id": 1,
+    "message": {
+        "message_id": 7,
+        "date": 0,
+        "chat": {"id": 42, "type": "private"},
+        "text": "/start",
+    },
+}
+
+
+def post(headers, body=json.dumps(UPDATE)):
+    """POST body to the webhook and return the status code and the queued updates."""
+    async def scenario():
+        bot_app = SimpleNamespace(bot=None, update_queue=asyncio.Queue(), running=True)
+        sock, port = bind_unused_port()
+        server = HTTPServer(build_web_app(bot_app, SECRET, "telegram"))
+        server.add_sockets([sock])
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(f"http://127.0.0.1:{port}/telegram", content=body, headers=headers)
+        finally:
+            server.stop()
+        updates = []
+        while not bot_app.update_queue.empty():
+            updates.append(bot_app.update_queue.get_nowait())
+        return response.status_code, updates
+
+    return asyncio.run(scenario())
+
+
+def test_update_with_the_secret_token_is_queued():
+    status, updates = post({SECRET_TOKEN_HEADER: SECRET})
+    assert status == 200
+    assert [update.update_id for update in updates] == [1]
+    assert updates[0].message.chat.id == 42
+
+
+@pytest.mark.parametrize("headers", [{SECRET_TOKEN_HEADER: "wrong"}, {SECRET_TOKEN_HEADER: ""}, {}],
+                         ids=["wrong", "empty", "missing"])
+def test_update_without_the_secret_token_is_rejected(headers):
+    status, updates = post(headers)
+    assert status == 403
+    assert updates == []
+
+
+def test_malformed_update_is_rejected():
+    status, updates = post({SECRET_TOKEN_HEADER: SECRET}, body="not json")
+    assert status == 400
+    assert updates == []
@@ -1,99 +1,43 @@
 #!/usr/bin/env python3
 """
 Script to fetch asset mappings from the Artemis API and update the artemis_mappings.json file.
-"""
-
-import os
-import json
-from typing import Dict, List
-from dotenv import load_dotenv
-from artemis import Artemis
-
-# Load environment variables
-load_dotenv()
 
-# Configuration
-ARTEMIS_API_KEY = os.getenv("ARTEMIS_API_KEY")
-MAPPINGS_FILE = "config/artemis_mappings.json"
-
-def fetch_assets() -> List[Dict]:
-    """Fetch all assets from the Artemis API."""
-    client = Artemis(api_key=ARTEMIS_API_KEY)
-    response = client.asset.list()
-    
-    if isinstance(response, dict) and 'assets' in response:
-        return response['assets']
-    return []
+Prints what changed (added, removed and retyped assets) and leaves the files
+untouched when nothing did. The mappings and their compiled index are replaced
+atomically, so a running bot never reads a half-written file and picks up the
+new version on its next reload check.
+"""
 
-def build_mappings(assets: List[Dict]) -> Dict:
-    """Build mappings from the assets data."""
-    mappings = {
-        "artemis_id_to_symbols": {},
-        "symbol_to_artemis_id": {},
-        "artemis_id_to_type": {},
-        "symbol_to_type": {}
-    }
-    
-    for asset in assets:
-        if not isinstance(asset, dict):
-            continue
-            
-        artemis_id = asset.get("artemis_id")
-        symbol = asset.get("symbol", "").lower()
-        
-        # Get asset type from metadata.about.asset, default to "application" if not "chain"
-        metadata = asset.get("metadata", {}) or {}
-        about = metadata.get("about", {}) or {}
-        asset_type = "chain" if about.get("asset") == "chain" else "application"
-        
-        if not artemis_id or not symbol:
-            continue
-            
-        # Add to artemis_id_to_symbols
-        mappings["artemis_id_to_symbols"][artemis_id] = [symbol]
-        
-        # Add to symbol_to_artemis_id
-        mappings["symbol_to_artemis_id"][symbol] = artemis_id
-        
-        # Add to artemis_id_to_type
-        mappings["artemis_id_to_type"][artemis_id] = asset_type
-        
-        # Add to symbol_to_type
-        mappings["symbol_to_type"][symbol] = asset_type
-    
-    return mappings
+import sys
+import argparse
+from artemisbot.utils.mappings_refresh import refresh_mappings
+from config import ASSET_MAPPINGS_FILE, ASSET_MAPPINGS_INDEX_FILE
 
-def update_mappings_file(mappings: Dict) -> None:
-    """Update the mappings file with the new data."""
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(MAPPINGS_FILE), exist_ok=True)
-    
-    # Write mappings to file
-    with open(MAPPINGS_FILE, "w") as f:
-        json.dump(mappings, f, indent=2)
 
 def main():
     """Main function to update mappings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=ASSET_MAPPINGS_FILE, help="Mappings file to update")
+    parser.add_argument("--index", default=ASSET_MAPPINGS_INDEX_FILE, help="Compiled index file ('' to skip)")
+    parser.add_argument("--dry-run", action="store_true", help="Show the changes without writing anything")
+    parser.add_argument("--force", action="store_true", help="Rewrite the files even if nothing changed")
+    args = parser.parse_args()
+
     print("Fetching assets from Artemis API...")
     try:
-        assets = fetch_assets()
-        print(f"Found {len(assets)} assets")
-        
-        if assets:
-            print("\nFirst asset example:")
-            print(json.dumps(assets[0], indent=2))
-        
-        print("\nBuilding mappings...")
-        mappings = build_mappings(assets)
-        
-        print("Updating mappings file...")
-        update_mappings_file(mappings)
-        
-        print("Done! Mappings have been updated.")
-        
+        diff = refresh_mappings(args.output, args.index, dry_run=args.dry_run, force=args.force)
     except Exception as e:
         print(f"Error: {str(e)}")
-        raise
+        sys.exit(1)
+
+    print(diff.summary())
+    if args.dry_run:
+        print("Dry run, nothing written.")
+    elif diff.changed or args.force:
+        print("Done! Mappings have been updated.")
+    else:
+        print("Mappings are already up to date.")
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()